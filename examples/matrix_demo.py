@@ -8,6 +8,7 @@ import time
 import argparse
 
 from luma.led_matrix.device import max7219
+from luma.led_matrix.scheduler import scheduler
 from luma.core.interface.serial import spi, noop
 from luma.core.render import canvas
 from luma.core.virtual import viewport
@@ -55,9 +56,9 @@ def demo(n, block_orientation, rotate, inreverse):
         for i, word in enumerate(words):
             text(draw, (0, i * 8), word, fill="white", font=proportional(CP437_FONT))
 
-    for i in range(virtual.height - device.height):
-        virtual.set_position((0, i))
-        time.sleep(0.05)
+    # Each step is shown at a fixed rate, however long it took to draw
+    scheduler(device, fps=20).run(lambda i: virtual.set_position((0, i)),
+                                  frames=virtual.height - device.height)
 
     msg = "Brightness"
     print(msg)
@@ -68,10 +69,8 @@ def demo(n, block_orientation, rotate, inreverse):
         text(draw, (0, 0), "A", fill="white")
 
     time.sleep(1)
-    for _ in range(5):
-        for intensity in range(16):
-            device.contrast(intensity * 16)
-            time.sleep(0.1)
+    scheduler(device, fps=10).run(lambda frame: device.contrast((frame % 16) * 16),
+                                  frames=5 * 16)
 
     device.contrast(0x80)
     time.sleep(1)
@@ -101,10 +100,12 @@ def demo(n, block_orientation, rotate, inreverse):
     show_message(device, msg)
 
     time.sleep(1)
-    for x in range(256):
+
+    def character(x):
         with canvas(device) as draw:
             text(draw, (0, 0), chr(x), fill="white")
-            time.sleep(0.1)
+
+    scheduler(device, fps=10, drop_late=False).run(character, frames=256)
 
 
 if __name__ == "__main__":
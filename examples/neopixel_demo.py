@@ -11,6 +11,7 @@ import time
 import colorsys
 
 from luma.led_matrix.device import neopixel
+from luma.led_matrix.scheduler import scheduler
 from luma.core.render import canvas
 from luma.core.legacy import text, show_message
 from luma.core.legacy.font import proportional, TINY_FONT
@@ -152,31 +153,30 @@ def tunnel(x, y, step):
 def gfx(device):
     effects = [tunnel, rainbow_search, checker, swirl]
 
-    step = 0
-    while True:
-        for i in range(500):
-            with canvas(device) as draw:
-                for y in range(device.height):
-                    for x in range(device.width):
-                        r, g, b = effects[0](x, y, step)
-                        if i > 400:
-                            r2, g2, b2 = effects[-1](x, y, step)
+    def render(step):
+        # Every 500 frames, the last effect moves to the front; frame numbers
+        # keep counting through any dropped frames, so the effects stay in time
+        cycle, i = divmod(step, 500)
+        current = effects[-cycle % len(effects)]
+        following = effects[(-cycle - 1) % len(effects)]
 
-                            ratio = (500.00 - i) / 100.0
-                            r = r * ratio + r2 * (1.0 - ratio)
-                            g = g * ratio + g2 * (1.0 - ratio)
-                            b = b * ratio + b2 * (1.0 - ratio)
-                        r = int(max(0, min(255, r)))
-                        g = int(max(0, min(255, g)))
-                        b = int(max(0, min(255, b)))
-                        draw.point((x, y), (r, g, b))
+        with canvas(device) as draw:
+            for y in range(device.height):
+                for x in range(device.width):
+                    r, g, b = current(x, y, step)
+                    if i > 400:
+                        r2, g2, b2 = following(x, y, step)
 
-            step += 1
+                        ratio = (500.00 - i) / 100.0
+                        r = r * ratio + r2 * (1.0 - ratio)
+                        g = g * ratio + g2 * (1.0 - ratio)
+                        b = b * ratio + b2 * (1.0 - ratio)
+                    r = int(max(0, min(255, r)))
+                    g = int(max(0, min(255, g)))
+                    b = int(max(0, min(255, b)))
+                    draw.point((x, y), (r, g, b))
 
-            time.sleep(0.01)
-
-        effect = effects.pop()
-        effects.insert(0, effect)
+    scheduler(device, fps=100).run(render)
 
 
 def main():
@@ -202,10 +202,8 @@ def main():
 
     time.sleep(4)
 
-    for _ in range(5):
-        for intensity in range(16):
-            device.contrast(intensity * 16)
-            time.sleep(0.1)
+    scheduler(device, fps=10).run(lambda frame: device.contrast((frame % 16) * 16),
+                                  frames=5 * 16)
 
     device.contrast(0x80)
     time.sleep(1)
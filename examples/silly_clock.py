@@ -3,6 +3,7 @@ import time
 from datetime import datetime
 
 from luma.led_matrix.device import max7219
+from luma.led_matrix.scheduler import scheduler
 from luma.core.interface.serial import spi, noop
 from luma.core.render import canvas
 from luma.core.legacy import text, show_message
@@ -14,31 +15,37 @@ def minute_change(device):
     hours = datetime.now().strftime('%H')
     minutes = datetime.now().strftime('%M')
 
-    def helper(current_y):
+    def helper(frame):
+        nonlocal minutes
+        if frame < 8:
+            current_y = 1 + frame
+        else:
+            if frame == 8:
+                minutes = datetime.now().strftime('%M')
+            current_y = 17 - frame
         with canvas(device) as draw:
             text(draw, (0, 1), hours, fill="white", font=proportional(CP437_FONT))
             text(draw, (15, 1), ":", fill="white", font=proportional(TINY_FONT))
             text(draw, (17, current_y), minutes, fill="white", font=proportional(CP437_FONT))
-        time.sleep(0.1)
-    for current_y in range(1, 9):
-        helper(current_y)
-    minutes = datetime.now().strftime('%M')
-    for current_y in range(9, 1, -1):
-        helper(current_y)
+
+    # Minutes scroll down out of sight, then back up with the new value
+    scheduler(device, fps=10, drop_late=False).run(helper, frames=16)
 
 
 def animation(device, from_y, to_y):
     '''Animate the whole thing, moving it into/out of the abyss.'''
     hourstime = datetime.now().strftime('%H')
     mintime = datetime.now().strftime('%M')
-    current_y = from_y
-    while current_y != to_y:
+    step = 1 if to_y > from_y else -1
+
+    def helper(frame):
+        current_y = from_y + frame * step
         with canvas(device) as draw:
             text(draw, (0, current_y), hourstime, fill="white", font=proportional(CP437_FONT))
             text(draw, (15, current_y), ":", fill="white", font=proportional(TINY_FONT))
             text(draw, (17, current_y), mintime, fill="white", font=proportional(CP437_FONT))
-        time.sleep(0.1)
-        current_y += 1 if to_y > from_y else -1
+
+    scheduler(device, fps=10, drop_late=False).run(helper, frames=abs(to_y - from_y))
 
 
 def main():
@@ -50,9 +57,7 @@ def main():
     # The time ascends from the abyss...
     animation(device, 8, 1)
 
-    toggle = False  # Toggle the second indicator every second
-    while True:
-        toggle = not toggle
+    def tick(frame):
         sec = datetime.now().second
         if sec == 59:
             # When we change minutes, animate the minute change
@@ -72,9 +77,13 @@ def main():
             minutes = datetime.now().strftime('%M')
             with canvas(device) as draw:
                 text(draw, (0, 1), hours, fill="white", font=proportional(CP437_FONT))
-                text(draw, (15, 1), ":" if toggle else " ", fill="white", font=proportional(TINY_FONT))
+                text(draw, (15, 1), ":" if frame % 2 == 0 else " ", fill="white", font=proportional(TINY_FONT))
                 text(draw, (17, 1), minutes, fill="white", font=proportional(CP437_FONT))
-            time.sleep(0.5)
+
+    # Ticks are scheduled twice a second on the clock, rather than half a
+    # second after the last one finished; any missed during the longer
+    # animations are skipped
+    scheduler(device, fps=2).run(tick)
 
 
 if __name__ == "__main__":
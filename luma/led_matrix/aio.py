@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Awaitable variants of the blocking device operations, for driving the devices
+in :py:mod:`luma.led_matrix.device` from an :py:mod:`asyncio` event loop::
+
+    async def ticker(device, fps):
+        async for frame in pacer(fps):
+            await device.display_async(render(frame))
+
+    async def main():
+        await asyncio.gather(ticker(matrix, 25), ticker(strip, 60))
+
+The encoding and bus I/O run in the event loop's default executor, so the loop
+is never blocked while a frame is sent. Each device only performs one such
+operation at a time: concurrent calls on the same device wait their turn,
+rather than piling up writes to the same chain.
+
+.. versionadded:: 1.10.0
+"""
+
+import asyncio
+from functools import partial
+
+from luma.led_matrix.scheduler import deadlines
+
+
+__all__ = ["awaitable", "pacer"]
+
+
+class awaitable(object):
+    """
+    Mixin providing ``*_async`` variants of ``display()``, ``contrast()``,
+    ``show()`` and ``hide()``.
+    """
+    _async_lock = None
+    _async_loop = None
+
+    async def _run_async(self, method, *args):
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_loop = loop
+
+        async with self._async_lock:
+            return await loop.run_in_executor(None, partial(method, *args))
+
+    async def display_async(self, image):
+        """
+        Displays an image, as per ``display()``, without blocking the event
+        loop. The image must not be changed until the call has completed.
+
+        :param image: The image to display.
+        :type image: PIL.Image.Image
+        """
+        await self._run_async(self.display, image)
+
+    async def contrast_async(self, value):
+        """
+        Sets the contrast, as per ``contrast()``, without blocking the event
+        loop.
+
+        :param value: Desired contrast level in the range of 0-255.
+        :type value: int
+        """
+        await self._run_async(self.contrast, value)
+
+    async def show_async(self):
+        """
+        Switches the display on, as per ``show()``, without blocking the event
+        loop.
+        """
+        await self._run_async(self.show)
+
+    async def hide_async(self):
+        """
+        Switches the display off, as per ``hide()``, without blocking the event
+        loop.
+        """
+        await self._run_async(self.hide)
+
+
+class pacer(object):
+    """
+    Asynchronous iterator which paces a loop at a steady frame rate, yielding
+    the number of each frame when it is due. Frames are scheduled from the
+    first, so the rate does not drift; if the loop falls more than a whole
+    frame behind, the frames it missed are skipped (and counted in
+    ``missed``) rather than being rushed through to catch up.
+
+    Every display can be driven by its own pacer, at its own rate, from the
+    same event loop.
+
+    :param fps: The frame rate, in frames per second.
+    :type fps: float
+    :param frames: The number of frames after which to stop (including any
+        missed); by default, the iterator never stops.
+    :type frames: int
+    """
+    def __init__(self, fps, frames=None):
+        assert fps > 0
+        self.interval = 1.0 / fps
+        self.frames = frames
+        self.missed = 0
+        self._deadlines = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        frame = await self.wait()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+    async def wait(self):
+        """
+        Waits until the next frame is due.
+
+        :returns: The number of the frame (counting from 0), or ``None`` once
+            ``frames`` have been paced.
+        :rtype: int
+        """
+        pace = self._deadlines
+        if pace is None:
+            pace = self._deadlines = deadlines(asyncio.get_running_loop().time)
+
+        while self.frames is None or pace.frame < self.frames:
+            delay = pace.delay(self.interval)
+            if delay is None:
+                self.missed += 1
+                continue
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+            frame = pace.frame
+            pace.advance(self.interval)
+            return frame
+        return None
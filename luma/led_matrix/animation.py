@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Pre-encoded animations: a sequence of frames is encoded into a device's
+wire-ready form once, up front, and can be saved to a compact file. Playing
+it back then sends each frame straight to the device's serial interface (or
+ws281x LED buffer) on schedule, without drawing or encoding anything::
+
+    from luma.led_matrix.animation import compile_animation, animation, player
+
+    compile_animation(device, frames, frame_duration=0.05).save("loop.anim")
+    ...
+    with animation.load("loop.anim") as anim:
+        player(device, anim, loops=0).play()
+
+The encoded frames depend on the device's geometry, rotation and mapping, and
+(for the APA102 and Unicorn HAT HD) on its brightness at the time they are
+compiled. Identical frames are only stored once.
+
+.. versionadded:: 1.10.0
+"""
+
+import mmap
+import struct
+from time import perf_counter, sleep
+
+from luma.led_matrix.device import ws2812
+from luma.led_matrix.scheduler import deadlines
+
+
+__all__ = ["compile_animation", "animation", "player"]
+
+
+_MAGIC = b"LUMAANIM"
+_VERSION = 1
+
+# magic, version, device class name, width, height, frame size (bytes),
+# number of frames, number of distinct frames
+_HEADER = struct.Struct("<8sH16sHHIII")
+
+# index of the distinct frame, duration in microseconds
+_ENTRY = struct.Struct("<II")
+
+
+def _wire_frame(device, image):
+    """
+    Encodes an image into the bytes the device's ``_transmit()`` takes; for
+    a WS2812 these are the colors in physical (strip) order. The device's
+    ``_encode_image()`` is used rather than ``_encode()``, so that compiling
+    leaves no trace on the device: its last displayed image, frame cache and
+    instrumentation are untouched.
+    """
+    assert image.mode == device.mode
+    assert image.size == device.size
+
+    data = device._encode_image(image)
+    if isinstance(device, ws2812):
+        data = device._physical(data)
+    return bytes(data)
+
+
+def compile_animation(device, frames, frame_duration=0.04):
+    """
+    Encodes a sequence of frames for the device.
+
+    :param device: The device the animation is to be played on.
+    :param frames: The frames, each either a :py:mod:`PIL.Image` (suitable for
+        the device's ``display()``), or an ``(image, duration)`` tuple.
+    :param frame_duration: The duration (in seconds) of any frames which are
+        not given their own.
+    :type frame_duration: float
+    :rtype: animation
+    """
+    payloads = []
+    index = {}
+    entries = []
+
+    for frame in frames:
+        if isinstance(frame, tuple):
+            image, duration = frame
+        else:
+            image, duration = frame, frame_duration
+
+        payload = _wire_frame(device, image)
+        if payload not in index:
+            index[payload] = len(payloads)
+            payloads.append(payload)
+        entries.append((index[payload], int(round(duration * 1e6))))
+
+    return animation(type(device).__name__, device.width, device.height,
+                     entries, payloads)
+
+
+class animation(object):
+    """
+    A sequence of encoded frames, with the duration of each, as produced by
+    :py:func:`compile_animation` or read from a file with :py:meth:`load`.
+
+    :param device: Class name of the device it was encoded for.
+    :type device: str
+    :param width: Width of that device.
+    :type width: int
+    :param height: Height of that device.
+    :type height: int
+    :param entries: For every frame, the index of its encoded data in
+        ``payloads`` and its duration in microseconds.
+    :type entries: list[tuple]
+    :param payloads: The distinct encoded frames, all the same size.
+    """
+    def __init__(self, device, width, height, entries, payloads):
+        self.device = device
+        self.width = width
+        self.height = height
+        self.entries = entries
+        self._payloads = payloads
+        self._distinct = len(payloads)
+        self._mmap = None
+        sizes = set(len(payload) for payload in payloads)
+        if len(sizes) > 1:
+            raise ValueError("Encoded frames differ in size")
+        self.frame_size = sizes.pop() if sizes else 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    @property
+    def duration(self):
+        """
+        The total duration of the animation, in seconds.
+        """
+        return sum(duration for _, duration in self.entries) / 1e6
+
+    def payload(self, index):
+        """
+        The encoded data of the distinct frame at ``index``.
+
+        :rtype: bytes
+        """
+        if self._mmap is not None:
+            start = self._offset + index * self.frame_size
+            return self._mmap[start:start + self.frame_size]
+        return self._payloads[index]
+
+    def frames(self):
+        """
+        Iterates through the ``(encoded data, duration in seconds)`` of every
+        frame.
+        """
+        for index, duration in self.entries:
+            yield self.payload(index), duration / 1e6
+
+    def save(self, path):
+        """
+        Writes the animation to a file.
+
+        :param path: The file to write.
+        """
+        with open(path, "wb") as fp:
+            fp.write(_HEADER.pack(_MAGIC, _VERSION, self.device.encode("ascii"),
+                                  self.width, self.height, self.frame_size,
+                                  len(self.entries), self._distinct))
+            for entry in self.entries:
+                fp.write(_ENTRY.pack(*entry))
+            for index in range(self._distinct):
+                fp.write(self.payload(index))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Opens an animation written by :py:meth:`save`. The file is memory
+        mapped, so frames are only read in as they are played; call
+        :py:meth:`close` (or use the animation as a context manager) when done.
+
+        :param path: The file to read.
+        :rtype: animation
+        :raises ValueError: If the file is not a valid animation.
+        """
+        with open(path, "rb") as fp:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(mapped) < _HEADER.size:
+                raise ValueError(f"Not an animation file: {path}")
+            magic, version, device, width, height, frame_size, count, distinct = \
+                _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"Not an animation file: {path}")
+
+            offset = _HEADER.size + count * _ENTRY.size
+            if len(mapped) != offset + distinct * frame_size:
+                raise ValueError(f"Truncated animation file: {path}")
+
+            entries = list(_ENTRY.iter_unpack(mapped[_HEADER.size:offset]))
+            if any(index >= distinct for index, _ in entries):
+                raise ValueError(f"Corrupt animation file: {path}")
+        except ValueError:
+            mapped.close()
+            raise
+
+        anim = cls(device.rstrip(b"\0").decode("ascii"), width, height, entries, [])
+        anim.frame_size = frame_size
+        anim._distinct = distinct
+        anim._offset = offset
+        anim._mmap = mapped
+        return anim
+
+    def close(self):
+        """
+        Releases the memory-mapped file (if any).
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._distinct = 0
+            self.entries = []
+
+
+class player(object):
+    """
+    Plays an animation on a device, sending each encoded frame straight to
+    the device on schedule.
+
+    :param device: The device to play on: it must be configured in the same
+        way as the device the animation was compiled for.
+    :param anim: The animation to play.
+    :type anim: animation
+    :param loops: The number of times to play the animation through, or ``0``
+        to loop until :py:meth:`stop` is called.
+    :type loops: int
+    :param drop_late: If ``True``, frames whose time has completely passed by
+        the time they are due to be sent are skipped, so that playback catches
+        up after a delay rather than running behind schedule.
+    :type drop_late: bool
+    """
+    def __init__(self, device, anim, loops=1, drop_late=True):
+        if type(device).__name__ != anim.device or \
+                (device.width, device.height) != (anim.width, anim.height):
+            raise ValueError(
+                f"Animation was compiled for a {anim.width} x {anim.height} {anim.device}")
+        self.device = device
+        self.animation = anim
+        self.loops = loops
+        self.drop_late = drop_late
+        self.frames_played = 0
+        self.frames_dropped = 0
+        self._stopped = False
+
+    def stop(self):
+        """
+        Stops playback (e.g. from another thread) before the next frame.
+        """
+        self._stopped = True
+
+    def play(self):
+        """
+        Plays the animation, returning when it has finished (or been stopped).
+        """
+        self._stopped = False
+        anim = self.animation
+        if not anim.entries:
+            return
+
+        transmit = self.device._submit
+        pace = deadlines(perf_counter, self.drop_late)
+        loop = 0
+
+        while not self._stopped and (self.loops == 0 or loop < self.loops):
+            loop += 1
+            for index, duration in anim.entries:
+                if self._stopped:
+                    break
+
+                duration /= 1e6
+                delay = pace.delay(duration)
+                if delay is None:
+                    self.frames_dropped += 1
+                    continue
+
+                if delay > 0:
+                    sleep(delay)
+                transmit(anim.payload(index))
+                self.frames_played += 1
+                pace.advance(duration)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Optional background transmission for the devices in
+:py:mod:`luma.led_matrix.device`. Once switched on with
+:py:meth:`transmitter.background`, ``display()`` only encodes the image in the
+calling thread, and hands the encoded frame to a dedicated writer thread which
+sends it to the hardware. The hand-over is a single-slot mailbox: if a new
+frame arrives before the writer has picked up the previous one, the previous
+one is dropped (and counted), so the caller never waits for the bus and the
+display always catches up with the latest frame.
+
+.. versionadded:: 1.10.0
+"""
+
+import threading
+
+
+__all__ = ["transmitter"]
+
+
+class _writer(object):
+    """
+    The writer thread, and the single-slot mailbox it takes frames from.
+    """
+    def __init__(self, device):
+        self.device = device
+        self.lock = threading.RLock()
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"{type(device).__name__}-writer", daemon=True)
+        self._thread.start()
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def post(self, frame, recorder=None, encode=0.0):
+        # When the device is instrumented, the time spent encoding the frame
+        # travels with it, so that it is recorded against the right frame, even
+        # if the frame is dropped.
+        with self._cond:
+            self._raise_error()
+            dropped, self._pending = self._pending, (frame, recorder, encode)
+            if dropped is not None:
+                self.device.frames_dropped += 1
+            self._cond.notify_all()
+
+        if dropped is not None and dropped[1] is not None:
+            dropped[1].dropped(dropped[2])
+
+    def _run(self):
+        device = self.device
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                (frame, recorder, encode), self._pending = self._pending, None
+                self._busy = True
+
+            try:
+                if recorder is not None:
+                    recorder.encoded(encode)
+                with self.lock:
+                    device._transmit(*frame)
+                device.frames_transmitted += 1
+            except Exception as error:
+                self._error = error
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        with self._cond:
+            done = self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout)
+            self._raise_error()
+            return done
+
+    def close(self, timeout=None):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        with self._cond:
+            self._raise_error()
+        return not self._thread.is_alive()
+
+
+class transmitter(object):
+    """
+    Mixin for devices whose ``display()`` encodes a frame and passes it to
+    ``_submit()``, which either transmits it directly, or (in background mode)
+    posts it to the writer thread.
+    """
+    _writer = None
+    frames_dropped = 0
+    frames_transmitted = 0
+
+    def background(self, enabled=True):
+        """
+        Switches background transmission on or off. Switching it off sends
+        any pending frame, and stops the writer thread.
+
+        While it is on, the device's control operations (``contrast()``,
+        ``show()``, ``hide()`` and ``cleanup()``) first wait for any pending
+        frame to be sent, and never overlap with the writer's transmissions.
+        The ``frames_dropped`` counter records the frames that were replaced
+        in the mailbox by newer ones before being sent, and
+        ``frames_transmitted`` those which were sent.
+
+        :param enabled: Whether to transmit in the background.
+        :type enabled: bool
+        """
+        if not enabled:
+            self.close()
+        elif self._writer is None:
+            writer = self._writer = _writer(self)
+            for name in ["contrast", "show", "hide"]:
+                setattr(self, name, _exclusive(writer, getattr(self, name)))
+
+            cleanup = self.cleanup
+
+            def close_then_cleanup():
+                self.close()
+                cleanup()
+            self.cleanup = close_then_cleanup
+
+    def _submit(self, *frame):
+        writer = self._writer
+        if writer is None:
+            return self._transmit(*frame)
+
+        recorder = getattr(self, "_recording", None)
+        encode = recorder.take_encoding() if recorder is not None else 0.0
+
+        # Encoders may reuse their buffers for the next frame
+        writer.post(tuple(bytes(data) if isinstance(data, (bytearray, memoryview)) else data
+                          for data in frame), recorder, encode)
+
+    def flush(self, timeout=None):
+        """
+        Waits until the pending frame (if any) has been transmitted. Any error
+        raised by the writer thread while transmitting is re-raised here (or
+        else from the next ``display()``).
+
+        :param timeout: The longest to wait, in seconds; by default, there is
+            no limit.
+        :type timeout: float
+        :returns: ``True`` if everything was transmitted, ``False`` if the
+            timeout elapsed first.
+        :rtype: bool
+        """
+        writer = self._writer
+        return True if writer is None else writer.flush(timeout)
+
+    def close(self, timeout=None):
+        """
+        Transmits any pending frame, then stops the writer thread: subsequent
+        frames are transmitted directly, as before background transmission was
+        switched on.
+
+        :param timeout: The longest to wait for the writer thread to finish, in
+            seconds; by default, there is no limit.
+        :type timeout: float
+        :returns: ``True`` if the writer thread has finished.
+        :rtype: bool
+        """
+        writer = self._writer
+        if writer is None:
+            return True
+
+        self._writer = None
+        for name in ["contrast", "show", "hide", "cleanup"]:
+            self.__dict__.pop(name, None)
+        return writer.close(timeout)
+
+
+def _exclusive(writer, method):
+    """
+    Wraps a control operation, so that it waits for any pending frame to be
+    transmitted, and holds off the writer thread while it runs.
+    """
+    def exclusive(*args, **kwargs):
+        writer.flush()
+        with writer.lock:
+            return method(*args, **kwargs)
+    return exclusive
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Benchmarks for the display paths of every device in
+:py:mod:`luma.led_matrix.device`, run against in-process stand-ins for the
+serial and ws281x interfaces (so no hardware is needed). Run it with::
+
+    $ python -m luma.led_matrix.bench > results.json
+
+For each case, the frames per second, mean time per frame, bytes sent per
+frame, the time those bytes would take on the bus (as modelled by the
+:py:mod:`luma.led_matrix.recording` interfaces, at their default speeds) and
+the memory allocated per frame are reported as JSON, so that the
+results of different releases (or machines) can be compared. Use ``--list``
+to see the available cases, and ``--filter`` to run a subset of them. The
+``frameserver`` cases measure the throughput of frames published through a
+:py:mod:`luma.led_matrix.ringbuffer` and displayed by a
+:py:mod:`luma.led_matrix.frameserver`.
+
+.. versionadded:: 1.10.0
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from PIL import Image
+
+import luma.led_matrix
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, \
+    neosegment, UNICORN_HAT
+from luma.led_matrix.frameserver import frameserver
+from luma.led_matrix.recording import serial, ws281x
+from luma.led_matrix.ringbuffer import ringbuffer
+from luma.led_matrix.virtual import sevensegment
+
+
+__all__ = ["case", "cases", "run", "main"]
+
+
+class case(object):
+    """
+    A single benchmark: a named device configuration, and the frames that are
+    displayed on it.
+
+    :param name: Unique name of the case.
+    :type name: str
+    :param factory: Called with the stand-in interface, returns the device.
+    :param frames: Called with the device, returns a list of frames.
+    :param show: Called with the device and a frame, to display it.
+    :param ws281x: If ``True``, a stand-in ws281x interface is supplied to the
+        factory rather than a stand-in serial interface.
+    :type ws281x: bool
+    :param teardown: Optionally called with the device once the case has run,
+        to release any resources it holds.
+    :param params: Description of the configuration, included in the results.
+    :type params: dict
+    """
+    def __init__(self, name, factory, frames, show, ws281x=False, teardown=None, **params):
+        self.name = name
+        self.factory = factory
+        self.frames = frames
+        self.show = show
+        self.ws281x = ws281x
+        self.teardown = teardown
+        self.params = params
+
+    def interface(self):
+        if self.ws281x:
+            return ws281x(led_buffer=self.params.get("led_buffer", True), record=False)
+        return serial(record=False)
+
+
+def _noise(mode, size, count=8, seed=0x7219):
+    rnd = random.Random(seed)
+    if mode == "1":
+        # One bit per pixel, with each row padded to a whole byte
+        length = (size[0] + 7) // 8 * size[1]
+    else:
+        length = size[0] * size[1] * len(mode)
+
+    return [Image.frombytes(mode, size, bytes(rnd.getrandbits(8) for _ in range(length)))
+            for _ in range(count)]
+
+
+def _images(opaque=True, static=False):
+    def frames(device):
+        images = _noise(device.mode, device.size, count=1 if static else 8)
+        if device.mode == "RGBA" and opaque:
+            for image in images:
+                image.putalpha(255)
+        return images
+    return frames
+
+
+def _texts(device):
+    return ["{0:0{1}d}".format(n * 7919, device.width)[-device.width:] for n in range(8)]
+
+
+def _display(device, image):
+    device.display(image)
+
+
+def _set_text(target, text):
+    target.text = text
+
+
+def _neosegment(ws, width):
+    mapping = [(i % width) * 7 + (i // width) for i in range(width * 7)]
+    neoseg = neosegment(width=width, device=ws2812(ws, width=width, height=7, mapping=mapping))
+    neoseg.color = ["red", "green", "blue", "yellow", "cyan", "magenta"] * (width // 6) + ["white"] * (width % 6)
+    return neoseg
+
+
+def _max7219_segments(serial, cascaded):
+    return sevensegment(max7219(serial, cascaded=cascaded))
+
+
+class _ring(object):
+    """
+    A frame server for a device, and a producer attached to its ring buffer.
+    """
+    def __init__(self, device):
+        self.device = device
+        self.server = frameserver(device)
+        self.producer = ringbuffer(self.server.name)
+
+    def close(self):
+        self.producer.close()
+        self.server.close()
+
+
+def _raw_frames(opaque=True):
+    images = _images(opaque)
+
+    def frames(ring):
+        return [image.tobytes() for image in images(ring.device)]
+    return frames
+
+
+def _publish(ring, data):
+    ring.producer.publish(data)
+    ring.server.poll()
+
+
+def _close(ring):
+    ring.close()
+
+
+def cases():
+    """
+    Lists the standard benchmark cases, covering different geometries,
+    rotations, block orientations and mappings of every device.
+
+    :rtype: list[case]
+    """
+    result = []
+
+    for cascaded in [4, 16]:
+        for orientation in [0, 90, -90, 180]:
+            result.append(case(
+                f"max7219/cascaded={cascaded}/block_orientation={orientation}",
+                lambda serial, c=cascaded, o=orientation: max7219(serial, cascaded=c, block_orientation=o),
+                _images(), _display,
+                device="max7219", cascaded=cascaded, block_orientation=orientation))
+
+    result += [
+        case("max7219/cascaded=16/rotate=1/reversed",
+             lambda serial: max7219(serial, cascaded=16, rotate=1, block_orientation=90, blocks_arranged_in_reverse_order=True),
+             _images(), _display,
+             device="max7219", cascaded=16, rotate=1, block_orientation=90, blocks_arranged_in_reverse_order=True),
+        case("max7219/width=32/height=16",
+             lambda serial: max7219(serial, width=32, height=16),
+             _images(), _display,
+             device="max7219", width=32, height=16),
+        case("max7219/cascaded=16/delta_update/static",
+             lambda serial: max7219(serial, cascaded=16, delta_update=True),
+             _images(static=True), _display,
+             device="max7219", cascaded=16, delta_update=True, static=True),
+        case("max7219/cascaded=16/frame_cache",
+             lambda serial: max7219(serial, cascaded=16, frame_cache=1 << 16),
+             _images(), _display,
+             device="max7219", cascaded=16, frame_cache=1 << 16),
+        case("max7219/sevensegment/cascaded=2",
+             lambda serial: _max7219_segments(serial, 2),
+             lambda segments: _texts(segments.device), _set_text,
+             device="max7219", cascaded=2, sevensegment=True),
+    ]
+
+    for led_buffer in [True, False]:
+        for (width, height), mapping, name in [
+                ((8, 4), None, "identity"),
+                ((8, 8), UNICORN_HAT, "unicorn_hat"),
+                ((32, 32), list(reversed(range(1024))), "reversed")]:
+            result.append(case(
+                f"ws2812/{width}x{height}/mapping={name}/led_buffer={led_buffer}",
+                lambda ws, w=width, h=height, m=mapping: ws2812(ws, width=w, height=h, mapping=m),
+                _images(), _display, ws281x=True,
+                device="ws2812", width=width, height=height, mapping=name, led_buffer=led_buffer))
+
+    result += [
+        case("ws2812/16x16/rotate=1",
+             lambda ws: ws2812(ws, width=16, height=16, rotate=1),
+             _images(), _display, ws281x=True,
+             device="ws2812", width=16, height=16, rotate=1),
+        case("ws2812/16x16/delta_update/static",
+             lambda ws: ws2812(ws, width=16, height=16, delta_update=True),
+             _images(static=True), _display, ws281x=True,
+             device="ws2812", width=16, height=16, delta_update=True, static=True),
+    ]
+
+    for cascaded, mapping, name in [
+            (60, None, "identity"),
+            (600, None, "identity"),
+            (600, list(reversed(range(600))), "reversed")]:
+        result.append(case(
+            f"apa102/cascaded={cascaded}/mapping={name}",
+            lambda serial, c=cascaded, m=mapping: apa102(serial, cascaded=c, mapping=m),
+            _images(), _display,
+            device="apa102", cascaded=cascaded, mapping=name))
+
+    result.append(case(
+        "apa102/16x16/rotate=2/translucent",
+        lambda serial: apa102(serial, width=16, height=16, rotate=2),
+        _images(opaque=False), _display,
+        device="apa102", width=16, height=16, rotate=2, opaque=False))
+
+    for rotate in [0, 1]:
+        for opaque in [True, False]:
+            result.append(case(
+                f"unicornhathd/rotate={rotate}/{'opaque' if opaque else 'translucent'}",
+                lambda serial, r=rotate: unicornhathd(serial, rotate=r),
+                _images(opaque=opaque), _display,
+                device="unicornhathd", rotate=rotate, opaque=opaque))
+
+    result.append(case(
+        "unicornhathd/rotate=0/translucent/frame_cache",
+        lambda serial: unicornhathd(serial, frame_cache=1 << 16),
+        _images(opaque=False), _display,
+        device="unicornhathd", rotate=0, opaque=False, frame_cache=1 << 16))
+
+    for width in [6, 12]:
+        result.append(case(
+            f"neosegment/width={width}",
+            lambda ws, w=width: _neosegment(ws, w),
+            lambda neoseg: _texts(neoseg.device), _set_text, ws281x=True,
+            device="neosegment", width=width))
+
+    # Frames published by a producer through a ring buffer, and displayed by
+    # a frame server
+    result += [
+        case("max7219/cascaded=16/frameserver",
+             lambda serial: _ring(max7219(serial, cascaded=16)),
+             _raw_frames(), _publish, teardown=_close,
+             device="max7219", cascaded=16, frameserver=True),
+        case("ws2812/16x16/frameserver",
+             lambda ws: _ring(ws2812(ws, width=16, height=16)),
+             _raw_frames(), _publish, ws281x=True, teardown=_close,
+             device="ws2812", width=16, height=16, frameserver=True),
+        case("apa102/cascaded=600/frameserver",
+             lambda serial: _ring(apa102(serial, cascaded=600)),
+             _raw_frames(), _publish, teardown=_close,
+             device="apa102", cascaded=600, frameserver=True),
+        case("unicornhathd/rotate=0/translucent/frameserver",
+             lambda serial: _ring(unicornhathd(serial)),
+             _raw_frames(opaque=False), _publish, teardown=_close,
+             device="unicornhathd", rotate=0, opaque=False, frameserver=True),
+    ]
+
+    return result
+
+
+def _measure(bench, frames, warmup=10):
+    interface = bench.interface()
+    target = bench.factory(interface)
+    try:
+        return _time(bench, interface, target, frames, warmup)
+    finally:
+        if bench.teardown is not None:
+            bench.teardown(target)
+
+
+def _time(bench, interface, target, frames, warmup):
+    inputs = bench.frames(target)
+    show = bench.show
+
+    for i in range(warmup):
+        show(target, inputs[i % len(inputs)])
+
+    interface.clear()
+    start = time.perf_counter()
+    for i in range(frames):
+        show(target, inputs[i % len(inputs)])
+    elapsed = time.perf_counter() - start
+    sent = interface.bytes_sent
+    bus_time = interface.transfer_time
+
+    # Memory allocated whilst displaying a frame (peak), and not released
+    # afterwards (retained), averaged over a smaller number of frames
+    samples = max(1, min(frames, 50))
+    peak = retained = 0
+    tracemalloc.start()
+    try:
+        for i in range(samples):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            show(target, inputs[i % len(inputs)])
+            current, highest = tracemalloc.get_traced_memory()
+            peak += highest - before
+            retained += current - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": bench.name,
+        "params": bench.params,
+        "frames": frames,
+        "fps": round(frames / elapsed, 1) if elapsed else None,
+        "mean_us": round(elapsed / frames * 1e6, 2),
+        "bytes_per_frame": round(sent / frames, 1),
+        "bus_us_per_frame": round(bus_time / frames * 1e6, 2),
+        "alloc_peak_bytes_per_frame": round(peak / samples, 1),
+        "alloc_retained_bytes_per_frame": round(retained / samples, 1),
+    }
+
+
+def run(benchmarks=None, frames=200):
+    """
+    Runs the benchmarks, returning the results as a JSON-serializable dict.
+
+    :param benchmarks: The cases to run; if not supplied, all the standard
+        :py:func:`cases` are run.
+    :type benchmarks: list[case]
+    :param frames: The number of frames to display for each case.
+    :type frames: int
+    :rtype: dict
+    """
+    if benchmarks is None:
+        benchmarks = cases()
+
+    return {
+        "version": luma.led_matrix.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": [_measure(bench, frames) for bench in benchmarks]
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m luma.led_matrix.bench",
+        description="Benchmarks the display paths of the luma.led_matrix devices.")
+    parser.add_argument("--frames", type=int, default=200,
+                        help="number of frames to display per case (default: %(default)s)")
+    parser.add_argument("--filter", action="append", default=[], metavar="TEXT",
+                        help="only run cases whose name contains TEXT (may be repeated)")
+    parser.add_argument("--output", metavar="FILE",
+                        help="write the results to FILE, rather than stdout")
+    parser.add_argument("--list", action="store_true",
+                        help="list the case names, and exit")
+    args = parser.parse_args(argv)
+
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+
+    selected = [bench for bench in cases()
+                if not args.filter or any(text in bench.name for text in args.filter)]
+
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+
+    if not selected:
+        parser.error("no cases match the filter")
+
+    results = json.dumps(run(selected, frames=args.frames), indent=2)
+    if args.output:
+        with open(args.output, "w") as fp:
+            fp.write(results + "\n")
+    else:
+        print(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Bounded cache of encoded frames, for devices which are shown the same images
+over and over again (clocks, blinking separators, status icons, looping
+tickers and so on).
+
+.. versionadded:: 1.10.0
+"""
+
+from collections import OrderedDict
+
+
+__all__ = ["encoded_frame_cache"]
+
+
+# Approximate bookkeeping cost of an entry, over and above its key and value
+_ENTRY_OVERHEAD = 128
+
+
+class encoded_frame_cache(object):
+    """
+    Least-recently-used cache of encoded frames, limited by the number of
+    bytes held (the raw image data used as the key, plus the encoded frame)
+    rather than by the number of entries.
+
+    :param max_bytes: The most bytes the cache may hold.
+    :type max_bytes: int
+    """
+    def __init__(self, max_bytes):
+        assert max_bytes > 0
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.clear()
+
+    def clear(self):
+        """
+        Empties the cache, and resets the statistics.
+        """
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Looks up an encoded frame, marking it as recently used.
+
+        :returns: The encoded frame, or ``None`` if it is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, size):
+        """
+        Adds an encoded frame, evicting the least recently used frames to
+        make room for it if necessary. A frame too big to ever fit is not
+        cached at all.
+
+        :param key: The key to store the frame under.
+        :param value: The encoded frame.
+        :param size: The size (in bytes) of the key and frame together.
+        :type size: int
+        """
+        size += _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[1]
+
+        while self.bytes + size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+
+        self._entries[key] = (value, size)
+        self.bytes += size
+
+    def stats(self):
+        """
+        Reports how effective the cache has been, for sizing it.
+
+        :returns: The number of ``hits``, ``misses`` and ``evictions``, the
+            ``hit_rate`` (0-1), and the ``entries`` and ``bytes`` currently held
+            (of ``max_bytes``).
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes
+        }
@@ -32,21 +32,179 @@ Collection of serial interfaces to LED matrix devices.
 # As before, as soon as the with block completes, the canvas buffer is flushed
 # to the device
 
+import ctypes
+import sys
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, zip_longest
 from math import ceil
+from operator import itemgetter
+
+from PIL import Image, ImageColor
+
 import luma.core.error
 import luma.led_matrix.const
 from luma.core.interface.serial import noop
 from luma.core.device import device
-from luma.core.render import canvas
 from luma.core.util import observable
 from luma.core.virtual import sevensegment
-from luma.led_matrix.segment_mapper import dot_muncher, regular
+from luma.led_matrix.aio import awaitable
+from luma.led_matrix.background import transmitter
+from luma.led_matrix.cache import encoded_frame_cache
+from luma.led_matrix.instrumentation import instrumented
+from luma.led_matrix.segment_mapper import dot_muncher, regular_bytes, remap_table
 
 
 __all__ = ["max7219", "ws2812", "neopixel", "neosegment", "apa102", "unicornhathd"]
 
 
-class max7219(device):
+# Array type code for the 32-bit words used by the WS281x LED buffer, and the
+# raw mode which packs an RGB image into native-endian 0x00RRGGBB words
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+_RGB_WORDS = "BGRX" if sys.byteorder == "little" else "XRGB"
+
+# Bit-reversal of every byte value
+_REVERSED = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+def _rows(image):
+    return image.tobytes()
+
+
+def _rows_reversed(image):
+    return image.tobytes().translate(_REVERSED)
+
+
+def _columns(image):
+    return image.transpose(Image.Transpose.ROTATE_270).tobytes()
+
+
+def _columns_reversed(image):
+    return _columns(image).translate(_REVERSED)
+
+
+def _unrotate(device, x, y):
+    """
+    Traces the pixel at ``(x, y)`` of an image rotated by the device's
+    :py:func:`~luma.core.mixin.capabilities.preprocess` back to the position
+    it came from in the unrotated image.
+    """
+    if device.rotate == 1:
+        x, y = y, device.height - 1 - x
+    elif device.rotate == 2:
+        x, y = device.width - 1 - x, device.height - 1 - y
+    elif device.rotate == 3:
+        x, y = device.width - 1 - y, x
+    return x, y
+
+
+@lru_cache(maxsize=None)
+def _scaling_table():
+    """
+    Every channel value ``c``, scaled by every brightness ``b`` (both 0-255),
+    truncated to an int: the value for ``(b, c)`` is at index ``b * 256 + c``.
+    """
+    return bytes(int(c * (b / 255.0)) for b in range(256) for c in range(256))
+
+
+def _permutation(mapping):
+    """
+    Inverts a pixel ``mapping``, returning an :py:func:`operator.itemgetter`
+    which picks out the pixels of a frame in physical order. Returns ``None``
+    if the mapping is the identity, or if it is not a permutation (and so
+    cannot be expressed as a gather).
+    """
+    n = len(mapping)
+    if sorted(mapping) != list(range(n)) or mapping == list(range(n)):
+        return None
+
+    inverse = [0] * n
+    for idx, pos in enumerate(mapping):
+        inverse[pos] = idx
+    return itemgetter(*inverse)
+
+
+def _address_of(ptr):
+    """
+    Returns the memory address held by ``ptr`` if it is a SWIG pointer, a
+    ctypes pointer or address, or a plain ``int``; otherwise (or for a null
+    pointer) returns ``None``.
+    """
+    if type(ptr) is int:
+        address = ptr
+    elif type(ptr).__name__ == "SwigPyObject":
+        address = int(ptr)
+    elif isinstance(ptr, ctypes.c_void_p):
+        address = ptr.value
+    elif isinstance(ptr, ctypes._Pointer):
+        address = ctypes.cast(ptr, ctypes.c_void_p).value
+    else:
+        return None
+    return address or None
+
+
+class _buffer_protocol(object):
+    """
+    Mixin for devices which pass their frame buffers (``bytes``, ``bytearray``
+    or ``memoryview`` objects) straight through to the serial interface,
+    rather than first turning them into a list of ints. If the serial interface
+    rejects a buffer with a :py:exc:`TypeError`, it is sent lists instead from
+    then on.
+    """
+    _accepts_buffers = True
+
+    def data(self, data):
+        """
+        Sends a sequence of data bytes through to the delegated serial
+        interface.
+
+        :param data: A data sequence.
+        :type data: list, bytes, bytearray, memoryview
+        """
+        if self._accepts_buffers:
+            try:
+                return self._serial_interface.data(data)
+            except TypeError:
+                if isinstance(data, list):
+                    raise
+                self._accepts_buffers = False
+
+        self._serial_interface.data(list(data))
+
+
+class _frame_caching(object):
+    """
+    Mixin for devices with an optional :py:class:`~luma.led_matrix.cache.encoded_frame_cache`
+    in front of their encoder: frames are looked up by the raw image data and
+    the device's current brightness (where that is part of the encoded frame).
+    The rotation, orientation and mapping of a device are fixed, so they need
+    not be part of the key.
+    """
+    frame_cache = None
+    _brightness = None
+
+    def _init_frame_cache(self, max_bytes):
+        self.frame_cache = encoded_frame_cache(max_bytes) if max_bytes else None
+
+    def _encode(self, image):
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        cache = self.frame_cache
+        if cache is None:
+            return self._encode_image(image)
+
+        raw = image.tobytes()
+        key = (self._brightness, raw)
+        data = cache.get(key)
+        if data is None:
+            data = bytes(self._encode_image(image))
+            cache.put(key, data, len(raw) + len(data))
+        return data
+
+
+class max7219(transmitter, awaitable, instrumented, _frame_caching, _buffer_protocol, device):
     """
     Serial interface to a series of 8x8 LED matrixes daisychained together with
     MAX7219 chips.
@@ -54,10 +212,25 @@ class max7219(device):
     On creation, an initialization sequence is pumped to the display to properly
     configure it. Further control commands can then be called to affect the
     brightness and other settings.
+
+    :param delta_update: If ``True``, the register bytes last sent to each
+        daisychained device are remembered, and only those digit rows which have
+        changed are written on subsequent calls to :py:func:`display`. Devices
+        whose rows are unchanged are padded out with ``NOOP`` writes, so changes
+        to different rows on different devices share the same transfer.
+    :type delta_update: bool
+    :param frame_cache: If non-zero, the encoded form of recently displayed
+        images is cached (up to this many bytes), and reused whenever the same
+        image is displayed again. The cache, and its hit-rate statistics, are
+        available as :py:attr:`frame_cache`.
+    :type frame_cache: int
+
+    .. versionadded:: 1.10.0
+        The ``delta_update`` and ``frame_cache`` parameters.
     """
     def __init__(self, serial_interface=None, width=8, height=8, cascaded=None, rotate=0,
                  block_orientation=0, blocks_arranged_in_reverse_order=False, contrast=0x70,
-                 **kwargs):
+                 delta_update=False, frame_cache=0, **kwargs):
         super(max7219, self).__init__(luma.led_matrix.const.max7219, serial_interface)
 
         # Derive (override) the width and height if a cascaded param supplied
@@ -77,10 +250,19 @@ class max7219(device):
         self._correction_angle = block_orientation
 
         self.cascaded = cascaded or (width * height) // 64
-        self._offsets = [(y * self._w) + x
-                         for y in range(self._h - 8, -8, -8)
-                         for x in range(self._w - 8, -8, -8)]
-        self._rows = list(range(8))
+
+        self._registers = bytes(self._const.DIGIT_0 + digit
+                                for digit in range(8)
+                                for _ in range(self.cascaded))
+        self._sources, self._gather = self._packing_plan()
+
+        # Frame buffer, with the DIGIT_n registers interleaved with their values
+        self._buffer = bytearray(16 * self.cascaded)
+        self._buffer[0::2] = self._registers
+
+        self._delta_update = delta_update
+        self._shadow = None
+        self._init_frame_cache(frame_cache)
 
         self.data([self._const.SCANLIMIT, 7] * self.cascaded)
         self.data([self._const.DECODEMODE, 0] * self.cascaded)
@@ -107,48 +289,162 @@ class max7219(device):
                     image.paste(rotated_block, box)
         if self.blocks_arranged_in_reverse_order:
             old_image = image.copy()
-            for y in range(8):
+            blocks = self._w // 8
+            for y in range(self._h):
                 for x in range(8):
-                    for i in range(self.cascaded):
-                        image.putpixel((8 * (self.cascaded - 1) - i * 8 + x, y), old_image.getpixel((i * 8 + x, y)))
+                    for i in range(blocks):
+                        image.putpixel((8 * (blocks - 1) - i * 8 + x, y), old_image.getpixel((i * 8 + x, y)))
 
         return image
 
+    def _source_pixel(self, x, y):
+        """
+        Traces the pixel at ``(x, y)`` of the preprocessed image back to the
+        position it came from in the image supplied to :py:func:`display`.
+        """
+        if self.blocks_arranged_in_reverse_order:
+            x = (self._w // 8 - 1 - x // 8) * 8 + x % 8
+
+        u, v = x % 8, y % 8
+        if self._correction_angle == 90:
+            u, v = 7 - v, u
+        elif self._correction_angle == -90:
+            u, v = v, 7 - u
+        elif self._correction_angle == 180:
+            u, v = 7 - u, 7 - v
+        x, y = x - x % 8 + u, y - y % 8 + v
+
+        return _unrotate(self, x, y)
+
+    def _packing_plan(self):
+        """
+        Works out where each register byte can be found in the raw bytes of
+        the image supplied to :py:func:`display`, once and for all.
+
+        Each register byte holds one column of an 8x8 block of the preprocessed
+        image, least significant bit at the top. Rotation, block orientation
+        and block order only ever move whole blocks about and turn them, so
+        each of those bytes ends up as eight adjacent bits of one row or one
+        column of the original image: i.e. a byte of the image packed
+        by rows or by columns, in either bit order.
+        """
+        row_stride = self.width // 8
+        col_stride = self.height // 8
+        sources = []
+        gather = []
+
+        for digit in range(8):
+            for y in range(self._h - 8, -8, -8):
+                for x in range(self._w - 8, -8, -8):
+                    bits = [self._source_pixel(x + digit, y + i) for i in range(8)]
+                    xs, ys = zip(*bits)
+                    if len(set(ys)) == 1:
+                        x0 = min(xs)
+                        source = _rows if xs[0] > xs[-1] else _rows_reversed
+                        index = ys[0] * row_stride + x0 // 8
+                    else:
+                        y0 = min(ys)
+                        source = _columns if ys[0] < ys[-1] else _columns_reversed
+                        index = xs[0] * col_stride + (self.height - 8 - y0) // 8
+
+                    if source not in sources:
+                        sources.append(source)
+                    gather.append((source, index))
+
+        # The sources needed are laid end to end, each of them taking up one
+        # byte per eight pixels of the image
+        size = self.width * self.height // 8
+        return sources, itemgetter(*[sources.index(source) * size + index
+                                     for source, index in gather])
+
     def display(self, image):
         """
         Takes a 1-bit :py:mod:`PIL.Image` and dumps it to the LED matrix display
         via the MAX7219 serializers.
         """
-        assert image.mode == self.mode
-        assert image.size == self.size
+        self._submit(self._encode(image))
 
-        image = self.preprocess(image)
+    def _encode_image(self, image):
+        packed = b"".join([source(image) for source in self._sources])
+        return bytes(self._gather(packed))
 
-        i = 0
-        d0 = self._const.DIGIT_0
-        step = 2 * self.cascaded
-        offsets = self._offsets
-        rows = self._rows
+    def display_segments(self, data):
+        """
+        Takes a sequence of seven-segment bytes (as generated by a segment
+        mapper such as :py:func:`~luma.led_matrix.segment_mapper.dot_muncher`)
+        and writes them to the LED matrix display, exactly as if they had been
+        drawn by :py:class:`luma.core.virtual.sevensegment` and passed to
+        :py:func:`display`: the last byte is the leftmost column, with its
+        least significant bit at the top.
 
-        buf = bytearray(8 * step)
-        pix = list(image.getdata())
+        Unless the device's rotation or block orientation turns those columns
+        into rows, the bytes are written straight to the DIGIT registers, without
+        drawing an image at all.
 
-        for digit in range(8):
-            for daisychained_device in offsets:
-                byte = 0
-                idx = daisychained_device + digit
-                for y in rows:
-                    if pix[idx] > 0:
-                        byte |= 1 << y
-                    idx += self._w
-
-                buf[i] = digit + d0
-                buf[i + 1] = byte
-                i += 2
-
-        buf = list(buf)
+        :param data: The segment bytes.
+        :type data: bytes, bytearray
+
+        .. versionadded:: 1.10.0
+        """
+        columns = bytes(reversed(data))[:self.width].ljust(self.width, b'\0')
+
+        if self.height == 8 and set(self._sources) <= {_columns, _columns_reversed}:
+            packed = b"".join([columns if source is _columns else columns.translate(_REVERSED)
+                               for source in self._sources])
+            self._submit(bytes(self._gather(packed)))
+        else:
+            image = Image.new(self.mode, self.size)
+            for x, byte in enumerate(columns):
+                for y in range(8):
+                    if byte & 0x01:
+                        image.putpixel((x, y), 1)
+                    byte >>= 1
+            self.display(image)
+
+    def _transmit(self, data):
+        if self._shadow is None:
+            sent = self._write_all(data)
+        else:
+            sent = self._write_changes(data)
+
+        if self._delta_update:
+            self._shadow = data
+        return sent
+
+    def _write_all(self, data):
+        step = 2 * self.cascaded
+        self._buffer[1::2] = data
+
+        buf = memoryview(self._buffer)
         for i in range(0, len(buf), step):
             self.data(buf[i:i + step])
+        return len(buf)
+
+    def _write_changes(self, data):
+        # Collect the changed (register, value) pairs for each daisychained
+        # device, then send the n-th change of every device in the same
+        # transfer, with NOOPs for those that have nothing (more) to update.
+        n = self.cascaded
+        d0 = self._const.DIGIT_0
+        shadow = self._shadow
+        pending = [[] for _ in range(n)]
+
+        for digit in range(8):
+            start = digit * n
+            row = data[start:start + n]
+            prev = shadow[start:start + n]
+            if row != prev:
+                for i in range(n):
+                    if row[i] != prev[i]:
+                        pending[i].append((digit + d0, row[i]))
+
+        noop = (self._const.NOOP, 0)
+        sent = 0
+        for writes in zip_longest(*pending, fillvalue=noop):
+            transfer = bytes(chain.from_iterable(writes))
+            self.data(transfer)
+            sent += len(transfer)
+        return sent
 
     def contrast(self, value):
         """
@@ -175,7 +471,7 @@ class max7219(device):
         self.data([self._const.SHUTDOWN, 0] * self.cascaded)
 
 
-class ws2812(device):
+class ws2812(transmitter, awaitable, instrumented, device):
     """
     Serial interface to a series of RGB neopixels daisy-chained together with
     WS281x chips.
@@ -202,11 +498,20 @@ class ws2812(device):
         pixel to physical offsets. If supplied, should be the same size as
         ``width * height``.
     :type mapping: int[]
+    :param delta_update: If ``True``, a copy of the last frame displayed is
+        kept: displaying an identical frame again is skipped altogether (no
+        render), and otherwise only the pixels which have changed are set. The
+        :py:attr:`frames_skipped` and :py:attr:`pixels_skipped` counters record
+        how much work was avoided.
+    :type delta_update: bool
 
     .. versionadded:: 0.4.0
+
+    .. versionadded:: 1.10.0
+        The ``delta_update`` parameter.
     """
     def __init__(self, dma_interface=None, width=8, height=4, cascaded=None,
-                 rotate=0, mapping=None, **kwargs):
+                 rotate=0, mapping=None, delta_update=False, **kwargs):
         super(ws2812, self).__init__(const=None, serial_interface=noop)
 
         # Derive (override) the width and height if a cascaded param supplied
@@ -218,8 +523,17 @@ class ws2812(device):
         self.capabilities(width, height, rotate, mode="RGB")
         self._mapping = list(mapping or range(self.cascaded))
         assert self.cascaded == len(self._mapping)
+        self._identity = self._mapping == list(range(self.cascaded))
+        self._gather = _permutation(self._mapping)
         self._contrast = None
         self._prev_contrast = 0x70
+        self._led_buffer = None
+        self._colors = array(_UINT32, bytes(4 * self.cascaded))
+        self._delta_update = delta_update
+        self._shadow = None
+        self._shadow_mapping = None
+        self.frames_skipped = 0
+        self.pixels_skipped = 0
 
         ws = self._ws = dma_interface or self.__ws281x__()
 
@@ -258,6 +572,11 @@ class ws2812(device):
         if resp != 0:
             raise RuntimeError(f'ws2811_init failed with code {resp}')
 
+        # Where possible, colors are staged in a local array and copied into
+        # the channel's LED buffer in one go, rather than setting each pixel
+        # through a separate call into the native library.
+        self._led_buffer = self.__led_buffer__()
+
         self.clear()
         self.show()
 
@@ -265,22 +584,89 @@ class ws2812(device):
         import _rpi_ws281x
         return _rpi_ws281x
 
+    def __led_buffer__(self):
+        # The native library exposes the channel's LED buffer as an opaque
+        # SWIG pointer. Only a real pointer (or a ctypes address) is trusted:
+        # anything else, such as a mock, falls back to setting pixels
+        # individually rather than copying to whatever address it converts to.
+        try:
+            ptr = self._ws.ws2811_channel_t_leds_get(self._channel)
+        except (AttributeError, TypeError, ValueError):
+            return None
+        return _address_of(ptr)
+
     def display(self, image):
         """
         Takes a 24-bit RGB :py:mod:`PIL.Image` and dumps it to the daisy-chained
         WS2812 neopixels.
         """
+        self._submit(self._encode(image), self._mapping)
+
+    def _encode(self, image):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        ws = self._ws
-        m = self._mapping
-        for idx, (red, green, blue) in enumerate(image.getdata()):
-            color = (red << 16) | (green << 8) | blue
-            ws.ws2811_led_set(self._channel, m[idx], color)
+        return self._encode_image(image)
+
+    def _encode_image(self, image):
+        return image.tobytes("raw", _RGB_WORDS)
+
+    def _physical(self, packed):
+        # Reorders native-endian 32-bit colors from image order into physical
+        # (strip) order, as per the mapping
+        if self._identity:
+            return packed
+        words = memoryview(packed).cast(_UINT32)
+        if self._gather is not None:
+            return array(_UINT32, self._gather(words))
+        colors = self._colors
+        for pos, color in zip(self._mapping, words):
+            colors[pos] = color
+        return colors
+
+    def _transmit(self, packed, mapping=None):
+        # Sets the LEDs from native-endian 32-bit colors: ``mapping`` gives
+        # the physical offset of each color, or is None if the colors are
+        # already in physical (strip) order.
+        words = memoryview(packed).cast(_UINT32)
+        shadow = self._shadow if self._shadow_mapping is mapping else None
+
+        if packed == shadow:
+            self.frames_skipped += 1
+            self.pixels_skipped += self.cascaded
+            return 0
+
+        if self._led_buffer is not None:
+            colors = packed if mapping is None else self._physical(packed)
+            if isinstance(colors, array):
+                ctypes.memmove(self._led_buffer, colors.buffer_info()[0], len(packed))
+            else:
+                ctypes.memmove(self._led_buffer, colors, len(packed))
+        elif shadow is not None:
+            ws = self._ws
+            channel = self._channel
+            changed = 0
+            for pos, color, prev in zip(mapping or range(self.cascaded), words,
+                                        memoryview(shadow).cast(_UINT32)):
+                if color != prev:
+                    ws.ws2811_led_set(channel, pos, color)
+                    changed += 1
+            self.pixels_skipped += self.cascaded - changed
+        else:
+            ws = self._ws
+            channel = self._channel
+            for pos, color in zip(mapping or range(self.cascaded), words):
+                ws.ws2811_led_set(channel, pos, color)
 
         self._flush()
 
+        # Only once the frame has reached the LEDs can it be relied on to
+        # skip an identical one
+        if self._delta_update:
+            self._shadow = packed
+            self._shadow_mapping = mapping
+        return 3 * self.cascaded
+
     def show(self):
         """
         Simulates switching the display mode ON; this is achieved by restoring
@@ -319,8 +705,9 @@ class ws2812(device):
     def __del__(self):
         # Required because Python will complain about memory leaks
         # However there's no guarantee that "ws" will even be set
-        # when the __del__ method for this class is reached.
-        if self._ws is not None:
+        # when the __del__ method for this class is reached, nor that it has
+        # not already been cleaned up (e.g. by the exit hook).
+        if getattr(self, "_ws", None) is not None and getattr(self, "_leds", None) is not None:
             self.cleanup()
 
     def cleanup(self):
@@ -336,6 +723,7 @@ class ws2812(device):
             self._ws.delete_ws2811_t(self._leds)
             self._leds = None
             self._channel = None
+            self._led_buffer = None
 
 
 # Alias for ws2812
@@ -355,7 +743,7 @@ UNICORN_HAT = [
 ]
 
 
-class apa102(device):
+class apa102(transmitter, awaitable, instrumented, _frame_caching, _buffer_protocol, device):
     """
     Serial interface to a series of 'next-gen' RGB DotStar daisy-chained
     together with APA102 chips.
@@ -385,11 +773,19 @@ class apa102(device):
         pixel to physical offsets. If supplied, should be the same size as
         ``width * height``.
     :type mapping: int[]
+    :param frame_cache: If non-zero, the encoded form of recently displayed
+        images is cached (up to this many bytes), and reused whenever the same
+        image is displayed again. The cache, and its hit-rate statistics, are
+        available as :py:attr:`frame_cache`.
+    :type frame_cache: int
 
     .. versionadded:: 0.9.0
+
+    .. versionadded:: 1.10.0
+        The ``frame_cache`` parameter.
     """
     def __init__(self, serial_interface=None, width=8, height=1, cascaded=None,
-                 rotate=0, mapping=None, **kwargs):
+                 rotate=0, mapping=None, frame_cache=0, **kwargs):
         super(apa102, self).__init__(luma.core.const.common, serial_interface or self.__bitbang__())
 
         # Derive (override) the width and height if a cascaded param supplied
@@ -401,7 +797,13 @@ class apa102(device):
         self.capabilities(width, height, rotate, mode="RGBA")
         self._mapping = list(mapping or range(self.cascaded))
         assert self.cascaded == len(self._mapping)
+        self._identity = self._mapping == list(range(self.cascaded))
+        self._gather = _permutation(self._mapping)
         self._last_image = None
+        self._init_frame_cache(frame_cache)
+
+        # Send 32 zero-bits to reset, then pixel values then n/2 zero-bits at end
+        self._buffer = bytearray(4 + self.cascaded * 4 + ceil(self.cascaded / 8 / 2))
 
         self.contrast(0x70)
         self.clear()
@@ -417,24 +819,34 @@ class apa102(device):
         APA102 neopixels. If a pixel is not fully opaque, the alpha channel
         value is used to set the brightness of the respective RGB LED.
         """
-        assert image.mode == self.mode
-        assert image.size == self.size
-        self._last_image = image.copy()
-
-        # Send 32 zero-bits to reset, then pixel values then n/2 zero-bits at end
-        sz = image.width * image.height * 4
-        buf = bytearray(4 + sz + ceil(image.width * image.height / 8 / 2))
-
-        m = self._mapping
-        for idx, (r, g, b, a) in enumerate(image.getdata()):
-            offset = 4 + m[idx] * 4
-            brightness = (a >> 4) if a != 0xFF else self._brightness
-            buf[offset] = (0xE0 | brightness)
-            buf[offset + 1] = b
-            buf[offset + 2] = g
-            buf[offset + 3] = r
+        self._submit(self._encode(image))
 
-        self._serial_interface.data(list(buf))
+    def _encode(self, image):
+        self._last_image = image.copy()
+        return super(apa102, self)._encode(image)
+
+    def _encode_image(self, image):
+        # Each LED frame is the brightness header, followed by blue, green
+        # and red: the header is derived from the alpha channel by table lookup
+        leds = bytearray(image.tobytes("raw", "ABGR"))
+        leds[0::4] = leds[0::4].translate(self._headers)
+
+        buf = self._buffer
+        end = 4 + len(leds)
+        if self._identity:
+            buf[4:end] = leds
+        elif self._gather is not None:
+            buf[4:end] = array(_UINT32, self._gather(memoryview(leds).cast(_UINT32)))
+        else:
+            with memoryview(buf)[4:end].cast(_UINT32) as frames:
+                for pos, frame in zip(self._mapping, memoryview(leds).cast(_UINT32)):
+                    frames[pos] = frame
+
+        return buf
+
+    def _transmit(self, buf):
+        self.data(buf)
+        return len(buf)
 
     def show(self):
         """
@@ -457,10 +869,39 @@ class apa102(device):
         """
         assert 0x00 <= value <= 0xFF
         self._brightness = value >> 4
+
+        # Header byte for every alpha value: fully opaque pixels take the
+        # global brightness, otherwise the alpha value scales the brightness
+        self._headers = bytes(0xE0 | (a >> 4) for a in range(0xFF)) + \
+            bytes([0xE0 | self._brightness])
+
         if self._last_image is not None:
             self.display(self._last_image)
 
 
+# Seven LED masks for every segment byte, lowest bit (top LED) first
+_COLUMNS = [tuple(0xFFFFFFFF if byte >> bit & 0x01 else 0 for bit in range(7))
+            for byte in range(256)]
+
+
+@lru_cache(maxsize=1024)
+def _glyph(byte, word):
+    """
+    A column of seven native-endian 32-bit colors, lit per the segment byte.
+    """
+    return array(_UINT32, [word & mask for mask in _COLUMNS[byte]]).tobytes()
+
+
+def _color_word(color):
+    """
+    Converts a color name or tuple into a packed 0xRRGGBB value.
+    """
+    if isinstance(color, str):
+        color = ImageColor.getrgb(color)
+    r, g, b = color[:3]
+    return r << 16 | g << 8 | b
+
+
 class neosegment(sevensegment):
     """
     Extends the :py:class:`~luma.core.virtual.sevensegment` class specifically
@@ -484,6 +925,9 @@ class neosegment(sevensegment):
         height = 7
         mapping = [(i % width) * height + (i // width) for i in range(width * height)]
         self.device = kwargs.get("device") or ws2812(width=width, height=height, mapping=mapping)
+        self._direct = isinstance(self.device, ws2812) and self.device._mapping == mapping
+        self._batches = 0
+        self._deferred = False
         self.undefined = undefined
         self._text_buffer = ""
         self.color = "white"
@@ -503,7 +947,43 @@ class neosegment(sevensegment):
     def _color_chg(self, color):
         self._flush(self.text, color)
 
+    @contextmanager
+    def batch(self):
+        """
+        Context manager which defers redrawing the display until the end of
+        the block, so that any number of text and color changes result in a
+        single update, for example::
+
+            with neoseg.batch():
+                neoseg.text = "HELLO"
+                for i in range(neoseg.device.width):
+                    neoseg.color[i] = palette[i]
+
+        Batches may be nested, in which case the display is updated when the
+        outermost block completes. If the block raises an exception, the
+        deferred update is abandoned.
+
+        .. versionadded:: 1.10.0
+        """
+        self._batches += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batches == 1:
+                self._deferred = False
+            raise
+        finally:
+            self._batches -= 1
+
+        if self._batches == 0 and self._deferred:
+            self._deferred = False
+            self._flush(self.text)
+
     def _flush(self, text, color=None):
+        if self._batches:
+            self._deferred = True
+            return
+
         data = bytearray(self.segment_mapper(text, notfound=self.undefined)).ljust(self.device.width, b'\0')
         color = color or self.color
 
@@ -511,37 +991,27 @@ class neosegment(sevensegment):
             raise OverflowError(
                 "Device's capabilities insufficient for value '{0}'".format(text))
 
-        with canvas(self.device) as draw:
-            for x, byte in enumerate(data):
-                for y in range(self.device.height):
-                    if byte & 0x01:
-                        draw.point((x, y), fill=color[x])
-                    byte >>= 1
+        # Each character is a column of seven LEDs: compose the frame from
+        # pre-rendered columns, which (with the default wiring) is already in
+        # the strip's physical order.
+        frame = b"".join(map(_glyph, data, map(_color_word, color)))
+
+        if self._direct:
+            self.device._submit(frame)
+        else:
+            image = Image.frombytes("RGB", (self.device.height, self.device.width),
+                                    frame, "raw", _RGB_WORDS)
+            image = image.transpose(Image.Transpose.TRANSPOSE)
+            if image.mode != self.device.mode:
+                image = image.convert(self.device.mode)
+            self.device.display(image)
 
     def segment_mapper(self, text, notfound="_"):
-        for char in regular(text, notfound):
-
-            # Convert from std MAX7219 segment mappings
-            a = char >> 6 & 0x01
-            b = char >> 5 & 0x01
-            c = char >> 4 & 0x01
-            d = char >> 3 & 0x01
-            e = char >> 2 & 0x01
-            f = char >> 1 & 0x01
-            g = char >> 0 & 0x01
-
-            # To NeoSegment positions
-            yield \
-                b << 6 | \
-                a << 5 | \
-                f << 4 | \
-                g << 3 | \
-                c << 2 | \
-                d << 1 | \
-                e << 0
-
-
-class unicornhathd(device):
+        # Convert from std MAX7219 segment mappings to NeoSegment positions
+        return regular_bytes(text, notfound).translate(remap_table("-bafgcde"))
+
+
+class unicornhathd(transmitter, awaitable, instrumented, _frame_caching, _buffer_protocol, device):
     """
     Display adapter for Pimoroni's Unicorn Hat HD - a dense 16x16 array of
     high intensity RGB LEDs. Since the board contains a small ARM chip to
@@ -558,13 +1028,26 @@ class unicornhathd(device):
         A value of: 0=0°, 1=90°, 2=180°, 3=270°. If not supplied, zero is
         assumed.
     :type rotate: int
+    :param frame_cache: If non-zero, the encoded form of recently displayed
+        images is cached (up to this many bytes), and reused whenever the same
+        image is displayed again. The cache, and its hit-rate statistics, are
+        available as :py:attr:`frame_cache`.
+    :type frame_cache: int
 
     .. versionadded:: 1.3.0
+
+    .. versionadded:: 1.10.0
+        The ``frame_cache`` parameter.
     """
-    def __init__(self, serial_interface=None, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, rotate=0, frame_cache=0, **kwargs):
         super(unicornhathd, self).__init__(luma.core.const.common, serial_interface)
         self.capabilities(16, 16, rotate, mode="RGBA")
         self._last_image = None
+        self._init_frame_cache(frame_cache)
+
+        # Start of frame, followed by the pixel values
+        self._buffer = bytearray(1 + 16 * 16 * 3)
+        self._buffer[0] = 0x72
         self._prev_brightness = None
         self.contrast(0x70)
         self.clear()
@@ -576,23 +1059,37 @@ class unicornhathd(device):
         If a pixel is not fully opaque, the alpha channel value is used to set the
         brightness of the respective RGB LED.
         """
-        assert image.mode == self.mode
-        assert image.size == self.size
-        self._last_image = image.copy()
-
-        # Send zeros to reset, then pixel values then zeros at end
-        sz = image.width * image.height * 3
-        buf = bytearray(sz)
-        normalized_brightness = self._brightness / 255.0
+        self._submit(self._encode(image))
 
-        for idx, (r, g, b, a) in enumerate(image.getdata()):
-            offset = idx * 3
-            brightness = a / 255.0 if a != 255 else normalized_brightness
-            buf[offset] = int(r * brightness)
-            buf[offset + 1] = int(g * brightness)
-            buf[offset + 2] = int(b * brightness)
-
-        self._serial_interface.data([0x72] + list(buf))   # 0x72 == SOF ... start of frame?
+    def _encode(self, image):
+        self._last_image = image.copy()
+        return super(unicornhathd, self)._encode(image)
+
+    def _encode_image(self, image):
+        buf = self._buffer
+        rgb = image.tobytes("raw", "RGB")
+        alpha = image.getchannel("A")
+
+        if alpha.getextrema() == (255, 255):
+            # Fully opaque: everything is scaled by the global brightness
+            buf[1:] = rgb.translate(self._scaled)
+        else:
+            # Pair every channel value with its pixel's brightness, and look
+            # the pairs up (as native-endian 16-bit indexes) in the table
+            brightness = alpha.point(self._alpha_brightness)
+            brightness = Image.merge("RGB", (brightness,) * 3).tobytes()
+            pairs = bytearray(2 * len(rgb))
+            if sys.byteorder == "little":
+                pairs[0::2], pairs[1::2] = rgb, brightness
+            else:
+                pairs[0::2], pairs[1::2] = brightness, rgb
+            buf[1:] = bytes(map(_scaling_table().__getitem__, memoryview(pairs).cast("H")))
+
+        return buf
+
+    def _transmit(self, buf):
+        self.data(buf)
+        return len(buf)
 
     def show(self):
         """
@@ -621,5 +1118,12 @@ class unicornhathd(device):
         """
         assert 0x00 <= value <= 0xFF
         self._brightness = value
+
+        # Lookup tables for scaling channel values by the global brightness,
+        # and for substituting it for fully opaque alpha values
+        start = value * 256
+        self._scaled = _scaling_table()[start:start + 256]
+        self._alpha_brightness = list(range(255)) + [value]
+
         if self._last_image is not None:
             self.display(self._last_image)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Owns a device, and displays the frames other processes publish to it through
+a :py:mod:`luma.led_matrix.ringbuffer`. Run it as a daemon, with the usual
+luma device options (see ``--help``)::
+
+    $ python -m luma.led_matrix.frameserver --display ws2812 --width 16 --height 16 \\
+        --name luma_led_matrix
+
+The newest complete frame is always the one displayed: frames published
+while the previous one was being sent are dropped. Frames are encoded for the
+device straight from the shared memory, without first being copied out of
+it.
+
+.. versionadded:: 1.10.0
+"""
+
+import sys
+from time import sleep
+
+from PIL import Image
+
+from luma.core import cmdline
+from luma.led_matrix.device import ws2812
+from luma.led_matrix.ringbuffer import ringbuffer
+
+
+__all__ = ["frameserver", "main"]
+
+
+class frameserver(object):
+    """
+    Creates a ring buffer for a device's frames, and displays them.
+
+    :param device: The device: a ``max7219``, ``ws2812``, ``apa102`` or
+        ``unicornhathd``.
+    :param name: The name of the ring buffer; by default, a unique name is
+        chosen (see :py:attr:`name`).
+    :type name: str
+    :param slots: The number of frames the ring buffer holds.
+    :type slots: int
+    """
+    def __init__(self, device, name=None, slots=3):
+        self.device = device
+        self.ring = ringbuffer.create(device.mode, device.size, slots, name)
+        self.name = self.ring.name
+        self.sequence = 0
+        self.frames_displayed = 0
+        self.frames_dropped = 0
+        self.frames_overwritten = 0
+        self._stopped = False
+
+        # WS2812 frames are transmitted in image order, as per display()
+        self._transmit_args = (device._mapping,) if isinstance(device, ws2812) else ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def poll(self):
+        """
+        Displays the latest frame, if it has not been displayed already.
+
+        :returns: ``True`` if a frame was displayed.
+        :rtype: bool
+        """
+        sequence = self.ring.sequence
+        if sequence == self.sequence:
+            return False
+
+        self.frames_dropped += sequence - self.sequence - 1
+        self.sequence = sequence
+        data = self._encode(sequence)
+        if data is None or not self.ring.holds(sequence):
+            # The producer has lapped the ring while the frame was read
+            self.frames_overwritten += 1
+            return False
+
+        self.device._submit(data, *self._transmit_args)
+        self.frames_displayed += 1
+        return True
+
+    def _encode(self, sequence):
+        device = self.device
+        frame = self.ring.frame(sequence)
+        if frame is None:
+            return None
+
+        # The image shares the slot's memory where Pillow can map it (RGBA),
+        # rather than copying it; its encoding is the device's own
+        image = Image.frombuffer(device.mode, device.size, frame, "raw", device.mode, 0, 1)
+        return device._encode(image)
+
+    def stop(self):
+        """
+        Stops :py:meth:`run` (e.g. from another thread).
+        """
+        self._stopped = True
+
+    def run(self, poll_interval=0.001):
+        """
+        Displays each new frame as it is published, until :py:meth:`stop` is
+        called.
+
+        :param poll_interval: How long (in seconds) to wait before looking
+            again, when there is no new frame.
+        :type poll_interval: float
+        """
+        self._stopped = False
+        while not self._stopped:
+            if not self.poll():
+                sleep(poll_interval)
+
+    def close(self):
+        """
+        Destroys the ring buffer.
+        """
+        if self.ring is not None:
+            self.ring.close()
+            self.ring.unlink()
+            self.ring = None
+
+
+def main(argv=None):
+    parser = cmdline.create_parser(
+        description="Displays the frames published to a shared-memory ring buffer.")
+    parser.add_argument("--name", default="luma_led_matrix",
+                        help="name of the ring buffer (default: %(default)s)")
+    parser.add_argument("--slots", type=int, default=3,
+                        help="number of frames the ring buffer holds (default: %(default)s)")
+    parser.add_argument("--poll-interval", type=float, default=0.001,
+                        help="seconds to wait when there is no new frame (default: %(default)s)")
+    parser.set_defaults(display="max7219", interface="spi")
+
+    args = parser.parse_args(argv)
+    if args.config:
+        config = cmdline.load_config(args.config)
+        args = parser.parse_args(config + list(argv if argv is not None else sys.argv[1:]))
+
+    device = cmdline.create_device(args)
+    with frameserver(device, name=args.name, slots=args.slots) as server:
+        try:
+            server.run(args.poll_interval)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
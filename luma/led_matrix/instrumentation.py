@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Optional timing instrumentation for the devices in
+:py:mod:`luma.led_matrix.device`.
+
+Displaying a frame happens in two stages: *encode*, where the image is
+turned into the device's native data (register bytes, LED frames or colors),
+and *transmit*, where that data is delivered to the hardware (through the
+serial interface, or into the ws281x LED buffer and rendered). Once
+instrumentation is switched on with :py:meth:`instrumented.instrument`, the
+duration of each stage and the number of bytes transmitted are recorded for
+every frame, and summarized by :py:meth:`instrumented.stats`.
+
+When instrumentation is off (the default) the stages are called directly, so
+there is nothing to pay for it.
+
+.. versionadded:: 1.10.0
+"""
+
+import threading
+from collections import deque
+from math import ceil
+from time import perf_counter
+
+
+__all__ = ["instrumented", "rolling_window"]
+
+
+def _bucket(value, scale):
+    """
+    Upper bound of the power-of-two bucket ``value`` falls in, where ``scale``
+    is the size of the smallest bucket.
+    """
+    units = ceil(value / scale)
+    return (1 << (units - 1).bit_length()) * scale if units > 0 else 0
+
+
+class rolling_window(object):
+    """
+    Rolling window of the most recent samples of a measurement, summarized by
+    :py:meth:`snapshot` as used by :py:meth:`instrumented.stats` (and the
+    :py:class:`~luma.led_matrix.scheduler.scheduler`).
+
+    :param size: The number of most recent samples kept.
+    :type size: int
+    :param scale: The size of the smallest histogram bucket.
+    :type scale: float
+    """
+    def __init__(self, size, scale):
+        self._samples = deque(maxlen=size)
+        self._scale = scale
+        self.add = self._samples.append
+
+    def snapshot(self):
+        """
+        Summarizes the samples in the window.
+
+        :returns: The ``count`` of samples and, if there are any, their
+            ``mean``, ``min``, ``max``, ``p50``, ``p90`` and ``p99``
+            percentiles, and a ``histogram`` of ``(upper bound, count)`` pairs
+            with power-of-two bucket sizes.
+        :rtype: dict
+        """
+        samples = sorted(self._samples)
+        n = len(samples)
+        if n == 0:
+            return {"count": 0}
+
+        histogram = {}
+        for value in samples:
+            bound = _bucket(value, self._scale)
+            histogram[bound] = histogram.get(bound, 0) + 1
+
+        return {
+            "count": n,
+            "mean": sum(samples) / n,
+            "min": samples[0],
+            "max": samples[-1],
+            "p50": samples[(n - 1) * 50 // 100],
+            "p90": samples[(n - 1) * 90 // 100],
+            "p99": samples[(n - 1) * 99 // 100],
+            "histogram": sorted(histogram.items())
+        }
+
+
+class _recorder(object):
+    """
+    The measurements taken while instrumentation is switched on. Frames may be
+    encoded on one thread and transmitted on another (see
+    :py:mod:`luma.led_matrix.background`), so the time spent encoding is kept
+    per thread until it is taken to travel with the encoded frame, and the
+    totals are only updated under a lock.
+    """
+    def __init__(self, window, callback):
+        self.callback = callback
+        self.frames = 0
+        self.frames_skipped = 0
+        self.bytes = 0
+        self.encode = rolling_window(window, 1e-6)
+        self.transmit = rolling_window(window, 1e-6)
+        self.total = rolling_window(window, 1e-6)
+        self.sent = rolling_window(window, 1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def encoded(self, duration):
+        """
+        Adds ``duration`` to the time spent encoding the current thread's next
+        frame.
+        """
+        self._local.encoding = getattr(self._local, "encoding", 0.0) + duration
+
+    def take_encoding(self):
+        """
+        Returns (and resets) the time spent encoding the current thread's next
+        frame.
+        """
+        encode = getattr(self._local, "encoding", 0.0)
+        self._local.encoding = 0.0
+        return encode
+
+    def frame(self, encode, transmit, sent):
+        with self._lock:
+            self.frames += 1
+            self.bytes += sent
+            if sent == 0:
+                self.frames_skipped += 1
+
+            self.encode.add(encode)
+            self.transmit.add(transmit)
+            self.total.add(encode + transmit)
+            self.sent.add(sent)
+
+        if self.callback is not None:
+            self.callback({
+                "encode": encode,
+                "transmit": transmit,
+                "total": encode + transmit,
+                "bytes": sent,
+                "skipped": sent == 0
+            })
+
+    def dropped(self, encode):
+        """
+        Records a frame which was encoded, but replaced by a newer one before
+        it could be transmitted, as a skipped frame.
+        """
+        self.frame(encode, 0.0, 0)
+
+
+class instrumented(object):
+    """
+    Mixin for devices whose ``display()`` is made up of an ``_encode()`` stage,
+    which returns the encoded frame, and a ``_transmit()`` stage, which sends
+    it and returns the number of bytes transmitted (zero if the frame was
+    skipped, e.g. because nothing changed).
+    """
+    _recording = None
+
+    def instrument(self, enabled=True, callback=None, window=1000):
+        """
+        Switches the recording of per-frame timings on or off. Switching it on
+        (again) starts from a clean slate.
+
+        :param enabled: Whether to record timings.
+        :type enabled: bool
+        :param callback: An optional function, called after every frame with
+            a dict of the ``encode``, ``transmit`` and ``total`` durations (in
+            seconds), the number of ``bytes`` transmitted, and whether the
+            frame was ``skipped``.
+        :param window: The number of most recent frames the statistics are
+            computed over.
+        :type window: int
+        """
+        self.__dict__.pop("_encode", None)
+        self.__dict__.pop("_transmit", None)
+        self._recording = None
+        if not enabled:
+            return
+
+        recorder = self._recording = _recorder(window, callback)
+        encode = self._encode
+        transmit = self._transmit
+
+        def timed_encode(*args):
+            start = perf_counter()
+            try:
+                return encode(*args)
+            finally:
+                recorder.encoded(perf_counter() - start)
+
+        def timed_transmit(*args):
+            encode = recorder.take_encoding()
+            start = perf_counter()
+            sent = transmit(*args)
+            recorder.frame(encode, perf_counter() - start, sent)
+            return sent
+
+        self._encode = timed_encode
+        self._transmit = timed_transmit
+
+    def stats(self):
+        """
+        Summarizes the frames displayed since instrumentation was switched on.
+        The ``encode``, ``transmit`` and ``total`` durations (in seconds) and
+        the ``bytes`` transmitted per frame are each reported over the rolling
+        window as their ``count``, ``mean``, ``min``, ``max``, ``p50``, ``p90``
+        and ``p99`` percentiles, and a ``histogram`` of ``(upper bound, count)``
+        pairs with power-of-two bucket sizes (starting at 1µs or 1 byte).
+        Frames dropped from the background mailbox before being transmitted
+        are counted in ``frames_skipped``, with their encode time.
+
+        :returns: The statistics, or ``None`` if instrumentation is off.
+        :rtype: dict
+        """
+        recorder = self._recording
+        if recorder is None:
+            return None
+
+        return {
+            "frames": recorder.frames,
+            "frames_skipped": recorder.frames_skipped,
+            "bytes": recorder.bytes,
+            "encode": recorder.encode.snapshot(),
+            "transmit": recorder.transmit.snapshot(),
+            "total": recorder.total.snapshot(),
+            "bytes_per_frame": recorder.sent.snapshot()
+        }
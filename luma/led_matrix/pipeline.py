@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Spreads the rendering of CPU-heavy effects (e.g. per-pixel plasma, swirl or
+tunnel effects written in pure Python) over a pool of worker processes, so
+that every core is used, while the frames are still displayed in order::
+
+    def swirl(frame):
+        image = Image.new("RGB", (16, 16))
+        ...
+        return image
+
+    with pipeline(swirl, device.mode, device.size) as frames:
+        frames.run(device)
+
+Each worker renders a frame into a slot of a block of shared memory, from
+which the displaying process reads it back: only the frame numbers pass
+between the processes, rather than pickled images. The number of frames
+rendered ahead of the one being displayed is bounded by the number of slots.
+
+.. versionadded:: 1.10.0
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from multiprocessing import shared_memory
+
+from PIL import Image
+
+
+__all__ = ["pipeline"]
+
+
+# The state of a worker process, set up by _attach()
+_worker = {}
+
+
+def _attach(name, render, mode, size, frame_size):
+    _worker["memory"] = shared_memory.SharedMemory(name=name)
+    _worker["render"] = render
+    _worker["mode"] = mode
+    _worker["size"] = size
+    _worker["frame_size"] = frame_size
+
+
+def _render_into(frame, slot):
+    image = _worker["render"](frame)
+    if image.mode != _worker["mode"] or image.size != _worker["size"]:
+        raise ValueError(
+            f"Frame {frame} is a {image.size[0]} x {image.size[1]} {image.mode} image, "
+            f"expected {_worker['size'][0]} x {_worker['size'][1]} {_worker['mode']}")
+
+    frame_size = _worker["frame_size"]
+    start = slot * frame_size
+    _worker["memory"].buf[start:start + frame_size] = image.tobytes()
+    return frame
+
+
+class pipeline(object):
+    """
+    Renders frames in a pool of worker processes.
+
+    :param render: Called (in a worker process) with a frame number, returns
+        the frame as a :py:mod:`PIL.Image`. It must be picklable (i.e. a
+        module-level function, or a :py:func:`functools.partial` of one) where
+        worker processes are spawned rather than forked.
+    :param mode: The image mode of every frame, e.g. ``device.mode``.
+    :type mode: str
+    :param size: The size of every frame, e.g. ``device.size``.
+    :type size: tuple(int, int)
+    :param workers: The number of worker processes; by default, one per CPU.
+    :type workers: int
+    :param lookahead: The most frames rendered (or being rendered) ahead of
+        the one being displayed; by default, twice the number of workers.
+    :type lookahead: int
+    """
+    def __init__(self, render, mode, size, workers=None, lookahead=None):
+        self.mode = mode
+        self.size = size
+        self.workers = workers or os.cpu_count() or 1
+        self.lookahead = lookahead or 2 * self.workers
+        assert self.workers > 0 and self.lookahead > 0
+
+        self.frame_size = len(Image.new(mode, size).tobytes())
+        self._memory = shared_memory.SharedMemory(create=True, size=self.lookahead * self.frame_size)
+        try:
+            self._pool = multiprocessing.Pool(
+                self.workers, initializer=_attach,
+                initargs=(self._memory.name, render, mode, size, self.frame_size))
+        except BaseException:
+            self._memory.close()
+            self._memory.unlink()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def frames(self, count=None, start=0):
+        """
+        Iterates through the rendered frames, in order.
+
+        :param count: The number of frames; by default, they never run out.
+        :type count: int
+        :param start: The number of the first frame.
+        :type start: int
+        :rtype: Iterator[PIL.Image.Image]
+        """
+        frame_size = self.frame_size
+        end = None if count is None else start + count
+        free = list(range(self.lookahead))
+        pending = deque()
+        frame = start
+
+        try:
+            while True:
+                while free and (end is None or frame < end):
+                    slot = free.pop()
+                    pending.append((slot, self._pool.apply_async(_render_into, (frame, slot))))
+                    frame += 1
+
+                if not pending:
+                    return
+
+                slot, result = pending.popleft()
+                result.get()
+                offset = slot * frame_size
+                image = Image.frombytes(self.mode, self.size, self._memory.buf[offset:offset + frame_size])
+                free.append(slot)
+                yield image
+        finally:
+            # Frames still being rendered must not write into slots which the
+            # next call might be reading; once the pipeline has been closed,
+            # though, they never will (nor complete)
+            if self._pool is not None:
+                for _, result in pending:
+                    result.wait()
+
+    def run(self, device, count=None, start=0):
+        """
+        Displays the rendered frames on a device, one after the other, as soon
+        as each is ready. To play them at a steady rate instead, pass the
+        frames to a :py:class:`~luma.led_matrix.scheduler.scheduler`::
+
+            frames = pipeline.frames()
+            scheduler(device, fps=30).run(lambda _: next(frames))
+
+        :param device: The device to display the frames on.
+        :param count: The number of frames; by default, they never run out.
+        :type count: int
+        :param start: The number of the first frame.
+        :type start: int
+        :returns: The number of frames displayed.
+        :rtype: int
+        """
+        shown = 0
+        for image in self.frames(count, start):
+            device.display(image)
+            shown += 1
+        return shown
+
+    def close(self):
+        """
+        Stops the worker processes, and releases the shared memory.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._memory.close()
+            self._memory.unlink()
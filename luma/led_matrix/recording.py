@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Stand-in interfaces which record everything a device sends, and decoders
+which rebuild what the hardware would be showing from the recording. Between
+them, devices can be exercised and verified (pixel-for-pixel) without any
+hardware attached, for example::
+
+    from luma.led_matrix.device import max7219
+    from luma.led_matrix.recording import serial, max7219_decoder
+
+    recorder = serial(bus_speed_hz=10000000)
+    device = max7219(recorder, cascaded=4, delta_update=True)
+    ...
+    image = max7219_decoder(cascaded=4).replay(recorder.transactions).image()
+
+Each recorder also models how long the transactions would take on the wire,
+given the speed of the bus, so the throughput of a device can be estimated.
+
+.. versionadded:: 1.10.0
+"""
+
+import ctypes
+from array import array
+from collections import namedtuple
+from math import ceil
+from time import perf_counter
+
+from PIL import Image
+
+import luma.led_matrix.const
+
+
+# Array type code for the 32-bit LED colors
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+__all__ = ["transaction", "serial", "ws281x",
+           "max7219_decoder", "apa102_decoder", "unicornhathd_decoder", "ws281x_decoder"]
+
+
+transaction = namedtuple("transaction", ["timestamp", "kind", "payload", "duration"])
+transaction.__doc__ = """
+A single recorded transaction.
+
+:param timestamp: When it happened (as per :py:func:`time.perf_counter`).
+:param kind: ``"command"`` or ``"data"`` for a serial interface, ``"render"``
+    for a ws281x interface.
+:param payload: The bytes sent (for a render, the 32-bit LED colors).
+:param duration: How long it would take on the wire, in seconds.
+"""
+
+
+class serial(object):
+    """
+    Stand-in serial interface (as per :py:mod:`luma.core.interface.serial`),
+    which records every command and data transfer.
+
+    :param bus_speed_hz: The bus clock speed, used to model the time taken
+        by each transfer.
+    :type bus_speed_hz: int
+    :param overhead: Fixed time (in seconds) taken by every transfer, on top
+        of clocking out its bytes (e.g. chip-select, driver latency).
+    :type overhead: float
+    :param record: If ``False``, transactions are only counted and timed, but
+        not kept.
+    :type record: bool
+    """
+    def __init__(self, bus_speed_hz=8000000, overhead=0.0, record=True):
+        self.bus_speed_hz = bus_speed_hz
+        self.overhead = overhead
+        self.record = record
+        self.clear()
+
+    def clear(self):
+        """
+        Discards the transactions recorded so far, and resets the counters.
+        """
+        self.transactions = []
+        self.bytes_sent = 0
+        self.transfer_time = 0.0
+
+    def _transfer(self, kind, payload):
+        size = len(payload)
+        duration = self.overhead + size * 8 / self.bus_speed_hz
+        self.bytes_sent += size
+        self.transfer_time += duration
+        if self.record:
+            self.transactions.append(transaction(perf_counter(), kind, bytes(payload), duration))
+
+    def command(self, *cmd):
+        self._transfer("command", cmd)
+
+    def data(self, data):
+        self._transfer("data", data)
+
+    def cleanup(self):
+        pass
+
+
+class _channel(object):
+    def __init__(self):
+        self.count = 0
+        self.brightness = 0
+        self.leds = None
+
+
+class ws281x(object):
+    """
+    Stand-in for the ``_rpi_ws281x`` module, which records the LED colors
+    every time they are rendered. As per the real library, the colors are
+    held in a native buffer for each channel.
+
+    :param frequency_hz: The signal frequency, used to model the time taken
+        by each render (24 bits per LED, plus the reset/latch time).
+    :type frequency_hz: int
+    :param reset_time: The time (in seconds) for the LEDs to latch the new
+        colors after the data has been sent.
+    :type reset_time: float
+    :param led_buffer: If ``False``, the LED buffer is not made available, so
+        that pixels must be set one at a time (as with older bindings).
+    :type led_buffer: bool
+    :param record: If ``False``, renders are only counted and timed, but not
+        kept.
+    :type record: bool
+    """
+    WS2811_STRIP_GRB = 0x00081000
+
+    def __init__(self, frequency_hz=800000, reset_time=50e-6, led_buffer=True, record=True):
+        self.frequency_hz = frequency_hz
+        self.reset_time = reset_time
+        self.led_buffer = led_buffer
+        self.record = record
+        self.channels = [_channel(), _channel()]
+        self.clear()
+
+    def clear(self):
+        """
+        Discards the renders recorded so far, and resets the counters.
+        """
+        self.transactions = []
+        self.bytes_sent = 0
+        self.transfer_time = 0.0
+
+    def __getattr__(self, name):
+        # Any other settings are accepted, and ignored
+        if name.startswith("ws2811_") and name.endswith("_set"):
+            return lambda *args: None
+        raise AttributeError(name)
+
+    def new_ws2811_t(self):
+        return object()
+
+    def delete_ws2811_t(self, leds):
+        pass
+
+    def ws2811_channel_get(self, leds, channum):
+        return self.channels[channum]
+
+    def ws2811_channel_t_count_set(self, channel, count):
+        channel.count = count
+        channel.leds = (ctypes.c_uint32 * count)() if count else None
+
+    def ws2811_channel_t_brightness_set(self, channel, brightness):
+        channel.brightness = brightness
+
+    def ws2811_channel_t_leds_get(self, channel):
+        if self.led_buffer and channel.leds is not None:
+            return ctypes.addressof(channel.leds)
+
+    def ws2811_led_set(self, channel, pos, color):
+        channel.leds[pos] = color
+
+    def ws2811_init(self, leds):
+        return 0
+
+    def ws2811_render(self, leds):
+        for channel in self.channels:
+            if channel.count:
+                duration = channel.count * 24 / self.frequency_hz + self.reset_time
+                self.bytes_sent += channel.count * 3
+                self.transfer_time += duration
+                if self.record:
+                    self.transactions.append(transaction(
+                        perf_counter(), "render", bytes(channel.leds), duration))
+        return 0
+
+    def ws2811_fini(self, leds):
+        pass
+
+
+class max7219_decoder(object):
+    """
+    Rebuilds the state of a chain of MAX7219 devices from the data transfers
+    sent to them. Every transfer holds one (register, value) pair per device,
+    the first pair being for the device at position 0; ``NOOP`` pairs leave a
+    device unchanged.
+
+    :param width: The width of the display, in pixels.
+    :type width: int
+    :param height: The height of the display, in pixels.
+    :type height: int
+    :param cascaded: The number of devices - if supplied, this overrides
+        ``width`` and ``height`` (as per
+        :py:class:`~luma.led_matrix.device.max7219`).
+    :type cascaded: int
+    """
+    def __init__(self, width=8, height=8, cascaded=None):
+        if cascaded is not None:
+            width = cascaded * 8
+            height = 8
+
+        self.width = width
+        self.height = height
+        self.cascaded = width * height // 64
+        self.registers = [bytearray(16) for _ in range(self.cascaded)]
+
+    def feed(self, data):
+        """
+        Applies a single data transfer.
+
+        :raises ValueError: If the transfer is not one pair per device.
+        """
+        if len(data) != 2 * self.cascaded:
+            raise ValueError(f"Expected {2 * self.cascaded} bytes, got {len(data)}")
+
+        noop = luma.led_matrix.const.max7219.NOOP
+        for registers, register, value in zip(self.registers, data[0::2], data[1::2]):
+            if register != noop:
+                registers[register & 0x0F] = value
+
+    def replay(self, transactions):
+        """
+        Applies every recorded data transfer in turn.
+
+        :param transactions: The recorded transactions.
+        :type transactions: list[transaction]
+        :returns: The decoder itself.
+        """
+        for t in transactions:
+            if t.kind == "data":
+                self.feed(t.payload)
+        return self
+
+    def digits(self, position):
+        """
+        The DIGIT_0..DIGIT_7 register values of the device at ``position``.
+
+        :rtype: bytes
+        """
+        d0 = luma.led_matrix.const.max7219.DIGIT_0
+        return bytes(self.registers[position][d0:d0 + 8])
+
+    def image(self):
+        """
+        The image being shown, as it would be after the device's
+        :py:meth:`~luma.led_matrix.device.max7219.preprocess` (i.e. with any
+        rotation and block orientation already applied). The device at position
+        0 shows the bottom-right 8x8 block, the next the block to its left, and
+        so on up the display; each DIGIT register is a column of its block,
+        least significant bit at the top.
+
+        :rtype: PIL.Image.Image
+        """
+        image = Image.new("1", (self.width, self.height))
+        blocks = self.width // 8
+        for position in range(self.cascaded):
+            x0 = self.width - 8 - (position % blocks) * 8
+            y0 = self.height - 8 - (position // blocks) * 8
+            for x, column in enumerate(self.digits(position)):
+                for y in range(8):
+                    if column >> y & 0x01:
+                        image.putpixel((x0 + x, y0 + y), 1)
+        return image
+
+    def intensity(self, position):
+        """
+        The INTENSITY register value (0-15) of the device at ``position``.
+        """
+        return self.registers[position][luma.led_matrix.const.max7219.INTENSITY]
+
+    def shutdown(self, position):
+        """
+        Whether the device at ``position`` is shut down (in low-power mode).
+        """
+        return self.registers[position][luma.led_matrix.const.max7219.SHUTDOWN] == 0
+
+
+class apa102_decoder(object):
+    """
+    Decodes APA102 data transfers: a start frame of 32 zero bits, a 32-bit
+    frame for every LED (a ``0b111`` marker with 5-bit brightness, then blue,
+    green and red), and an end frame of at least one bit per two LEDs.
+
+    :param width: The number of LEDs laid out horizontally.
+    :type width: int
+    :param height: The number of LEDs laid out vertically.
+    :type height: int
+    :param cascaded: The number of LEDs in a single strip - if supplied, this
+        overrides ``width`` and ``height``.
+    :type cascaded: int
+    """
+    def __init__(self, width=8, height=1, cascaded=None):
+        if cascaded is not None:
+            width = cascaded
+            height = 1
+
+        self.width = width
+        self.height = height
+        self.cascaded = width * height
+        self.leds = [(0, 0, 0, 0)] * self.cascaded
+
+    def feed(self, data):
+        """
+        Applies a single (complete) transfer.
+
+        :raises ValueError: If the transfer is not a well-formed frame.
+        """
+        n = self.cascaded
+        end = 4 + 4 * n
+        if len(data) < end + ceil(n / 16):
+            raise ValueError(f"Transfer too short for {n} LEDs: {len(data)} bytes")
+        if any(data[0:4]):
+            raise ValueError("Missing start frame")
+
+        leds = []
+        for i in range(4, end, 4):
+            header, blue, green, red = data[i:i + 4]
+            if header & 0xE0 != 0xE0:
+                raise ValueError(f"Invalid LED frame header 0x{header:02X} at offset {i}")
+            leds.append((header & 0x1F, red, green, blue))
+        self.leds = leds
+
+    def replay(self, transactions):
+        """
+        Applies every recorded data transfer in turn.
+
+        :returns: The decoder itself.
+        """
+        for t in transactions:
+            if t.kind == "data":
+                self.feed(t.payload)
+        return self
+
+    def image(self):
+        """
+        The LED colors, in physical order (row by row), without brightness.
+
+        :rtype: PIL.Image.Image
+        """
+        image = Image.new("RGB", (self.width, self.height))
+        image.putdata([(r, g, b) for _, r, g, b in self.leds])
+        return image
+
+    def brightness(self):
+        """
+        The 5-bit brightness of every LED, in physical order.
+
+        :rtype: list[int]
+        """
+        return [brightness for brightness, _, _, _ in self.leds]
+
+
+class unicornhathd_decoder(object):
+    """
+    Decodes Unicorn HAT HD data transfers: a ``0x72`` start of frame byte,
+    followed by red, green and blue for each of the 16x16 LEDs.
+    """
+    width = 16
+    height = 16
+
+    def __init__(self):
+        self.rgb = bytes(self.width * self.height * 3)
+
+    def feed(self, data):
+        """
+        Applies a single transfer.
+
+        :raises ValueError: If the transfer is not a well-formed frame.
+        """
+        if len(data) != 1 + len(self.rgb) or data[0] != 0x72:
+            raise ValueError("Invalid Unicorn HAT HD frame")
+        self.rgb = bytes(data[1:])
+
+    def replay(self, transactions):
+        """
+        Applies every recorded data transfer in turn.
+
+        :returns: The decoder itself.
+        """
+        for t in transactions:
+            if t.kind == "data":
+                self.feed(t.payload)
+        return self
+
+    def image(self):
+        """
+        The LED colors (after brightness scaling), in physical order.
+
+        :rtype: PIL.Image.Image
+        """
+        return Image.frombytes("RGB", (self.width, self.height), self.rgb)
+
+
+class ws281x_decoder(object):
+    """
+    Decodes the LED colors rendered by a ws281x interface (as recorded by
+    :py:class:`ws281x`): native 32-bit ``0x00RRGGBB`` values, one per LED in
+    strip order.
+
+    :param width: The number of LEDs laid out horizontally.
+    :type width: int
+    :param height: The number of LEDs laid out vertically.
+    :type height: int
+    """
+    def __init__(self, width=8, height=4):
+        self.width = width
+        self.height = height
+        self.colors = [0] * (width * height)
+
+    def feed(self, data):
+        """
+        Applies a single render.
+        """
+        colors = list(memoryview(bytes(data)).cast(_UINT32))
+        if len(colors) != len(self.colors):
+            raise ValueError(f"Expected {len(self.colors)} LEDs, got {len(colors)}")
+        self.colors = colors
+
+    def replay(self, transactions):
+        """
+        Applies every recorded render in turn.
+
+        :returns: The decoder itself.
+        """
+        for t in transactions:
+            if t.kind == "render":
+                self.feed(t.payload)
+        return self
+
+    def image(self):
+        """
+        The LED colors, in strip order (row by row).
+
+        :rtype: PIL.Image.Image
+        """
+        image = Image.new("RGB", (self.width, self.height))
+        image.putdata([(c >> 16 & 0xFF, c >> 8 & 0xFF, c & 0xFF) for c in self.colors])
+        return image
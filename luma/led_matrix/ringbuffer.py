@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Shared-memory ring buffer of frames, through which other processes (a video
+decoder, a game, a web backend, ...) can publish frames to a device owned by
+a :py:mod:`luma.led_matrix.frameserver`. This module only uses the standard
+library, so producers need neither Pillow nor the device drivers::
+
+    from luma.led_matrix.ringbuffer import ringbuffer
+
+    with ringbuffer("luma_led_matrix") as ring:
+        while True:
+            ring.publish(render(ring.width, ring.height))
+
+A frame is the raw pixel data of an image of the device's mode and size, as
+returned by :py:meth:`PIL.Image.Image.tobytes`: three bytes (red, green,
+blue) per pixel for ``RGB``, four (red, green, blue, alpha) for ``RGBA``, and
+for ``1`` one bit per pixel, most significant bit first, with every row
+padded to a whole number of bytes. Pixels are in rows, from the top-left.
+
+Every published frame is numbered, and each slot records the number of the
+frame it holds, so a reader can tell whether a slot was overwritten while it
+was being read. There should only be one producer at a time.
+
+.. versionadded:: 1.10.0
+"""
+
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+
+__all__ = ["ringbuffer", "frame_size"]
+
+
+_MAGIC = b"LUMARING"
+_VERSION = 1
+
+# magic, version, number of slots, mode, width, height, frame size (bytes)
+_HEADER = struct.Struct("<8sHH4sHHI")
+
+# Number of the latest complete frame (0 if none), and of the frame held by a
+# slot (0 while it is being written)
+_SEQUENCE = struct.Struct("<Q")
+_LATEST = _HEADER.size
+_SLOTS = _LATEST + _SEQUENCE.size
+
+_BITS_PER_PIXEL = {"1": 1, "L": 8, "RGB": 24, "RGBA": 32}
+
+# Names of the ring buffers created by this process
+_created = set()
+
+
+def _attach(name):
+    """
+    Attaches to a shared memory block created by another process, without
+    (as Python does by default before 3.13) arranging for it to be destroyed
+    when this process exits.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        memory = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and memory.name not in _created:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+def frame_size(mode, size):
+    """
+    The number of bytes in a frame of the given mode and size.
+
+    :param mode: The image mode: ``1``, ``L``, ``RGB`` or ``RGBA``.
+    :type mode: str
+    :param size: The width and height of the image.
+    :type size: tuple(int, int)
+    :rtype: int
+    """
+    if mode not in _BITS_PER_PIXEL:
+        raise ValueError(f"Unsupported mode: {mode}")
+    width, height = size
+    return (width * _BITS_PER_PIXEL[mode] + 7) // 8 * height
+
+
+class ringbuffer(object):
+    """
+    Attaches to an existing ring buffer, as created by :py:meth:`create`.
+
+    :param name: The name of the shared memory block.
+    :type name: str
+    :raises ValueError: If the shared memory is not a ring buffer.
+    """
+    def __init__(self, name, _memory=None):
+        self._memory = _memory or _attach(name)
+        self.name = self._memory.name
+        buf = self._memory.buf
+
+        magic, version, slots, mode, width, height, size = _HEADER.unpack_from(buf)
+        if magic != _MAGIC or version != _VERSION:
+            if _memory is None:
+                self._memory.close()
+            raise ValueError(f"Not a frame ring buffer: {name}")
+
+        self.slots = slots
+        self.mode = mode.rstrip(b"\0").decode("ascii")
+        self.width = width
+        self.height = height
+        self.size = (width, height)
+        self.frame_size = size
+        self._stride = _SEQUENCE.size + (size + 7) // 8 * 8
+
+    @classmethod
+    def create(cls, mode, size, slots=3, name=None):
+        """
+        Creates a new ring buffer.
+
+        :param mode: The image mode of the frames.
+        :type mode: str
+        :param size: The width and height of the frames.
+        :type size: tuple(int, int)
+        :param slots: The number of frames held; at least two, so that a frame
+            can be written while the previous one is read.
+        :type slots: int
+        :param name: The name of the shared memory block; by default, a unique
+            name is chosen.
+        :type name: str
+        :rtype: ringbuffer
+        """
+        assert slots >= 2
+        length = frame_size(mode, size)
+        stride = _SEQUENCE.size + (length + 7) // 8 * 8
+        memory = shared_memory.SharedMemory(name=name, create=True, size=_SLOTS + slots * stride)
+        _created.add(memory.name)
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, _VERSION, slots, mode.encode("ascii"),
+                          size[0], size[1], length)
+        return cls(memory.name, _memory=memory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    @property
+    def sequence(self):
+        """
+        The number of the latest complete frame, or ``0`` if none has been
+        published yet.
+        """
+        return _SEQUENCE.unpack_from(self._memory.buf, _LATEST)[0]
+
+    def publish(self, data):
+        """
+        Writes a frame into the next slot, and makes it the latest.
+
+        :param data: The raw pixel data: any bytes-like object of exactly
+            :py:attr:`frame_size` bytes.
+        :returns: The number of the frame.
+        :rtype: int
+        :raises ValueError: If the data is the wrong size.
+        """
+        with memoryview(data) as view, view.cast("B") as data:
+            if len(data) != self.frame_size:
+                raise ValueError(f"Expected {self.frame_size} bytes, got {len(data)}")
+
+            buf = self._memory.buf
+            sequence = self.sequence + 1
+            offset = _SLOTS + sequence % self.slots * self._stride
+            _SEQUENCE.pack_into(buf, offset, 0)
+            start = offset + _SEQUENCE.size
+            buf[start:start + self.frame_size] = data
+            _SEQUENCE.pack_into(buf, offset, sequence)
+            _SEQUENCE.pack_into(buf, _LATEST, sequence)
+            return sequence
+
+    def holds(self, sequence):
+        """
+        Whether the frame numbered ``sequence`` is (still) in its slot.
+
+        :rtype: bool
+        """
+        offset = _SLOTS + sequence % self.slots * self._stride
+        return sequence > 0 and _SEQUENCE.unpack_from(self._memory.buf, offset)[0] == sequence
+
+    def frame(self, sequence):
+        """
+        The frame numbered ``sequence``, read in place from its slot: check
+        with :py:meth:`holds` that it has not been overwritten once done with
+        it, and release it before closing the ring buffer.
+
+        :returns: A view of the frame's data, or ``None`` if it is no longer
+            held.
+        :rtype: memoryview
+        """
+        if not self.holds(sequence):
+            return None
+        start = _SLOTS + sequence % self.slots * self._stride + _SEQUENCE.size
+        return self._memory.buf[start:start + self.frame_size]
+
+    def close(self):
+        """
+        Detaches from the ring buffer.
+        """
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Destroys the ring buffer, once every process has closed it.
+        """
+        _created.discard(self.name)
+        self._memory.unlink()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Drives a device at a steady frame rate. Rather than sleeping for a fixed time
+after each frame (so the rate drifts by however long rendering, encoding and
+transmission took), every frame is given a deadline on a fixed schedule, and
+the scheduler sleeps only for the time remaining until it::
+
+    from luma.core.render import canvas
+    from luma.led_matrix.scheduler import scheduler
+
+    def render(frame):
+        with canvas(device) as draw:
+            draw.point((frame % device.width, 0), fill="white")
+
+    scheduler(device, fps=30).run(render)
+
+If a frame overruns, the frames whose time has passed are skipped, so the
+animation keeps to the schedule rather than falling further and further
+behind.
+
+.. versionadded:: 1.10.0
+"""
+
+from time import perf_counter, sleep
+
+from luma.led_matrix.instrumentation import rolling_window
+
+
+__all__ = ["deadlines", "scheduler"]
+
+
+class deadlines(object):
+    """
+    Keeps the schedule of frame deadlines followed by the :py:class:`scheduler`,
+    the :py:class:`~luma.led_matrix.aio.pacer` and the
+    :py:class:`~luma.led_matrix.animation.player`. The first frame is due as
+    soon as it is asked for, and every other frame when the one before it has
+    run for its duration, so the time taken to show a frame never delays the
+    ones after it. Only the timekeeping is done here: the caller sleeps (or
+    awaits) for the delay it is given.
+
+    :param clock: Returns the current (monotonic) time, in seconds.
+    :param drop_late: If ``True``, a frame is dropped if its whole duration
+        has passed by the time it is asked for.
+    :type drop_late: bool
+    """
+    def __init__(self, clock, drop_late=True):
+        self._clock = clock
+        self.drop_late = drop_late
+        self.frame = 0
+        self.due = None
+
+    def delay(self, duration):
+        """
+        Works out how long until the next frame is due.
+
+        :param duration: How long the frame lasts, in seconds.
+        :type duration: float
+        :returns: The time until the frame is due, in seconds (negative if it
+            is late), or ``None`` if it has been dropped, in which case the
+            schedule has moved on to the frame after it.
+        :rtype: float
+        """
+        now = self._clock()
+        if self.due is None:
+            self.due = now
+
+        if self.drop_late and now >= self.due + duration:
+            self.advance(duration)
+            return None
+        return self.due - now
+
+    def advance(self, duration):
+        """
+        Moves the schedule on to the next frame, once the current one has been
+        shown.
+
+        :param duration: How long the current frame lasts, in seconds.
+        :type duration: float
+        """
+        self.frame += 1
+        self.due += duration
+
+
+class scheduler(object):
+    """
+    Runs a render function at a target frame rate, measuring how long each
+    frame takes and how closely it keeps to the schedule.
+
+    :param device: The device to drive: any device with a ``display()`` method
+        (or a virtual device, such as a ``neosegment``, when the render function
+        updates it itself).
+    :param fps: The target frame rate, in frames per second.
+    :type fps: float
+    :param drop_late: If ``True``, frames whose deadline has passed by a whole
+        frame interval or more are skipped; if ``False``, every frame is shown,
+        as soon as possible after its deadline.
+    :type drop_late: bool
+    :param window: The number of most recent frames the timing statistics are
+        computed over.
+    :type window: int
+    """
+    def __init__(self, device, fps, drop_late=True, window=1000):
+        assert fps > 0
+        self.device = device
+        self.fps = fps
+        self.interval = 1.0 / fps
+        self.drop_late = drop_late
+        self._window = window
+        self._stopped = False
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the statistics.
+        """
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self.overruns = 0
+        self._work = rolling_window(self._window, 1e-6)
+        self._jitter = rolling_window(self._window, 1e-6)
+
+    def stop(self):
+        """
+        Stops :py:meth:`run` (e.g. from another thread, or from the render
+        function) before the next frame.
+        """
+        self._stopped = True
+
+    def run(self, render, frames=None):
+        """
+        Calls the render function for each frame when it is due, and displays
+        the image it returns.
+
+        :param render: Called with the frame number (counting from 0, and
+            including any dropped frames, so it can be used to work out the
+            animation's position). It returns the image to display, or
+            ``None`` if it has already updated the device itself (e.g. by
+            drawing on a ``canvas``).
+        :param frames: The number of frames (shown or dropped) after which to
+            return; by default, it runs until :py:meth:`stop` is called.
+        :type frames: int
+        """
+        self._stopped = False
+        device = self.device
+        interval = self.interval
+        pace = deadlines(perf_counter, self.drop_late)
+
+        while not self._stopped and (frames is None or pace.frame < frames):
+            delay = pace.delay(interval)
+            if delay is None:
+                self.frames_dropped += 1
+                continue
+            if delay > 0:
+                sleep(delay)
+
+            start = perf_counter()
+            self._jitter.add(start - pace.due)
+            image = render(pace.frame)
+            if image is not None:
+                device.display(image)
+
+            work = perf_counter() - start
+            self._work.add(work)
+            if work > interval:
+                self.overruns += 1
+            self.frames_shown += 1
+            pace.advance(interval)
+
+    def stats(self):
+        """
+        Summarizes the frames run since the scheduler was created (or
+        :py:meth:`reset`). The ``work`` done for each frame (rendering,
+        encoding and transmitting it), and the ``jitter`` (how late each frame
+        started after its deadline) are reported in seconds over the rolling
+        window, as their ``count``, ``mean``, ``min``, ``max``, ``p50``,
+        ``p90`` and ``p99`` percentiles, and a ``histogram`` of ``(upper
+        bound, count)`` pairs with power-of-two bucket sizes (starting at 1µs).
+
+        :returns: The numbers of frames shown and dropped, the number of
+            ``overruns`` (frames whose work took longer than the frame
+            interval), and the timing statistics.
+        :rtype: dict
+        """
+        return {
+            "fps": self.fps,
+            "frames_shown": self.frames_shown,
+            "frames_dropped": self.frames_dropped,
+            "overruns": self.overruns,
+            "work": self._work.snapshot(),
+            "jitter": self._jitter.snapshot()
+        }
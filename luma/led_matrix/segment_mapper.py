@@ -2,6 +2,9 @@
 # Copyright (c) 2017-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import re
+from functools import lru_cache
+
 _DIGITS = {
     ' ': 0x00,
     '!': 0xa0,
@@ -102,29 +105,156 @@ _DIGITS = {
 }
 
 
-def regular(text, notfound="_"):
-    undefined = _DIGITS[notfound] if notfound is not None else None
-    for char in iter(text):
-        digit = _DIGITS.get(char, undefined)
-        if digit is not None:
-            yield digit
+# Placeholder for characters which have no mapping, and are to be dropped
+_UNMAPPED = "\uffff"
 
+# Segment wired to each bit of a segment byte, most significant first
+_SEGMENTS = "pabcdefg"
 
-def dot_muncher(text, notfound="_"):
-    if not text:
-        return
+# A character followed by a decimal point, into which the point is merged
+_DOT = re.compile("([^\x80\uffff])\x80")
+
+
+class _translation(dict):
+    """
+    Translation table from characters to their segment byte (as a single
+    character string), for use with :py:meth:`str.translate`.
+    """
+    def __init__(self, notfound):
+        undefined = _DIGITS[notfound] if notfound is not None else None
+        super(_translation, self).__init__(
+            (ord(char), chr(digit)) for char, digit in _DIGITS.items())
+        self.undefined = _UNMAPPED if undefined is None else chr(undefined)
+
+    def __missing__(self, key):
+        return self.undefined
+
+
+@lru_cache(maxsize=None)
+def _table(notfound):
+    return _translation(notfound)
+
+
+def _merge_dot(match):
+    return chr(ord(match.group(1)) | 0x80)
+
+
+@lru_cache(maxsize=512)
+def _encode(text, notfound, merge_dots):
+    mapped = text.translate(_table(notfound))
+    if merge_dots and "\x80" in mapped:
+        mapped = _DOT.sub(_merge_dot, mapped)
+    if _UNMAPPED in mapped:
+        mapped = mapped.replace(_UNMAPPED, "")
+    return mapped.encode("latin-1")
+
+
+def _text(text):
+    return text if isinstance(text, str) else "".join(text)
+
+
+def regular_bytes(text, notfound="_"):
+    """
+    Maps every character of ``text`` to its seven-segment representation in
+    one go, with recent results being cached.
+
+    :param text: The text to map.
+    :type text: str
+    :param notfound: The character to substitute for any which cannot be
+        represented, or ``None`` to leave them out.
+    :type notfound: str
+    :returns: One segment byte per character.
+    :rtype: bytes
+
+    .. versionadded:: 1.10.0
+    """
+    return _encode(_text(text), notfound, False)
+
+
+def dot_muncher_bytes(text, notfound="_"):
+    """
+    As per :py:func:`regular_bytes`, except that decimal points are merged into
+    the character which precedes them, in the same way as
+    :py:func:`dot_muncher`.
 
-    undefined = _DIGITS[notfound] if notfound is not None else None
-    last = None
-    for char in iter(text):
-        curr = _DIGITS.get(char, undefined)
+    :param text: The text to map.
+    :type text: str
+    :param notfound: The character to substitute for any which cannot be
+        represented, or ``None`` to leave them out.
+    :type notfound: str
+    :returns: One segment byte per character (decimal points merged).
+    :rtype: bytes
 
-        if curr == 0x80:
-            yield curr | (last or 0)
-        elif last != 0x80 and last is not None:
-            yield last
+    .. versionadded:: 1.10.0
+    """
+    return _encode(_text(text), notfound, True)
 
-        last = curr
 
-    if curr != 0x80 and curr is not None:
-        yield curr
+def cache_info():
+    """
+    Reports the hits, misses and current size of the cache of recently mapped
+    strings used by :py:func:`regular_bytes` and :py:func:`dot_muncher_bytes`
+    (and therefore :py:func:`regular` and :py:func:`dot_muncher`).
+
+    :rtype: functools._CacheInfo
+
+    .. versionadded:: 1.10.0
+    """
+    return _encode.cache_info()
+
+
+def cache_clear():
+    """
+    Empties the cache of recently mapped strings, and resets its statistics.
+
+    .. versionadded:: 1.10.0
+    """
+    _encode.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def remap_table(order):
+    """
+    Builds a translation table which rewires segment bytes (as produced by
+    :py:func:`regular_bytes` and :py:func:`dot_muncher_bytes`) to suit
+    seven-segment hardware whose segments are connected in a different order.
+    Apply it to a whole byte string at once with :py:meth:`bytes.translate`.
+
+    The order is given as eight characters, one per output bit from the most
+    significant to the least: each names the segment (``a`` - ``g``, or ``p``
+    for the decimal point) to be wired to that bit, or is ``-`` to leave the
+    bit unset. The standard order is therefore ``"pabcdefg"``, and @msurguy's
+    NeoSegments use ``"-bafgcde"``:
+
+    .. code:: python
+
+        table = remap_table("-bafgcde")
+        data = regular_bytes("HELLO").translate(table)
+
+    :param order: The segment wired to each output bit, most significant first.
+    :type order: str
+    :returns: A 256-byte translation table.
+    :rtype: bytes
+    :raises ValueError: If the order is not eight characters long, or names an
+        unknown segment or the same segment twice.
+
+    .. versionadded:: 1.10.0
+    """
+    segments = order.replace("-", "")
+    if len(order) != 8 or len(set(segments)) != len(segments) or \
+            not set(segments) <= set(_SEGMENTS):
+        raise ValueError(f"Invalid segment order: {order!r}")
+
+    # (source bit, destination bit) for every wired segment
+    wiring = [(7 - _SEGMENTS.index(segment), 7 - bit)
+              for bit, segment in enumerate(order) if segment != "-"]
+    return bytes(sum((byte >> src & 0x01) << dst for src, dst in wiring)
+                 for byte in range(256))
+
+
+def regular(text, notfound="_"):
+    yield from regular_bytes(text, notfound)
+
+
+def dot_muncher(text, notfound="_"):
+    yield from dot_muncher_bytes(text, notfound)
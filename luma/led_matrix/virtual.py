@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Virtual display abstractions, specialized for the devices in
+:py:mod:`luma.led_matrix.device`.
+"""
+
+import luma.core.virtual
+
+
+__all__ = ["sevensegment"]
+
+
+class sevensegment(luma.core.virtual.sevensegment):
+    """
+    Drop-in replacement for :py:class:`luma.core.virtual.sevensegment`: if the
+    wrapped device can write segment bytes directly (e.g.
+    :py:class:`~luma.led_matrix.device.max7219`), text updates are passed
+    straight through, rather than being drawn onto a canvas only to be
+    unpacked again by the device. Other devices are drawn onto as normal.
+
+    :param device: A device instance.
+    :param segment_mapper: An optional function that maps strings into the
+        correct representation for the 7-segment physical layout. If not
+        provided, the default mapper from compatible devices is used instead.
+    :param undefined: The default character to substitute when an unrenderable
+        character is supplied to the text property.
+    :type undefined: char
+
+    .. versionadded:: 1.10.0
+    """
+    def _flush(self, buf):
+        display_segments = getattr(self.device, "display_segments", None)
+        if display_segments is None:
+            return super(sevensegment, self)._flush(buf)
+
+        data = bytearray(self.segment_mapper(buf, notfound=self.undefined))
+        data = data.ljust(self._bufsize, b'\0')
+
+        if len(data) > self._bufsize:
+            raise OverflowError(
+                f"Device's capabilities insufficient for value '{buf}'")
+
+        display_segments(data)
@@ -2,11 +2,12 @@
 # Copyright (c) 2017-2020 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import random
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
-from PIL import ImageChops
+from PIL import Image, ImageChops
 
 import luma.core.error
 
@@ -19,6 +20,7 @@ def setup_function(function):
     """
     serial.reset_mock()
     serial.command.side_effect = None
+    serial.data.side_effect = None
 
 
 def assert_invalid_dimensions(deviceType, serial_interface, width, height):
@@ -53,3 +55,58 @@ def get_reference_image(fname):
 def assert_identical_image(reference, target):
     bbox = ImageChops.difference(reference, target).getbbox()
     assert bbox is None
+
+
+def assert_same_image(expected, actual):
+    """
+    Assert two images of the same size show the same colors, whatever their
+    modes.
+    """
+    assert expected.size == actual.size
+    assert ImageChops.difference(expected.convert("RGB"), actual.convert("RGB")).getbbox() is None
+
+
+def random_image(mode, size, seed=0):
+    """
+    Create an image of random pixels, the same for the same ``seed``.
+
+    :param mode: Image mode, e.g. ``"1"`` or ``"RGBA"``.
+    :type mode: str
+    :param size: Image size.
+    :type size: tuple(int, int)
+    :param seed: Random seed.
+    :type seed: int
+    """
+    rnd = random.Random(seed)
+    image = Image.new(mode, size)
+    if mode == "1":
+        image.putdata([rnd.getrandbits(1) for _ in range(size[0] * size[1])])
+    else:
+        image.putdata([tuple(rnd.getrandbits(8) for _ in mode) for _ in range(size[0] * size[1])])
+    return image
+
+
+class fake_clock(object):
+    """
+    Stands in for ``perf_counter`` and ``sleep``: time only moves on when
+    something sleeps (or a test advances ``now`` itself), and every sleep is
+    recorded.
+    """
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+    def install(self, monkeypatch, module):
+        """
+        Patch ``module``'s ``perf_counter`` and ``sleep`` with this clock.
+        """
+        monkeypatch.setattr(module, "perf_counter", self.perf_counter)
+        monkeypatch.setattr(module, "sleep", self.sleep)
+        return self
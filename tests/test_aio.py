@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import asyncio
+import threading
+import time
+
+from PIL import Image
+
+from luma.led_matrix.aio import pacer
+from luma.led_matrix.device import max7219, ws2812, apa102
+from luma.led_matrix.recording import serial, ws281x, max7219_decoder, ws281x_decoder
+
+from helpers import random_image
+
+
+class slow_serial(serial):
+    """
+    Serial interface whose data transfers take a while, and which keeps track
+    of how many are in progress at once.
+    """
+    def __init__(self, delay=0.002):
+        super(slow_serial, self).__init__()
+        self.delay = delay
+        self.active = 0
+        self.most_active = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def data(self, data):
+        with self._lock:
+            self.active += 1
+            self.most_active = max(self.most_active, self.active)
+            self.threads.add(threading.current_thread())
+        time.sleep(self.delay)
+        super(slow_serial, self).data(data)
+        with self._lock:
+            self.active -= 1
+
+
+def test_display_async_matches_display():
+    sync_serial, async_serial = serial(), serial()
+    sync = apa102(sync_serial, width=8, height=2)
+    device = apa102(async_serial, width=8, height=2)
+    images = [random_image("RGBA", device.size, seed) for seed in range(3)]
+
+    async def main():
+        for image in images:
+            await device.display_async(image)
+
+    for image in images:
+        sync.display(image)
+    asyncio.run(main())
+
+    assert [t.payload for t in async_serial.transactions] == \
+        [t.payload for t in sync_serial.transactions]
+
+
+def test_ws2812_display_async():
+    ws = ws281x()
+    device = ws2812(ws, width=4, height=2)
+    ws.clear()
+    asyncio.run(device.display_async(Image.new("RGB", device.size, "red")))
+    assert ws281x_decoder(width=4, height=2).replay(ws.transactions).colors == [0xFF0000] * 8
+
+
+def test_control_async():
+    interface = serial()
+    device = max7219(interface, cascaded=2)
+
+    async def main():
+        await device.contrast_async(0x70)
+        await device.hide_async()
+        decoder = max7219_decoder(cascaded=2).replay(interface.transactions)
+        assert decoder.intensity(1) == 0x07
+        assert decoder.shutdown(1)
+
+        await device.show_async()
+        decoder = max7219_decoder(cascaded=2).replay(interface.transactions)
+        assert not decoder.shutdown(1)
+
+    asyncio.run(main())
+
+
+def test_runs_off_loop():
+    interface = slow_serial(delay=0.05)
+    device = apa102(interface, width=8, height=1)
+    interface.threads.clear()
+    ticks = []
+    done = threading.Event()
+
+    async def ticker():
+        while not done.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await device.display_async(random_image("RGBA", device.size))
+        done.set()
+        await task
+
+    asyncio.run(main())
+
+    assert threading.main_thread() not in interface.threads
+    assert len(ticks) > 3
+
+
+def test_writes_are_serialized():
+    interface = slow_serial()
+    device = max7219(interface, cascaded=2)
+    images = [random_image("1", device.size, seed) for seed in range(5)]
+    interface.clear()
+
+    async def main():
+        await asyncio.gather(*[device.display_async(image) for image in images])
+
+    asyncio.run(main())
+    assert interface.most_active == 1
+
+    # Each frame is sent whole, one after the other, in the order requested
+    rows = [t.payload for t in interface.transactions]
+    assert len(rows) == 5 * 8
+    for n, image in enumerate(images):
+        decoder = max7219_decoder(cascaded=2)
+        decoder.replay(interface.transactions[:8 * (n + 1)])
+        assert decoder.image() == image.convert("1")
+
+
+def test_independent_devices_run_concurrently():
+    interfaces = [slow_serial(delay=0.05) for _ in range(2)]
+    devices = [apa102(interface, width=8, height=1) for interface in interfaces]
+
+    async def main():
+        await asyncio.gather(*[device.display_async(random_image("RGBA", device.size))
+                               for device in devices])
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - start < 0.095
+
+
+def test_device_used_from_several_loops():
+    interface = serial()
+    device = max7219(interface, cascaded=2)
+    image = random_image("1", device.size)
+
+    for _ in range(2):
+        interface.clear()
+        asyncio.run(device.display_async(image))
+        assert max7219_decoder(cascaded=2).replay(interface.transactions).image() == image
+
+
+def test_pacer():
+    async def main():
+        paced = pacer(100, frames=5)
+        start = time.perf_counter()
+        frames = [frame async for frame in paced]
+        return frames, time.perf_counter() - start, paced.missed
+
+    frames, elapsed, missed = asyncio.run(main())
+    assert frames == [0, 1, 2, 3, 4]
+    assert elapsed >= 0.039
+    assert missed == 0
+
+
+def test_pacer_skips_missed_frames():
+    async def main():
+        paced = pacer(100, frames=10)
+        frames = []
+        async for frame in paced:
+            frames.append(frame)
+            if frame == 2:
+                time.sleep(0.045)
+        return frames, paced.missed
+
+    frames, missed = asyncio.run(main())
+    assert frames[:3] == [0, 1, 2]
+    assert missed >= 2
+    assert len(frames) == 10 - missed
+    assert frames == sorted(set(frames))
+
+
+def test_pacers_at_independent_rates():
+    async def run(fps, frames):
+        ticks = []
+        async for _ in pacer(fps, frames):
+            ticks.append(asyncio.get_running_loop().time())
+        return ticks
+
+    async def main():
+        return await asyncio.gather(run(200, 20), run(50, 5))
+
+    fast, slow = asyncio.run(main())
+    assert len(fast) == 20
+    assert len(slow) == 5
+    assert abs((fast[-1] - fast[0]) - 0.095) < 0.04
+    assert abs((slow[-1] - slow[0]) - 0.08) < 0.04
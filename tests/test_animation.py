@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+from PIL import Image, ImageDraw
+
+import luma.led_matrix.animation
+from luma.led_matrix.animation import compile_animation, animation, player
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, UNICORN_HAT
+from luma.led_matrix.recording import serial, ws281x
+
+from helpers import fake_clock
+
+
+def frames(device, count=6):
+    images = []
+    for i in range(count):
+        image = Image.new(device.mode, device.size)
+        draw = ImageDraw.Draw(image)
+        draw.line((i, 0, device.width - 1, device.height - 1 - i % device.height), fill="white")
+        images.append(image)
+    return images
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return fake_clock().install(monkeypatch, luma.led_matrix.animation)
+
+
+@pytest.mark.parametrize("factory,interface", [
+    (lambda s: max7219(s, cascaded=4, rotate=1, block_orientation=90), serial),
+    (lambda s: max7219(s, cascaded=4, delta_update=True), serial),
+    (lambda s: apa102(s, width=8, height=4, rotate=2), serial),
+    (lambda s: unicornhathd(s, rotate=3), serial),
+    (lambda ws: ws2812(ws, width=8, height=8, mapping=UNICORN_HAT), ws281x),
+    (lambda ws: ws2812(ws, width=8, height=8, rotate=1), lambda: ws281x(led_buffer=False)),
+])
+def test_playback_matches_display(factory, interface, clock, tmp_path):
+    expected, actual = interface(), interface()
+    reference = factory(expected)
+    device = factory(actual)
+    images = frames(device)
+
+    compile_animation(device, images).save(tmp_path / "test.anim")
+    for image in images:
+        reference.display(image)
+
+    expected.clear()
+    actual.clear()
+    for image in images:
+        reference.display(image)
+    with animation.load(tmp_path / "test.anim") as anim:
+        player(device, anim).play()
+
+    assert [t.payload for t in actual.transactions] == [t.payload for t in expected.transactions]
+
+
+def test_compile_deduplicates(clock):
+    device = max7219(serial(), cascaded=2)
+    images = frames(device, 3)
+    anim = compile_animation(device, [images[0], images[1], (images[0], 0.5), images[2], images[1]],
+                             frame_duration=0.1)
+
+    assert len(anim) == 5
+    assert [index for index, _ in anim.entries] == [0, 1, 0, 2, 1]
+    assert anim.frame_size == 16
+    assert anim.duration == pytest.approx(0.9)
+    assert [duration for _, duration in anim.frames()] == [0.1, 0.1, 0.5, 0.1, 0.1]
+
+
+@pytest.mark.parametrize("factory", [
+    lambda s: apa102(s, cascaded=4, frame_cache=4096),
+    lambda s: unicornhathd(s, frame_cache=4096),
+])
+def test_compile_leaves_device_untouched(factory):
+    interface = serial()
+    device = factory(interface)
+    device.instrument()
+    red = Image.new(device.mode, device.size, "red")
+    device.display(red)
+    cached = len(device.frame_cache)
+
+    compile_animation(device, [Image.new(device.mode, device.size, "blue")])
+    assert device.stats()["frames"] == 1
+    assert len(device.frame_cache) == cached
+
+    # contrast() redisplays what is on screen, not the compiled frame
+    interface.clear()
+    device.contrast(0xFF)
+    reference = serial()
+    expected = factory(reference)
+    expected.display(red)
+    expected.contrast(0xFF)
+    assert interface.transactions[-1].payload == reference.transactions[-1].payload
+
+
+def test_save_load(tmp_path):
+    device = apa102(serial(), cascaded=10)
+    anim = compile_animation(device, frames(device, 4), frame_duration=0.25)
+    path = tmp_path / "test.anim"
+    anim.save(path)
+
+    loaded = animation.load(path)
+    assert (loaded.device, loaded.width, loaded.height) == ("apa102", 10, 1)
+    assert loaded.entries == anim.entries
+    assert list(loaded.frames()) == list(anim.frames())
+    loaded.close()
+    assert len(loaded) == 0
+
+
+@pytest.mark.parametrize("data,message", [
+    (b"", "cannot mmap an empty file"),
+    (b"JUNK" * 20, "Not an animation file"),
+])
+def test_load_invalid(tmp_path, data, message):
+    path = tmp_path / "bad.anim"
+    path.write_bytes(data)
+    with pytest.raises(ValueError) as ex:
+        animation.load(path)
+    assert message in str(ex.value)
+
+
+def test_load_truncated(tmp_path):
+    device = max7219(serial(), cascaded=1)
+    path = tmp_path / "test.anim"
+    compile_animation(device, frames(device, 2)).save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError) as ex:
+        animation.load(path)
+    assert "Truncated animation file" in str(ex.value)
+
+
+def test_player_wrong_device():
+    anim = compile_animation(max7219(serial(), cascaded=2), [])
+    with pytest.raises(ValueError) as ex:
+        player(max7219(serial(), cascaded=4), anim)
+    assert "Animation was compiled for a 16 x 8 max7219" in str(ex.value)
+
+
+def test_player_schedule(clock):
+    recorder = serial()
+    device = max7219(recorder, cascaded=1)
+    anim = compile_animation(device, [(image, 0.25) for image in frames(device, 3)])
+    recorder.clear()
+
+    p = player(device, anim, loops=2)
+    p.play()
+    assert p.frames_played == 6
+    assert p.frames_dropped == 0
+    assert clock.sleeps == [0.25] * 5
+    assert len(recorder.transactions) == 6 * 8
+
+
+def test_player_drops_late_frames(clock, monkeypatch):
+    device = max7219(serial(), cascaded=1)
+    anim = compile_animation(device, frames(device, 4), frame_duration=0.1)
+
+    def slow_transmit(data):
+        clock.now += 0.25
+    monkeypatch.setattr(device, "_transmit", slow_transmit)
+
+    p = player(device, anim)
+    p.play()
+    assert p.frames_played == 2
+    assert p.frames_dropped == 2
+
+
+def test_player_stop(clock):
+    device = max7219(serial(), cascaded=1)
+    anim = compile_animation(device, frames(device, 3))
+    p = player(device, anim, loops=0)
+
+    def transmit(data):
+        if p.frames_played == 7:
+            p.stop()
+    device._transmit = transmit
+    p.play()
+    assert p.frames_played == 8
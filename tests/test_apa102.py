@@ -4,7 +4,11 @@
 # See LICENSE.rst for details.
 
 from math import ceil
-from luma.led_matrix.device import apa102
+
+import pytest
+from PIL import Image
+
+from luma.led_matrix.device import apa102, UNICORN_HAT
 from luma.core.render import canvas
 
 from helpers import serial, setup_function  # noqa: F401
@@ -22,7 +26,7 @@ def test_init_cascaded():
     device = apa102(serial, cascaded=7)
     assert device.width == 7
     assert device.height == 1
-    serial.data.assert_called_with(start_frame() + [0xE0, 0, 0, 0] * 7 + end_frame(7))
+    serial.data.assert_called_with(bytes(start_frame() + [0xE0, 0, 0, 0] * 7 + end_frame(7)))
 
 
 def test_hide():
@@ -46,7 +50,7 @@ def test_contrast():
     serial.reset_mock()
     device.contrast(0x6B)
     serial.data.assert_called_with(
-        start_frame() + [0xE6, 0, 0, 0xFF] * 6 + end_frame(6)
+        bytes(start_frame() + [0xE6, 0, 0, 0xFF] * 6 + end_frame(6))
     )
 
 
@@ -58,5 +62,63 @@ def test_display():
         draw.rectangle(device.bounding_box, outline=(0x11, 0x22, 0x33, 0x44))
 
     serial.data.assert_called_with(
-        start_frame() + [0xE4, 0x33, 0x22, 0x11] * 4 + end_frame(4)
+        bytes(start_frame() + [0xE4, 0x33, 0x22, 0x11] * 4 + end_frame(4))
     )
+
+
+def test_frame_buffer_reused():
+    device = apa102(serial, cascaded=3)
+    buf = serial.data.call_args.args[0]
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((1, 0), fill="blue")
+
+    assert serial.data.call_args.args[0] is buf
+    assert buf == bytes(start_frame() + [0xE0, 0, 0, 0, 0xE7, 0xFF, 0, 0, 0xE0, 0, 0, 0] + end_frame(3))
+
+
+def reference_frames(device, image):
+    """
+    LED frames as assembled by the original per-pixel loop.
+    """
+    buf = bytearray(4 * device.cascaded)
+    for idx, (r, g, b, a) in enumerate(image.getdata()):
+        offset = device._mapping[idx] * 4
+        brightness = (a >> 4) if a != 0xFF else device._brightness
+        buf[offset:offset + 4] = bytes([0xE0 | brightness, b, g, r])
+    return bytes(start_frame()) + bytes(buf) + bytes(end_frame(device.cascaded))
+
+
+@pytest.mark.parametrize("mapping", [
+    None,
+    UNICORN_HAT,
+    [63 - i for i in range(64)],
+    [i // 2 for i in range(64)],
+])
+def test_display_matches_reference(mapping):
+    device = apa102(serial, width=8, height=8, mapping=mapping)
+    device.contrast(0xC0)
+
+    image = Image.new("RGBA", (8, 8))
+    image.putdata([(i, 255 - i, i * 3, 255 if i % 3 else i * 4) for i in range(64)])
+    device.display(image)
+
+    assert serial.data.call_args.args[0] == reference_frames(device, image)
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_rotated_mapping(rotate):
+    # rotate only swaps the width and height: the pixels of the image are
+    # mapped as they are, just as for an unrotated device of the same size
+    mapping = [(i * 5) % 24 for i in range(24)]
+    device = apa102(serial, width=6, height=4, rotate=rotate, mapping=mapping)
+    unrotated = apa102(serial, width=device.width, height=device.height, mapping=mapping)
+
+    image = Image.new("RGBA", device.size)
+    image.putdata([(i, 0x80, 0xFF - i, 0xFF) for i in range(24)])
+    unrotated.display(image)
+    expected = serial.data.call_args.args[0][:]
+    device.display(image)
+
+    assert serial.data.call_args.args[0] == expected
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from luma.led_matrix.device import max7219, ws2812, apa102
+from luma.led_matrix.recording import serial, ws281x, max7219_decoder, \
+    apa102_decoder, ws281x_decoder
+
+from helpers import assert_same_image, random_image
+
+
+class gated_serial(serial):
+    """
+    Serial interface whose data transfers wait until the gate is opened.
+    """
+    def __init__(self):
+        super(gated_serial, self).__init__()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.waiting = threading.Event()
+
+    def data(self, data):
+        self.waiting.set()
+        assert self.gate.wait(5)
+        super(gated_serial, self).data(data)
+
+
+class failing_serial(serial):
+    def __init__(self):
+        super(failing_serial, self).__init__()
+        self.fail = False
+
+    def data(self, data):
+        if self.fail:
+            raise IOError("bus error")
+        super(failing_serial, self).data(data)
+
+
+def block_writer(device, image):
+    """
+    Displays an image, and waits until the writer thread is stuck sending it.
+    """
+    interface = device._serial_interface
+    interface.gate.clear()
+    interface.waiting.clear()
+    device.display(image)
+    assert interface.waiting.wait(5)
+
+
+def test_synchronous_by_default():
+    device = max7219(serial(), cascaded=2)
+    assert device._writer is None
+    assert device.flush()
+    assert device.close()
+
+    device.display(random_image("1", device.size))
+    assert device.frames_transmitted == 0
+    assert device.frames_dropped == 0
+
+
+@pytest.mark.parametrize("factory, decoder", [
+    (lambda s: max7219(s, cascaded=4, block_orientation=90),
+     lambda: max7219_decoder(cascaded=4)),
+    (lambda s: apa102(s, width=8, height=2),
+     lambda: apa102_decoder(width=8, height=2)),
+])
+def test_background_output_matches_synchronous(factory, decoder):
+    sync_serial, background_serial = serial(), serial()
+    sync, background = factory(sync_serial), factory(background_serial)
+    background.background()
+
+    for seed in range(5):
+        image = random_image(sync.mode, sync.size, seed)
+        sync.display(image)
+        background.display(image)
+        assert background.flush()
+        assert_same_image(decoder().replay(sync_serial.transactions).image(),
+                          decoder().replay(background_serial.transactions).image())
+
+    assert [t.payload for t in background_serial.transactions] == \
+        [t.payload for t in sync_serial.transactions]
+    assert background.frames_transmitted == 5
+    assert background.frames_dropped == 0
+    assert background.close()
+
+
+def test_ws2812_background():
+    ws = ws281x()
+    device = ws2812(ws, width=4, height=2, mapping=[7, 6, 5, 4, 0, 1, 2, 3])
+    device.background()
+
+    image = random_image("RGB", device.size)
+    device.display(image)
+    assert device.flush()
+    assert device.frames_transmitted == 1
+
+    colors = ws281x_decoder(width=4, height=2).replay(ws.transactions).colors
+    expected = [r << 16 | g << 8 | b for r, g, b in
+                (image.getpixel((i % 4, i // 4)) for i in range(8))]
+    assert [colors[pos] for pos in device._mapping] == expected
+    device.cleanup()
+
+
+def test_latest_frame_wins():
+    interface = gated_serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+
+    images = [random_image("1", device.size, seed) for seed in range(4)]
+    block_writer(device, images[0])
+
+    # The writer is busy, so each frame replaces the one before in the mailbox
+    for image in images[1:]:
+        device.display(image)
+    assert device.frames_dropped == 2
+
+    interface.gate.set()
+    assert device.flush(5)
+    assert device.frames_transmitted == 2
+    assert_same_image(images[-1], max7219_decoder(cascaded=2).replay(interface.transactions).image())
+    device.close()
+
+
+def test_dropped_frames_are_instrumented():
+    interface = gated_serial()
+    device = max7219(interface, cascaded=2)
+    device.instrument()
+    device.background()
+
+    images = [random_image("1", device.size, seed) for seed in range(20)]
+    block_writer(device, images[0])
+    for image in images[1:]:
+        device.display(image)
+
+    interface.gate.set()
+    assert device.flush(5)
+    assert device.frames_dropped == 18
+
+    # Each frame has its own encode time, whether it was transmitted or dropped
+    stats = device.stats()
+    assert stats["frames"] == 20
+    assert stats["frames_skipped"] == device.frames_dropped
+    assert stats["encode"]["count"] == 20
+    assert stats["transmit"]["count"] == 20
+    assert stats["bytes"] == device.frames_transmitted * 2 * 8 * 2
+    device.close()
+
+
+def test_display_does_not_wait_for_bus():
+    interface = gated_serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+    block_writer(device, random_image("1", device.size))
+
+    device.display(random_image("1", device.size, 1))
+    assert not device.flush(timeout=0.01)
+
+    interface.gate.set()
+    assert device.flush(5)
+    device.close()
+
+
+def test_reused_buffers_are_copied():
+    interface = gated_serial()
+    device = apa102(interface, width=8, height=1)
+    device.background()
+    block_writer(device, Image.new("RGBA", device.size, "red"))
+
+    # apa102 encodes into the same buffer every time
+    device.display(Image.new("RGBA", device.size, "blue"))
+    pending = device._writer._pending[0][0]
+    device._encode(Image.new("RGBA", device.size, "green"))
+    assert isinstance(pending, bytes)
+
+    interface.gate.set()
+    assert device.flush(5)
+    assert_same_image(Image.new("RGBA", device.size, "blue"),
+                      apa102_decoder(width=8).replay(interface.transactions).image())
+    device.close()
+
+
+def test_control_operations_wait_for_pending_frame():
+    interface = gated_serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+
+    image = random_image("1", device.size)
+    block_writer(device, image)
+
+    worker = threading.Thread(target=device.contrast, args=(0x80,))
+    worker.start()
+    time.sleep(0.05)
+    assert worker.is_alive()
+
+    interface.gate.set()
+    worker.join(5)
+    assert not worker.is_alive()
+
+    decoder = max7219_decoder(cascaded=2)
+    decoder.replay(interface.transactions[:-1])
+    assert_same_image(image, decoder.image())
+    assert decoder.intensity(0) != 0x08
+    decoder.feed(interface.transactions[-1].payload)
+    assert decoder.intensity(0) == 0x08
+    device.close()
+
+
+def test_error_is_reraised():
+    interface = failing_serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+
+    interface.fail = True
+    device.display(random_image("1", device.size))
+    with pytest.raises(IOError):
+        device.flush(5)
+
+    # Reported only once, and the writer carries on
+    interface.fail = False
+    assert device.flush(5)
+    device.display(random_image("1", device.size))
+    assert device.flush(5)
+    assert device.frames_transmitted == 1
+    device.close()
+
+
+def test_close():
+    interface = serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+    thread = device._writer._thread
+    assert "contrast" in device.__dict__
+
+    device.display(random_image("1", device.size))
+    assert device.close(5)
+    assert not thread.is_alive()
+    assert device._writer is None
+    assert not set(device.__dict__) & {"contrast", "show", "hide", "cleanup"}
+    assert device.frames_transmitted == 1
+
+    # Back to synchronous transmission
+    interface.clear()
+    device.display(random_image("1", device.size, 1))
+    assert interface.transactions
+    assert device.frames_transmitted == 1
+
+
+def test_background_off():
+    device = max7219(serial(), cascaded=2)
+    device.background()
+    device.background()
+    thread = device._writer._thread
+
+    device.background(False)
+    assert device._writer is None
+    assert not thread.is_alive()
+
+
+def test_cleanup_closes_writer():
+    interface = serial()
+    device = max7219(interface, cascaded=2)
+    device.background()
+    thread = device._writer._thread
+
+    image = random_image("1", device.size)
+    device.display(image)
+    device.cleanup()
+
+    assert not thread.is_alive()
+    assert device._writer is None
+    decoder = max7219_decoder(cascaded=2).replay(interface.transactions)
+    assert decoder.shutdown(0)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import json
+
+import pytest
+
+from luma.led_matrix import bench
+
+
+def results_by_name(results):
+    return {result["name"]: result for result in results["results"]}
+
+
+def test_case_names_unique():
+    names = [case.name for case in bench.cases()]
+    assert len(names) == len(set(names))
+
+
+def test_run_all_cases():
+    results = bench.run(frames=2)
+    assert len(results["results"]) == len(bench.cases())
+    for result in results["results"]:
+        assert result["frames"] == 2
+        assert result["fps"] > 0
+        assert result["mean_us"] > 0
+        assert result["bytes_per_frame"] >= 0
+        assert result["alloc_peak_bytes_per_frame"] >= 0
+    json.dumps(results)
+
+
+@pytest.mark.parametrize("name,expected", [
+    ("max7219/cascaded=4/block_orientation=0", 4 * 8 * 2),
+    ("max7219/cascaded=16/delta_update/static", 0),
+    ("ws2812/8x4/mapping=identity/led_buffer=True", 32 * 3),
+    ("ws2812/8x4/mapping=identity/led_buffer=False", 32 * 3),
+    ("apa102/cascaded=60/mapping=identity", 4 + 60 * 4 + 4),
+    ("unicornhathd/rotate=0/opaque", 1 + 16 * 16 * 3),
+    ("neosegment/width=6", 6 * 7 * 3),
+    ("ws2812/16x16/frameserver", 16 * 16 * 3),
+    ("unicornhathd/rotate=0/translucent/frameserver", 1 + 16 * 16 * 3),
+])
+def test_bytes_per_frame(name, expected):
+    selected = [case for case in bench.cases() if case.name == name]
+    result = results_by_name(bench.run(selected, frames=4))[name]
+    assert result["bytes_per_frame"] == expected
+
+
+def test_main_list(capsys):
+    assert bench.main(["--list", "--filter", "apa102"]) == 0
+    names = capsys.readouterr().out.split()
+    assert names and all(name.startswith("apa102/") for name in names)
+
+
+def test_main_output(tmp_path):
+    output = tmp_path / "results.json"
+    assert bench.main(["--frames", "3", "--filter", "unicornhathd/rotate=1", "--output", str(output)]) == 0
+    results = results_by_name(json.loads(output.read_text()))
+    assert set(results) == {"unicornhathd/rotate=1/opaque", "unicornhathd/rotate=1/translucent"}
+    assert results["unicornhathd/rotate=1/opaque"]["params"] == {
+        "device": "unicornhathd", "rotate": 1, "opaque": True}
+
+
+def test_main_no_match():
+    with pytest.raises(SystemExit):
+        bench.main(["--filter", "nonexistent"])
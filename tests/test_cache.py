@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+
+from luma.led_matrix.cache import encoded_frame_cache, _ENTRY_OVERHEAD
+from luma.led_matrix.device import max7219, apa102, unicornhathd
+from luma.led_matrix.recording import serial
+
+from helpers import random_image
+
+
+def test_cache_lru():
+    cache = encoded_frame_cache(3 * (_ENTRY_OVERHEAD + 10))
+    for key in "abc":
+        cache.put(key, key.upper(), 10)
+    assert cache.get("a") == "A"
+
+    cache.put("d", "D", 10)
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+    assert cache.stats() == {
+        "hits": 4,
+        "misses": 1,
+        "evictions": 1,
+        "hit_rate": 0.8,
+        "entries": 3,
+        "bytes": 3 * (_ENTRY_OVERHEAD + 10),
+        "max_bytes": 3 * (_ENTRY_OVERHEAD + 10)
+    }
+
+
+def test_cache_byte_budget():
+    cache = encoded_frame_cache(2000)
+    cache.put("small", 1, 100)
+    cache.put("big", 2, 700)
+    assert len(cache) == 2
+    cache.put("bigger", 3, 1500)
+    assert len(cache) == 1
+    assert cache.get("bigger") == 3
+    assert cache.stats()["evictions"] == 2
+
+    cache.put("too-big", 4, 1900)
+    assert cache.get("too-big") is None
+    assert cache.get("bigger") == 3
+
+
+def test_cache_replace():
+    cache = encoded_frame_cache(1000)
+    cache.put("a", 1, 100)
+    cache.put("a", 2, 200)
+    assert len(cache) == 1
+    assert cache.bytes == 200 + _ENTRY_OVERHEAD
+    assert cache.get("a") == 2
+
+
+def test_cache_clear():
+    cache = encoded_frame_cache(1000)
+    cache.put("a", 1, 100)
+    cache.get("a")
+    cache.clear()
+    assert cache.stats()["hits"] == 0
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_disabled_by_default():
+    assert max7219(serial()).frame_cache is None
+    assert apa102(serial()).frame_cache is None
+    assert unicornhathd(serial()).frame_cache is None
+
+
+@pytest.mark.parametrize("factory", [
+    lambda s, c: max7219(s, cascaded=4, rotate=1, block_orientation=90, frame_cache=c),
+    lambda s, c: apa102(s, width=8, height=4, mapping=list(reversed(range(32))), frame_cache=c),
+    lambda s, c: unicornhathd(s, rotate=2, frame_cache=c),
+])
+def test_cached_output_identical(factory):
+    expected, actual = serial(), serial()
+    reference = factory(expected, 0)
+    device = factory(actual, 1 << 20)
+    images = [random_image(device.mode, device.size, seed) for seed in range(3)]
+    expected.clear()
+    actual.clear()
+    device.frame_cache.clear()
+
+    for image in images * 3:
+        reference.display(image)
+        device.display(image)
+
+    assert [t.payload for t in actual.transactions] == [t.payload for t in expected.transactions]
+    stats = device.frame_cache.stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 6
+
+
+@pytest.mark.parametrize("factory", [
+    lambda s: apa102(s, cascaded=4, frame_cache=1 << 16),
+    lambda s: unicornhathd(s, frame_cache=1 << 16),
+])
+def test_cache_keyed_by_brightness(factory):
+    recorder = serial()
+    device = factory(recorder)
+    image = random_image("RGBA", device.size)
+    image.putalpha(255)
+
+    device.display(image)
+    dim = recorder.transactions[-1].payload
+    device.contrast(0xFF)
+    bright = recorder.transactions[-1].payload
+    assert dim != bright
+
+    device.contrast(0x70)
+    device.display(image)
+    assert recorder.transactions[-1].payload == dim
+    assert device.frame_cache.stats()["hits"] >= 1
+
+
+def test_last_image_updated_on_hit():
+    device = apa102(serial(), cascaded=4, frame_cache=1 << 16)
+    first, second = [random_image("RGBA", device.size, seed) for seed in range(2)]
+    device.display(first)
+    device.display(second)
+    device.display(first)
+    assert device._last_image.tobytes() == first.tobytes()
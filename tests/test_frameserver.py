@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import threading
+import time
+
+import pytest
+
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, UNICORN_HAT
+from luma.led_matrix.frameserver import frameserver, main
+from luma.led_matrix.recording import serial, ws281x
+from luma.led_matrix.ringbuffer import ringbuffer
+
+from helpers import random_image
+
+
+def payloads(interface):
+    return [t.payload for t in interface.transactions]
+
+
+@pytest.mark.parametrize("factory, interface", [
+    (lambda s: max7219(s, cascaded=4, block_orientation=90, rotate=1), serial),
+    (lambda s: max7219(s, width=16, height=16), serial),
+    (lambda ws: ws2812(ws, width=8, height=8, mapping=UNICORN_HAT), ws281x),
+    (lambda ws: ws2812(ws, width=8, height=4, rotate=2), ws281x),
+    (lambda s: apa102(s, width=8, height=2, mapping=list(reversed(range(16)))), serial),
+    (lambda s: unicornhathd(s, rotate=1), serial),
+])
+def test_matches_display(factory, interface):
+    sent, expected = interface(), interface()
+    device, reference = factory(sent), factory(expected)
+    sent.clear()
+    expected.clear()
+
+    with frameserver(device) as server, ringbuffer(server.name) as producer:
+        for seed in range(3):
+            image = random_image(device.mode, device.size, seed)
+            reference.display(image)
+            producer.publish(image.tobytes())
+            assert server.poll()
+            assert not server.poll()
+
+    assert payloads(sent) == payloads(expected)
+    assert server.frames_displayed == 3
+
+
+def test_latest_frame_wins():
+    sent, expected = serial(), serial()
+    device, reference = apa102(sent, width=8, height=1), apa102(expected, width=8, height=1)
+    images = [random_image("RGBA", device.size, seed) for seed in range(3)]
+    reference.display(images[-1])
+
+    with frameserver(device, slots=4) as server, ringbuffer(server.name) as producer:
+        assert not server.poll()
+        for image in images:
+            producer.publish(image.tobytes())
+        assert server.poll()
+
+    assert sent.transactions[-1].payload == expected.transactions[-1].payload
+    assert server.frames_displayed == 1
+    assert server.frames_dropped == 2
+
+
+def test_overwritten_while_reading():
+    sent = serial()
+    device = max7219(sent, cascaded=2)
+    encode = device._encode
+
+    with frameserver(device, slots=2) as server, ringbuffer(server.name) as producer:
+        blank = bytes(producer.frame_size)
+
+        def lapped(image):
+            data = encode(image)
+            producer.publish(blank)
+            producer.publish(blank)
+            return data
+        device._encode = lapped
+
+        producer.publish(blank)
+        sent.clear()
+        assert not server.poll()
+        assert sent.transactions == []
+        assert server.frames_overwritten == 1
+
+        # The frames published meanwhile are still picked up
+        device._encode = encode
+        assert server.poll()
+        assert server.frames_dropped == 1
+        assert server.sequence == 3
+
+
+def test_background():
+    sent, expected = serial(), serial()
+    device, reference = max7219(sent, cascaded=4), max7219(expected, cascaded=4)
+    device.background()
+    image = random_image("1", device.size)
+    reference.display(image)
+
+    with frameserver(device) as server, ringbuffer(server.name) as producer:
+        producer.publish(image.tobytes())
+        assert server.poll()
+        assert device.flush(5)
+
+    assert payloads(sent)[-8:] == payloads(expected)[-8:]
+    device.close()
+
+
+def test_run_stop():
+    device = apa102(serial(), width=8, height=1)
+    with frameserver(device) as server, ringbuffer(server.name) as producer:
+        worker = threading.Thread(target=server.run, args=(0.001,))
+        worker.start()
+        try:
+            producer.publish(random_image("RGBA", device.size).tobytes())
+            deadline = time.monotonic() + 5
+            while server.frames_displayed == 0 and time.monotonic() < deadline:
+                time.sleep(0.001)
+        finally:
+            server.stop()
+            worker.join(5)
+
+        assert not worker.is_alive()
+        assert server.frames_displayed == 1
+
+
+def test_close():
+    server = frameserver(max7219(serial(), cascaded=1))
+    name = server.name
+    server.close()
+    server.close()
+    with pytest.raises(FileNotFoundError):
+        ringbuffer(name)
+
+
+def test_main(monkeypatch):
+    names = []
+
+    def interrupted(self, poll_interval):
+        names.append((self.name, self.ring.size, self.ring.mode, poll_interval))
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(frameserver, "run", interrupted)
+    name = f"luma_led_matrix_test_{id(names)}"
+    assert main(["--display", "apa102", "--interface", "noop", "--width", "8", "--height", "2",
+                 "--name", name, "--poll-interval", "0.01"]) == 0
+
+    assert names == [(name, (8, 2), "RGBA", 0.01)]
+    with pytest.raises(FileNotFoundError):
+        ringbuffer(name)
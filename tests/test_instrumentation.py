@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+from PIL import Image
+
+from luma.led_matrix.recording import ws281x
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, neosegment
+from luma.led_matrix.instrumentation import _bucket
+
+from helpers import serial, setup_function  # noqa: F401
+
+
+@pytest.mark.parametrize("factory,frame_bytes", [
+    (lambda: max7219(serial, cascaded=4), 4 * 8 * 2),
+    (lambda: apa102(serial, cascaded=10), 4 + 10 * 4 + 1),
+    (lambda: unicornhathd(serial), 1 + 16 * 16 * 3),
+    (lambda: ws2812(ws281x(), width=4, height=4), 4 * 4 * 3),
+])
+def test_stats(factory, frame_bytes):
+    device = factory()
+    assert device.stats() is None
+
+    device.instrument()
+    for _ in range(5):
+        device.display(Image.new(device.mode, device.size))
+
+    stats = device.stats()
+    assert stats["frames"] == 5
+    assert stats["frames_skipped"] == 0
+    assert stats["bytes"] == 5 * frame_bytes
+    assert stats["bytes_per_frame"]["mean"] == frame_bytes
+    assert stats["bytes_per_frame"]["histogram"] == [(_bucket(frame_bytes, 1), 5)]
+    for stage in ["encode", "transmit", "total"]:
+        assert stats[stage]["count"] == 5
+        assert 0 < stats[stage]["min"] <= stats[stage]["p50"] <= stats[stage]["p99"] <= stats[stage]["max"]
+        assert sum(count for _, count in stats[stage]["histogram"]) == 5
+    assert stats["total"]["mean"] == pytest.approx(stats["encode"]["mean"] + stats["transmit"]["mean"])
+
+
+def test_disable():
+    device = apa102(serial, cascaded=4)
+    device.instrument()
+    assert "_encode" in vars(device)
+    device.instrument(enabled=False)
+    assert "_encode" not in vars(device)
+    assert "_transmit" not in vars(device)
+    device.display(Image.new(device.mode, device.size))
+    assert device.stats() is None
+
+
+def test_reenable_resets():
+    device = apa102(serial, cascaded=4)
+    device.instrument()
+    device.display(Image.new(device.mode, device.size))
+    device.instrument()
+    device.display(Image.new(device.mode, device.size))
+    assert device.stats()["frames"] == 1
+
+
+def test_window():
+    device = max7219(serial, cascaded=1)
+    device.instrument(window=3)
+    for _ in range(10):
+        device.display(Image.new(device.mode, device.size))
+
+    stats = device.stats()
+    assert stats["frames"] == 10
+    assert stats["encode"]["count"] == 3
+
+
+def test_callback_and_skipped_frames():
+    records = []
+    device = max7219(serial, cascaded=2, delta_update=True)
+    device.instrument(callback=records.append)
+
+    image = Image.new(device.mode, device.size)
+    device.display(image)
+    image.putpixel((0, 0), 1)
+    device.display(image)
+    device.display(image)
+
+    assert [record["bytes"] for record in records] == [0, 4, 0]
+    assert [record["skipped"] for record in records] == [True, False, True]
+    assert all(record["total"] == record["encode"] + record["transmit"] for record in records)
+    assert device.stats()["frames_skipped"] == 2
+
+
+def test_transmit_failure():
+    device = apa102(serial, cascaded=4)
+    device.instrument()
+    serial.data.side_effect = IOError("bus error")
+    with pytest.raises(IOError):
+        device.display(Image.new(device.mode, device.size))
+
+    serial.data.side_effect = None
+    device.display(Image.new(device.mode, device.size))
+    stats = device.stats()
+    assert stats["frames"] == 1
+    assert stats["encode"]["max"] < 1
+
+
+def test_neosegment_direct():
+    width = 6
+    mapping = [(i % width) * 7 + (i // width) for i in range(width * 7)]
+    device = ws2812(ws281x(), width=width, height=7, mapping=mapping)
+    device.instrument()
+    neoseg = neosegment(width=width, device=device)
+    neoseg.text = "123456"
+
+    stats = device.stats()
+    assert stats["frames"] >= 1
+    assert stats["bytes"] == stats["frames"] * width * 7 * 3
+    assert stats["encode"]["min"] == 0
+
+
+@pytest.mark.parametrize("value,expected", [
+    (0, 0),
+    (1, 1),
+    (2, 2),
+    (3, 4),
+    (1000, 1024),
+    (1024, 1024),
+])
+def test_bucket(value, expected):
+    assert _bucket(value, 1) == expected
@@ -3,7 +3,10 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import random
+
 import pytest
+from PIL import Image
 
 from luma.led_matrix.device import max7219
 from luma.core.render import canvas
@@ -12,6 +15,44 @@ from helpers import setup_function, serial, assert_invalid_dimensions  # noqa: F
 from unittest.mock import call
 
 
+def reference_display(device, image):
+    """
+    The original per-pixel encoder, retained to check the packed register
+    bytes generated by :py:meth:`max7219.display` against.
+    """
+    image = device.preprocess(image)
+    step = 2 * device.cascaded
+    offsets = [(y * device._w) + x
+               for y in range(device._h - 8, -8, -8)
+               for x in range(device._w - 8, -8, -8)]
+
+    i = 0
+    buf = bytearray(8 * step)
+    pix = list(image.getdata())
+
+    for digit in range(8):
+        for daisychained_device in offsets:
+            byte = 0
+            idx = daisychained_device + digit
+            for y in range(8):
+                if pix[idx] > 0:
+                    byte |= 1 << y
+                idx += device._w
+
+            buf[i] = digit + device._const.DIGIT_0
+            buf[i + 1] = byte
+            i += 2
+
+    return [call(buf[i:i + step]) for i in range(0, len(buf), step)]
+
+
+def random_image(device, seed):
+    rnd = random.Random(seed)
+    image = Image.new(device.mode, device.size)
+    image.putdata([rnd.choice((0, 255)) for _ in range(device.width * device.height)])
+    return image
+
+
 def test_init_cascaded():
     device = max7219(serial, cascaded=4)
     assert device.width == 32
@@ -31,14 +72,14 @@ def test_init_8x8():
         call([9, 0]),
         call([15, 0]),
         call([10, 7]),
-        call([1, 0]),
-        call([2, 0]),
-        call([3, 0]),
-        call([4, 0]),
-        call([5, 0]),
-        call([6, 0]),
-        call([7, 0]),
-        call([8, 0]),
+        call(bytes([1, 0])),
+        call(bytes([2, 0])),
+        call(bytes([3, 0])),
+        call(bytes([4, 0])),
+        call(bytes([5, 0])),
+        call(bytes([6, 0])),
+        call(bytes([7, 0])),
+        call(bytes([8, 0])),
         call([12, 1])
     ])
 
@@ -51,14 +92,14 @@ def test_init_16x8():
         call([9, 0, 9, 0]),
         call([15, 0, 15, 0]),
         call([10, 7, 10, 7]),
-        call([1, 0, 1, 0]),
-        call([2, 0, 2, 0]),
-        call([3, 0, 3, 0]),
-        call([4, 0, 4, 0]),
-        call([5, 0, 5, 0]),
-        call([6, 0, 6, 0]),
-        call([7, 0, 7, 0]),
-        call([8, 0, 8, 0]),
+        call(bytes([1, 0, 1, 0])),
+        call(bytes([2, 0, 2, 0])),
+        call(bytes([3, 0, 3, 0])),
+        call(bytes([4, 0, 4, 0])),
+        call(bytes([5, 0, 5, 0])),
+        call(bytes([6, 0, 6, 0])),
+        call(bytes([7, 0, 7, 0])),
+        call(bytes([8, 0, 8, 0])),
         call([12, 1, 12, 1])
     ])
 
@@ -96,14 +137,14 @@ def test_display_16x8():
         draw.rectangle(device.bounding_box, outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0x81, 1, 0xFF]),
-        call([2, 0x81, 2, 0x81]),
-        call([3, 0x81, 3, 0x81]),
-        call([4, 0x81, 4, 0x81]),
-        call([5, 0x81, 5, 0x81]),
-        call([6, 0x81, 6, 0x81]),
-        call([7, 0x81, 7, 0x81]),
-        call([8, 0xFF, 8, 0x81])
+        call(bytes([1, 0x81, 1, 0xFF])),
+        call(bytes([2, 0x81, 2, 0x81])),
+        call(bytes([3, 0x81, 3, 0x81])),
+        call(bytes([4, 0x81, 4, 0x81])),
+        call(bytes([5, 0x81, 5, 0x81])),
+        call(bytes([6, 0x81, 6, 0x81])),
+        call(bytes([7, 0x81, 7, 0x81])),
+        call(bytes([8, 0xFF, 8, 0x81]))
     ])
 
 
@@ -115,14 +156,14 @@ def test_display_16x16():
         draw.rectangle(device.bounding_box, outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0x80, 1, 0xFF, 1, 0x01, 1, 0xFF]),
-        call([2, 0x80, 2, 0x80, 2, 0x01, 2, 0x01]),
-        call([3, 0x80, 3, 0x80, 3, 0x01, 3, 0x01]),
-        call([4, 0x80, 4, 0x80, 4, 0x01, 4, 0x01]),
-        call([5, 0x80, 5, 0x80, 5, 0x01, 5, 0x01]),
-        call([6, 0x80, 6, 0x80, 6, 0x01, 6, 0x01]),
-        call([7, 0x80, 7, 0x80, 7, 0x01, 7, 0x01]),
-        call([8, 0xFF, 8, 0x80, 8, 0xFF, 8, 0x01])
+        call(bytes([1, 0x80, 1, 0xFF, 1, 0x01, 1, 0xFF])),
+        call(bytes([2, 0x80, 2, 0x80, 2, 0x01, 2, 0x01])),
+        call(bytes([3, 0x80, 3, 0x80, 3, 0x01, 3, 0x01])),
+        call(bytes([4, 0x80, 4, 0x80, 4, 0x01, 4, 0x01])),
+        call(bytes([5, 0x80, 5, 0x80, 5, 0x01, 5, 0x01])),
+        call(bytes([6, 0x80, 6, 0x80, 6, 0x01, 6, 0x01])),
+        call(bytes([7, 0x80, 7, 0x80, 7, 0x01, 7, 0x01])),
+        call(bytes([8, 0xFF, 8, 0x80, 8, 0xFF, 8, 0x01]))
     ])
 
 
@@ -134,14 +175,14 @@ def test_normal_alignment():
         draw.rectangle((0, 0, 15, 3), outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0x09, 1, 0x0F]),
-        call([2, 0x09, 2, 0x09]),
-        call([3, 0x09, 3, 0x09]),
-        call([4, 0x09, 4, 0x09]),
-        call([5, 0x09, 5, 0x09]),
-        call([6, 0x09, 6, 0x09]),
-        call([7, 0x09, 7, 0x09]),
-        call([8, 0x0F, 8, 0x09])
+        call(bytes([1, 0x09, 1, 0x0F])),
+        call(bytes([2, 0x09, 2, 0x09])),
+        call(bytes([3, 0x09, 3, 0x09])),
+        call(bytes([4, 0x09, 4, 0x09])),
+        call(bytes([5, 0x09, 5, 0x09])),
+        call(bytes([6, 0x09, 6, 0x09])),
+        call(bytes([7, 0x09, 7, 0x09])),
+        call(bytes([8, 0x0F, 8, 0x09]))
     ])
 
 
@@ -153,14 +194,14 @@ def test_block_realignment_minus90():
         draw.rectangle((0, 0, 15, 3), outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0x00, 1, 0x00]),
-        call([2, 0x00, 2, 0x00]),
-        call([3, 0x00, 3, 0x00]),
-        call([4, 0x00, 4, 0x00]),
-        call([5, 0xFF, 5, 0xFF]),
-        call([6, 0x80, 6, 0x01]),
-        call([7, 0x80, 7, 0x01]),
-        call([8, 0xFF, 8, 0xFF])
+        call(bytes([1, 0x00, 1, 0x00])),
+        call(bytes([2, 0x00, 2, 0x00])),
+        call(bytes([3, 0x00, 3, 0x00])),
+        call(bytes([4, 0x00, 4, 0x00])),
+        call(bytes([5, 0xFF, 5, 0xFF])),
+        call(bytes([6, 0x80, 6, 0x01])),
+        call(bytes([7, 0x80, 7, 0x01])),
+        call(bytes([8, 0xFF, 8, 0xFF]))
     ])
 
 
@@ -172,14 +213,14 @@ def test_block_realignment_plus90():
         draw.rectangle((0, 0, 15, 3), outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0xFF, 1, 0xFF]),
-        call([2, 0x01, 2, 0x80]),
-        call([3, 0x01, 3, 0x80]),
-        call([4, 0xFF, 4, 0xFF]),
-        call([5, 0x00, 5, 0x00]),
-        call([6, 0x00, 6, 0x00]),
-        call([7, 0x00, 7, 0x00]),
-        call([8, 0x00, 8, 0x00])
+        call(bytes([1, 0xFF, 1, 0xFF])),
+        call(bytes([2, 0x01, 2, 0x80])),
+        call(bytes([3, 0x01, 3, 0x80])),
+        call(bytes([4, 0xFF, 4, 0xFF])),
+        call(bytes([5, 0x00, 5, 0x00])),
+        call(bytes([6, 0x00, 6, 0x00])),
+        call(bytes([7, 0x00, 7, 0x00])),
+        call(bytes([8, 0x00, 8, 0x00]))
     ])
 
 
@@ -191,14 +232,14 @@ def test_block_realignment_plus180():
         draw.rectangle((0, 0, 15, 3), outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 0xF0, 1, 0x90]),
-        call([2, 0x90, 2, 0x90]),
-        call([3, 0x90, 3, 0x90]),
-        call([4, 0x90, 4, 0x90]),
-        call([5, 0x90, 5, 0x90]),
-        call([6, 0x90, 6, 0x90]),
-        call([7, 0x90, 7, 0x90]),
-        call([8, 0x90, 8, 0xF0])
+        call(bytes([1, 0xF0, 1, 0x90])),
+        call(bytes([2, 0x90, 2, 0x90])),
+        call(bytes([3, 0x90, 3, 0x90])),
+        call(bytes([4, 0x90, 4, 0x90])),
+        call(bytes([5, 0x90, 5, 0x90])),
+        call(bytes([6, 0x90, 6, 0x90])),
+        call(bytes([7, 0x90, 7, 0x90])),
+        call(bytes([8, 0x90, 8, 0xF0]))
     ])
 
 
@@ -210,17 +251,144 @@ def test_reversed_max7219():
         draw.rectangle((0, 0, 15, 3), outline="white")
 
     serial.data.assert_has_calls([
-        call([1, 15, 1, 9, 1, 0, 1, 0]),
-        call([2, 9, 2, 9, 2, 0, 2, 0]),
-        call([3, 9, 3, 9, 3, 0, 3, 0]),
-        call([4, 9, 4, 9, 4, 0, 4, 0]),
-        call([5, 9, 5, 9, 5, 0, 5, 0]),
-        call([6, 9, 6, 9, 6, 0, 6, 0]),
-        call([7, 9, 7, 9, 7, 0, 7, 0]),
-        call([8, 9, 8, 15, 8, 0, 8, 0])
+        call(bytes([1, 15, 1, 9, 1, 0, 1, 0])),
+        call(bytes([2, 9, 2, 9, 2, 0, 2, 0])),
+        call(bytes([3, 9, 3, 9, 3, 0, 3, 0])),
+        call(bytes([4, 9, 4, 9, 4, 0, 4, 0])),
+        call(bytes([5, 9, 5, 9, 5, 0, 5, 0])),
+        call(bytes([6, 9, 6, 9, 6, 0, 6, 0])),
+        call(bytes([7, 9, 7, 9, 7, 0, 7, 0])),
+        call(bytes([8, 9, 8, 15, 8, 0, 8, 0]))
     ])
 
 
 def test_unknown_block_orientation():
     with pytest.raises(AssertionError):
         max7219(serial, cascaded=2, block_orientation="sausages")
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(cascaded=1),
+    dict(cascaded=4),
+    dict(width=16, height=16),
+    dict(width=24, height=16),
+    dict(width=8, height=32),
+])
+def test_display_matches_reference(kwargs):
+    device = max7219(serial, **kwargs)
+    for seed in range(5):
+        image = random_image(device, seed)
+        serial.reset_mock()
+        device.display(image)
+        assert serial.data.mock_calls == reference_display(device, image)
+
+
+def test_list_only_interface():
+    def data(buf):
+        if not isinstance(buf, list):
+            raise TypeError("list expected")
+
+    serial.data.side_effect = data
+    device = max7219(serial, cascaded=2)
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.rectangle(device.bounding_box, outline="white")
+
+    serial.data.assert_has_calls([
+        call([1, 0x81, 1, 0xFF]),
+        call([2, 0x81, 2, 0x81]),
+        call([3, 0x81, 3, 0x81]),
+        call([4, 0x81, 4, 0x81]),
+        call([5, 0x81, 5, 0x81]),
+        call([6, 0x81, 6, 0x81]),
+        call([7, 0x81, 7, 0x81]),
+        call([8, 0xFF, 8, 0x81])
+    ])
+
+
+def registers(mock_calls, cascaded):
+    """
+    Replays the transfers sent to a chain of MAX7219 devices, returning the
+    resulting DIGIT_0..DIGIT_7 register contents of each device.
+    """
+    state = [[None] * 8 for _ in range(cascaded)]
+    for c in mock_calls:
+        data = c.args[0]
+        assert len(data) == 2 * cascaded
+        for i in range(cascaded):
+            register, value = data[2 * i], data[2 * i + 1]
+            if 1 <= register <= 8:
+                state[i][register - 1] = value
+    return state
+
+
+def test_delta_update_unchanged():
+    device = max7219(serial, cascaded=4, delta_update=True)
+    serial.reset_mock()
+
+    device.clear()
+    serial.data.assert_not_called()
+
+
+def test_delta_update_noop_padding():
+    device = max7219(serial, cascaded=4, delta_update=True)
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((2, 3), fill="white")
+        draw.point((29, 0), fill="white")
+
+    serial.data.assert_called_once_with(bytes([6, 0x01, 0, 0, 0, 0, 3, 0x08]))
+
+
+def test_delta_update_multiple_rows():
+    device = max7219(serial, cascaded=2, delta_update=True)
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.line((0, 0, 0, 7), fill="white")
+        draw.line((3, 0, 3, 7), fill="white")
+        draw.point((15, 7), fill="white")
+
+    assert serial.data.mock_calls == [
+        call(bytes([8, 0x80, 1, 0xFF])),
+        call(bytes([0, 0, 4, 0xFF])),
+    ]
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(cascaded=4),
+    dict(width=16, height=16, block_orientation=90),
+])
+def test_delta_update_matches_full_update(kwargs):
+    full = max7219(serial, **kwargs)
+    delta = max7219(serial, delta_update=True, **kwargs)
+
+    images = [random_image(full, seed) for seed in range(4)]
+    serial.reset_mock()
+    for image in images:
+        full.display(image)
+    expected = registers(serial.data.mock_calls, full.cascaded)
+
+    serial.reset_mock()
+    delta.display(images[0])
+    delta.clear()
+    for image in images:
+        delta.display(image)
+    assert registers(serial.data.mock_calls, delta.cascaded) == expected
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+@pytest.mark.parametrize("block_orientation", [0, 90, -90, 180])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("width,height", [(32, 8), (16, 24)])
+def test_orientation_matches_reference(width, height, rotate, block_orientation, reverse):
+    device = max7219(serial, width=width, height=height, rotate=rotate,
+                     block_orientation=block_orientation,
+                     blocks_arranged_in_reverse_order=reverse)
+    for seed in range(3):
+        image = random_image(device, seed)
+        serial.reset_mock()
+        device.display(image)
+        assert serial.data.mock_calls == reference_display(device, image)
@@ -3,17 +3,29 @@
 # Copyright (c) 2017-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import ctypes
+
 import pytest
 
 from PIL import Image
 
-from luma.led_matrix.device import neosegment
+from luma.led_matrix.device import neosegment, ws2812
 from luma.core.device import dummy
 from luma.core.render import canvas
 import luma.core.error
 
 from helpers import assert_identical_image, get_reference_image
 
+from unittest.mock import Mock
+
+
+def ws281x(leds_buffer):
+    ws = Mock(unsafe=True)
+    ws.ws2811_init = Mock(return_value=0)
+    ws.ws2811_render = Mock(return_value=0)
+    ws.ws2811_channel_t_leds_get = Mock(return_value=ctypes.addressof(leds_buffer))
+    return ws
+
 
 def test_invalid_dimensions():
     with pytest.raises(luma.core.error.DeviceDisplayModeError) as ex:
@@ -91,3 +103,99 @@ def test_unknown_char():
         draw.rectangle([2, 0, 3, 6], fill="black")
         draw.rectangle([2, 1, 3, 1], fill="orange")
     assert_identical_image(ref.image, neoseg.device.image)
+
+
+@pytest.mark.parametrize("rotate", [0, 2])
+def test_direct_render_matches_image(rotate):
+    width = 12
+    mapping = [(i % width) * 7 + (i // width) for i in range(width * 7)]
+    actual = (ctypes.c_uint32 * (width * 7))()
+    expected = (ctypes.c_uint32 * (width * 7))()
+    device = ws2812(ws281x(actual), width=width, height=7, rotate=rotate, mapping=mapping)
+    ref = dummy(width=width, height=7)
+    colors = ["red", (0, 128, 255), "#123456", "yellow", "cyan", "magenta"] * 2
+
+    neoseg = neosegment(width=width, device=device)
+    assert neoseg._direct
+    neoseg.color = colors
+    neoseg.text = "HELLO 12.34-"
+    neoseg.color[3] = "green"
+
+    refseg = neosegment(width=width, device=ref)
+    refseg.color = colors
+    refseg.text = "HELLO 12.34-"
+    refseg.color[3] = "green"
+
+    reference = ws2812(ws281x(expected), width=width, height=7, rotate=rotate, mapping=mapping)
+    try:
+        reference.display(ref.image)
+        assert list(actual) == list(expected)
+    finally:
+        # The devices write into the local buffers, so must not outlive them
+        reference.cleanup()
+        device.cleanup()
+
+
+def test_batch_flushes_once():
+    device = dummy(width=6, height=7)
+    neoseg = neosegment(width=6, device=device)
+    device.display = Mock(wraps=device.display)
+
+    with neoseg.batch():
+        neoseg.text = "888888"
+        for i in range(6):
+            neoseg.color[i] = "red"
+        device.display.assert_not_called()
+
+    device.display.assert_called_once()
+    ref = dummy(width=6, height=7)
+    with canvas(ref) as draw:
+        draw.rectangle(ref.bounding_box, fill="red")
+    assert_identical_image(ref.image, device.image)
+
+
+def test_batch_nested():
+    device = dummy(width=6, height=7)
+    neoseg = neosegment(width=6, device=device)
+    device.display = Mock(wraps=device.display)
+
+    with neoseg.batch():
+        with neoseg.batch():
+            neoseg.text = "12"
+        device.display.assert_not_called()
+        neoseg.color[0] = "blue"
+
+    device.display.assert_called_once()
+
+
+def test_batch_without_changes():
+    device = dummy(width=6, height=7)
+    neoseg = neosegment(width=6, device=device)
+    device.display = Mock(wraps=device.display)
+
+    with neoseg.batch():
+        pass
+
+    device.display.assert_not_called()
+
+
+def test_batch_exception():
+    device = dummy(width=6, height=7)
+    neoseg = neosegment(width=6, device=device)
+    device.display = Mock(wraps=device.display)
+
+    with pytest.raises(ValueError):
+        with neoseg.batch():
+            neoseg.text = "12"
+            raise ValueError("abandoned")
+
+    device.display.assert_not_called()
+    neoseg.text = "34"
+    device.display.assert_called_once()
+
+
+def test_batch_overflow():
+    neoseg = neosegment(width=6, device=dummy(width=6, height=7))
+    with pytest.raises(OverflowError):
+        with neoseg.batch():
+            neoseg.text = "TooBig!"
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import time
+from functools import partial
+from multiprocessing import shared_memory
+
+import pytest
+from PIL import Image
+
+from luma.led_matrix.device import ws2812, max7219
+from luma.led_matrix.pipeline import pipeline
+from luma.led_matrix.recording import ws281x, serial
+from luma.led_matrix.scheduler import scheduler
+
+
+def gradient(frame, size=(8, 4), mode="RGB"):
+    image = Image.new(mode, size)
+    image.putdata([((x + frame) * 16 % 256, y * 32, frame % 256)
+                   for y in range(size[1]) for x in range(size[0])])
+    return image
+
+
+def dots(frame, size=(16, 8)):
+    image = Image.new("1", size)
+    image.putpixel((frame % size[0], frame % size[1]), 1)
+    return image
+
+
+def slow(frame):
+    time.sleep(0.05)
+    return gradient(frame)
+
+
+def failing(frame):
+    if frame == 3:
+        raise ZeroDivisionError(frame)
+    return gradient(frame)
+
+
+@pytest.mark.parametrize("workers, lookahead", [(1, 1), (2, None), (3, 2)])
+def test_frames_in_order(workers, lookahead):
+    with pipeline(gradient, "RGB", (8, 4), workers=workers, lookahead=lookahead) as p:
+        frames = list(p.frames(10))
+
+    assert len(frames) == 10
+    for n, image in enumerate(frames):
+        assert image.tobytes() == gradient(n).tobytes()
+
+
+def test_frames_start():
+    with pipeline(gradient, "RGB", (8, 4), workers=2) as p:
+        assert [image.tobytes() for image in p.frames(3, start=5)] == \
+            [gradient(n).tobytes() for n in range(5, 8)]
+
+        # Frames can be iterated through again, or abandoned part way
+        infinite = p.frames()
+        assert next(infinite).tobytes() == gradient(0).tobytes()
+        assert next(infinite).tobytes() == gradient(1).tobytes()
+        infinite.close()
+
+        assert next(p.frames(1, start=9)).tobytes() == gradient(9).tobytes()
+
+
+def test_run():
+    ws = ws281x()
+    device = ws2812(ws, width=8, height=4)
+    reference = ws2812(ws281x(), width=8, height=4)
+
+    with pipeline(gradient, device.mode, device.size, workers=2) as p:
+        assert p.run(device, count=5) == 5
+
+    for n in range(5):
+        reference.display(gradient(n))
+    assert ws.transactions[-1].payload == reference._ws.transactions[-1].payload
+
+
+def test_run_partial():
+    recorder = serial()
+    device = max7219(recorder, width=16, height=8)
+    size = device.size
+    with pipeline(partial(dots, size=size), device.mode, size, workers=2) as p:
+        assert p.run(device, count=3, start=4) == 3
+
+    reference = serial()
+    max7219(reference, width=16, height=8).display(dots(6, size))
+    assert [t.payload for t in recorder.transactions[-8:]] == \
+        [t.payload for t in reference.transactions[-8:]]
+
+
+def test_render_error():
+    with pipeline(failing, "RGB", (8, 4), workers=2) as p:
+        frames = p.frames(6)
+        for n in range(3):
+            assert next(frames).tobytes() == gradient(n).tobytes()
+        with pytest.raises(ZeroDivisionError):
+            next(frames)
+
+
+def test_wrong_image():
+    with pipeline(partial(gradient, size=(4, 4)), "RGB", (8, 4), workers=1) as p:
+        with pytest.raises(ValueError) as ex:
+            list(p.frames(1))
+    assert str(ex.value) == "Frame 0 is a 4 x 4 RGB image, expected 8 x 4 RGB"
+
+
+def test_close():
+    p = pipeline(gradient, "RGB", (8, 4), workers=1, lookahead=3)
+    assert p.frame_size == 8 * 4 * 3
+    name = p._memory.name
+    list(p.frames(2))
+    p.close()
+    p.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_scheduled_frames_outlive_pipeline():
+    device = ws2812(ws281x(), width=8, height=4)
+
+    # As documented in run(): the generator is still alive (with frames being
+    # rendered) when the pipeline is closed, and only finalized afterwards
+    with pipeline(slow, device.mode, device.size, workers=2) as p:
+        frames = p.frames()
+        scheduler(device, fps=100).run(lambda _: next(frames), frames=3)
+
+    start = time.perf_counter()
+    frames.close()
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+from PIL import Image
+
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, UNICORN_HAT
+from luma.led_matrix.recording import serial, ws281x, max7219_decoder, \
+    apa102_decoder, unicornhathd_decoder, ws281x_decoder
+
+from helpers import assert_same_image, random_image
+
+
+def test_serial_recording():
+    recorder = serial(bus_speed_hz=1000000, overhead=1e-6)
+    recorder.command(1, 2)
+    recorder.data(bytearray([3, 4, 5]))
+    recorder.data([6])
+
+    assert [(t.kind, t.payload) for t in recorder.transactions] == [
+        ("command", b"\x01\x02"), ("data", b"\x03\x04\x05"), ("data", b"\x06")]
+    assert recorder.bytes_sent == 6
+    assert recorder.transactions[1].duration == pytest.approx(1e-6 + 24e-6)
+    assert recorder.transfer_time == pytest.approx(3e-6 + 48e-6)
+    assert recorder.transactions[0].timestamp <= recorder.transactions[2].timestamp
+
+    recorder.clear()
+    assert recorder.transactions == []
+    assert recorder.bytes_sent == 0
+
+
+def test_serial_not_recording():
+    recorder = serial(record=False)
+    recorder.data(bytes(100))
+    assert recorder.transactions == []
+    assert recorder.bytes_sent == 100
+    assert recorder.transfer_time == pytest.approx(100e-6)
+
+
+@pytest.mark.parametrize("cascaded,rotate,block_orientation,reverse", [
+    (4, 0, 0, False),
+    (4, 0, 90, False),
+    (4, 1, -90, True),
+    (4, 2, 180, False),
+    (6, 3, 90, True),
+])
+@pytest.mark.parametrize("delta_update", [False, True])
+def test_max7219_pixel_exact(cascaded, rotate, block_orientation, reverse, delta_update):
+    recorder = serial()
+    device = max7219(recorder, cascaded=cascaded, rotate=rotate, block_orientation=block_orientation,
+                     blocks_arranged_in_reverse_order=reverse, delta_update=delta_update)
+    decoder = max7219_decoder(cascaded=cascaded)
+
+    for seed in range(4):
+        recorder.clear()
+        image = random_image("1", device.size, seed)
+        device.display(image)
+        decoder.replay(recorder.transactions)
+        assert_same_image(device.preprocess(image), decoder.image())
+
+
+def test_max7219_width_height():
+    recorder = serial()
+    device = max7219(recorder, width=16, height=16, delta_update=True)
+    decoder = max7219_decoder(width=16, height=16)
+    for seed in range(3):
+        image = random_image("1", device.size, seed)
+        device.display(image)
+    assert_same_image(image, decoder.replay(recorder.transactions).image())
+
+
+def test_max7219_control_registers():
+    recorder = serial()
+    device = max7219(recorder, cascaded=2)
+    device.contrast(0x7F)
+    device.hide()
+
+    decoder = max7219_decoder(cascaded=2).replay(recorder.transactions)
+    assert decoder.intensity(0) == decoder.intensity(1) == 0x07
+    assert decoder.shutdown(0) and decoder.shutdown(1)
+
+    device.show()
+    assert not decoder.replay(recorder.transactions[-1:]).shutdown(1)
+
+
+def test_max7219_noop():
+    decoder = max7219_decoder(cascaded=3)
+    decoder.feed(bytes([1, 0xAA, 1, 0xBB, 1, 0xCC]))
+    decoder.feed(bytes([0, 0x11, 1, 0x22, 0, 0x33]))
+    assert [decoder.digits(i)[0] for i in range(3)] == [0xAA, 0x22, 0xCC]
+
+
+def test_max7219_invalid_transfer():
+    with pytest.raises(ValueError) as ex:
+        max7219_decoder(cascaded=2).feed(bytes(3))
+    assert "Expected 4 bytes, got 3" in str(ex.value)
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_apa102_pixel_exact(rotate):
+    recorder = serial()
+    mapping = list(reversed(range(32)))
+    device = apa102(recorder, width=8, height=4, rotate=rotate, mapping=mapping)
+    image = random_image("RGBA", device.size)
+    image.putalpha(255)
+    device.display(image)
+
+    decoder = apa102_decoder(width=8, height=4).replay(recorder.transactions)
+
+    expected = [None] * 32
+    for idx, pixel in enumerate(image.convert("RGB").getdata()):
+        expected[mapping[idx]] = pixel
+    assert list(decoder.image().getdata()) == expected
+    assert decoder.brightness() == [0x70 >> 4] * 32
+
+
+def test_apa102_brightness():
+    recorder = serial()
+    device = apa102(recorder, cascaded=3)
+    image = Image.new("RGBA", device.size)
+    image.putdata([(255, 0, 0, 255), (0, 255, 0, 0x80), (0, 0, 255, 0x00)])
+    device.display(image)
+
+    decoder = apa102_decoder(cascaded=3).replay(recorder.transactions)
+    assert decoder.brightness() == [0x07, 0x08, 0x00]
+    assert list(decoder.image().getdata()) == [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+@pytest.mark.parametrize("data,message", [
+    (bytes(8), "Transfer too short"),
+    (bytes([1, 0, 0, 0]) + bytes([0xE0, 0, 0, 0]) + bytes(1), "Missing start frame"),
+    (bytes(4) + bytes([0x1F, 0, 0, 0]) + bytes(1), "Invalid LED frame header 0x1F at offset 4"),
+])
+def test_apa102_invalid_transfer(data, message):
+    with pytest.raises(ValueError) as ex:
+        apa102_decoder(cascaded=1).feed(data)
+    assert message in str(ex.value)
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_unicornhathd_pixel_exact(rotate):
+    recorder = serial()
+    device = unicornhathd(recorder, rotate=rotate)
+    device.contrast(0xFF)
+    image = random_image("RGBA", device.size)
+    image.putalpha(255)
+    device.display(image)
+
+    decoder = unicornhathd_decoder().replay(recorder.transactions)
+    assert_same_image(image, decoder.image())
+
+
+def test_unicornhathd_invalid_transfer():
+    with pytest.raises(ValueError) as ex:
+        unicornhathd_decoder().feed(bytes(769))
+    assert "Invalid Unicorn HAT HD frame" in str(ex.value)
+
+
+@pytest.mark.parametrize("led_buffer", [True, False])
+@pytest.mark.parametrize("delta_update", [False, True])
+def test_ws281x_pixel_exact(led_buffer, delta_update):
+    ws = ws281x(led_buffer=led_buffer)
+    device = ws2812(ws, width=8, height=8, mapping=UNICORN_HAT, delta_update=delta_update)
+    decoder = ws281x_decoder(width=8, height=8)
+
+    for seed in range(3):
+        image = random_image("RGB", device.size, seed)
+        device.display(image)
+        expected = [None] * 64
+        for idx, pixel in enumerate(image.getdata()):
+            expected[UNICORN_HAT[idx]] = pixel
+        assert list(decoder.replay(ws.transactions).image().getdata()) == expected
+
+
+def test_ws281x_recording():
+    ws = ws281x(frequency_hz=800000, reset_time=50e-6)
+    device = ws2812(ws, cascaded=10)
+    ws.clear()
+    device.contrast(0x20)
+
+    assert ws.channels[0].brightness == 0x20
+    assert len(ws.transactions) == 1
+    assert ws.transactions[0].kind == "render"
+    assert ws.bytes_sent == 30
+    assert ws.transfer_time == pytest.approx(240 / 800000 + 50e-6)
+
+
+def test_ws281x_invalid_render():
+    with pytest.raises(ValueError) as ex:
+        ws281x_decoder(width=2, height=2).feed(bytes(12))
+    assert "Expected 4 LEDs, got 3" in str(ex.value)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+
+import pytest
+
+from luma.led_matrix.ringbuffer import ringbuffer, frame_size
+
+
+@pytest.fixture
+def ring():
+    ring = ringbuffer.create("RGB", (4, 2), slots=3)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def frame(n, length=24):
+    return bytes((n + i) % 256 for i in range(length))
+
+
+@pytest.mark.parametrize("mode, size, expected", [
+    ("1", (16, 8), 16),
+    ("1", (10, 2), 4),
+    ("L", (3, 3), 9),
+    ("RGB", (8, 4), 96),
+    ("RGBA", (16, 16), 1024),
+])
+def test_frame_size(mode, size, expected):
+    assert frame_size(mode, size) == expected
+
+
+def test_frame_size_unsupported():
+    with pytest.raises(ValueError) as ex:
+        frame_size("CMYK", (8, 8))
+    assert str(ex.value) == "Unsupported mode: CMYK"
+
+
+def test_attach(ring):
+    with ringbuffer(ring.name) as producer:
+        assert producer.mode == "RGB"
+        assert producer.size == (4, 2)
+        assert (producer.width, producer.height) == (4, 2)
+        assert producer.slots == 3
+        assert producer.frame_size == 24
+        assert producer.sequence == 0
+
+
+def test_attach_not_a_ring():
+    memory = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError) as ex:
+            ringbuffer(memory.name)
+        assert "Not a frame ring buffer" in str(ex.value)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_publish(ring):
+    with ringbuffer(ring.name) as producer:
+        assert producer.publish(frame(1)) == 1
+        assert producer.publish(bytearray(frame(2))) == 2
+        assert producer.publish(memoryview(frame(3))) == 3
+
+    assert ring.sequence == 3
+    for n in range(1, 4):
+        assert ring.holds(n)
+        with ring.frame(n) as data:
+            assert data == frame(n)
+
+
+def test_publish_any_buffer(ring):
+    words = array("I", frame(7))
+    ring.publish(words)
+    with ring.frame(1) as data:
+        assert data == frame(7)
+
+
+def test_publish_wrong_size(ring):
+    with pytest.raises(ValueError) as ex:
+        ring.publish(bytes(23))
+    assert str(ex.value) == "Expected 24 bytes, got 23"
+    assert ring.sequence == 0
+
+
+def test_slots_are_reused(ring):
+    for n in range(1, 6):
+        ring.publish(frame(n))
+
+    assert [ring.holds(n) for n in range(6)] == [False, False, False, True, True, True]
+    assert ring.frame(2) is None
+    with ring.frame(5) as data:
+        assert data == frame(5)
+
+
+def produce(name, count):
+    with ringbuffer(name) as producer:
+        for n in range(1, count + 1):
+            producer.publish(frame(n))
+
+
+def test_other_process(ring):
+    process = multiprocessing.Process(target=produce, args=(ring.name, 10))
+    process.start()
+    process.join(10)
+    assert process.exitcode == 0
+
+    # The ring buffer outlives the producer
+    assert ring.sequence == 10
+    with ring.frame(10) as data:
+        assert data == frame(10)
+    with ringbuffer(ring.name) as again:
+        assert again.sequence == 10
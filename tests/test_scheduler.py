@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+from PIL import Image
+
+import luma.led_matrix.scheduler
+from luma.core.render import canvas
+from luma.led_matrix.device import max7219, ws2812, apa102, unicornhathd, neosegment
+from luma.led_matrix.recording import serial, ws281x, max7219_decoder
+from luma.led_matrix.scheduler import deadlines, scheduler
+
+from helpers import fake_clock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return fake_clock().install(monkeypatch, luma.led_matrix.scheduler)
+
+
+def test_deadlines(clock):
+    pace = deadlines(clock.perf_counter)
+    assert pace.delay(0.1) == 0
+    pace.advance(0.1)
+    assert pace.delay(0.2) == pytest.approx(0.1)
+
+    clock.now = 100.3
+    pace.advance(0.2)
+    assert pace.frame == 2
+
+    # Frame 2's whole duration (100.3 to 100.5) has passed, so it is dropped
+    clock.now = 100.55
+    assert pace.delay(0.2) is None
+    assert pace.frame == 3
+    assert pace.delay(0.1) == pytest.approx(-0.05)
+
+
+def test_deadlines_drop_late_off(clock):
+    pace = deadlines(clock.perf_counter, drop_late=False)
+    pace.delay(0.1)
+    pace.advance(0.1)
+    clock.now += 1.0
+    assert pace.delay(0.1) == pytest.approx(-0.9)
+    assert pace.frame == 1
+
+
+def test_keeps_to_schedule(clock):
+    device = max7219(serial(), cascaded=1)
+    shown = []
+
+    def render(frame):
+        shown.append((frame, round(clock.now, 6)))
+        clock.now += 0.01
+        return Image.new("1", device.size)
+
+    s = scheduler(device, fps=10)
+    s.run(render, frames=4)
+
+    # Deadlines are fixed, so the time taken per frame does not add up
+    assert shown == [(0, 100.0), (1, 100.1), (2, 100.2), (3, 100.3)]
+    assert clock.sleeps == [0.09] * 3
+    stats = s.stats()
+    assert stats["frames_shown"] == 4
+    assert stats["frames_dropped"] == 0
+    assert stats["overruns"] == 0
+    assert stats["work"]["count"] == 4
+    assert stats["work"]["mean"] == pytest.approx(0.01)
+    assert stats["jitter"]["max"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_drops_frames_on_overrun(clock):
+    device = max7219(serial(), cascaded=1)
+    shown = []
+
+    def render(frame):
+        shown.append(frame)
+        clock.now += 0.25 if frame == 1 else 0.01
+
+    s = scheduler(device, fps=10)
+    s.run(render, frames=8)
+
+    # Frame 1 ran until 100.35, a whole interval past frame 2's deadline
+    # (100.2) but not frame 3's (100.3)
+    assert shown == [0, 1, 3, 4, 5, 6, 7]
+    stats = s.stats()
+    assert stats["frames_shown"] == 7
+    assert stats["frames_dropped"] == 1
+    assert stats["overruns"] == 1
+    assert stats["work"]["max"] == pytest.approx(0.25)
+    assert stats["jitter"]["max"] == pytest.approx(0.05)
+
+
+def test_drop_late_off(clock):
+    device = max7219(serial(), cascaded=1)
+    shown = []
+
+    def render(frame):
+        shown.append(frame)
+        clock.now += 0.25 if frame == 1 else 0.01
+
+    s = scheduler(device, fps=10, drop_late=False)
+    s.run(render, frames=5)
+    assert shown == [0, 1, 2, 3, 4]
+    assert s.frames_dropped == 0
+    assert s.stats()["jitter"]["max"] == pytest.approx(0.15)
+
+
+def test_dropped_frames_count_towards_limit(clock):
+    device = max7219(serial(), cascaded=1)
+
+    def render(frame):
+        clock.now += 1.0
+
+    s = scheduler(device, fps=10)
+    s.run(render, frames=5)
+    assert s.frames_shown == 1
+    assert s.frames_dropped == 4
+
+
+def test_stop(clock):
+    device = max7219(serial(), cascaded=1)
+    s = scheduler(device, fps=50)
+
+    def render(frame):
+        if frame == 9:
+            s.stop()
+
+    s.run(render)
+    assert s.frames_shown == 10
+
+
+def test_reset(clock):
+    device = max7219(serial(), cascaded=1)
+    s = scheduler(device, fps=50)
+    s.run(lambda frame: None, frames=3)
+    s.reset()
+    assert s.stats()["frames_shown"] == 0
+    assert s.stats()["work"] == {"count": 0}
+
+
+@pytest.mark.parametrize("factory,interface", [
+    (lambda s: max7219(s, cascaded=4), serial),
+    (lambda ws: ws2812(ws, width=8, height=4), ws281x),
+    (lambda s: apa102(s, width=8, height=1), serial),
+    (lambda s: unicornhathd(s), serial),
+])
+def test_all_devices(factory, interface, clock):
+    device = factory(interface())
+
+    def render(frame):
+        with canvas(device) as draw:
+            draw.point((frame, 0), fill="white")
+
+    s = scheduler(device, fps=25)
+    s.run(render, frames=3)
+    assert s.frames_shown == 3
+
+
+def test_returned_image_is_displayed(clock):
+    recorder = serial()
+    device = max7219(recorder, cascaded=1)
+    image = Image.new("1", device.size)
+    image.putpixel((3, 4), 1)
+
+    scheduler(device, fps=25).run(lambda frame: image, frames=1)
+    assert max7219_decoder(cascaded=1).replay(recorder.transactions).image() == image
+
+
+def test_neosegment(clock):
+    neoseg = neosegment(width=6, device=ws2812(ws281x(), width=6, height=7))
+    texts = []
+
+    def render(frame):
+        neoseg.text = str(frame).rjust(6)
+        texts.append(str(neoseg.text))
+
+    scheduler(neoseg, fps=25).run(render, frames=3)
+    assert texts == ["     0", "     1", "     2"]
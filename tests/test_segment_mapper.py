@@ -3,9 +3,13 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import random
+
+import pytest
 
 from luma.core.util import mutable_string
-from luma.led_matrix.segment_mapper import dot_muncher, regular
+from luma.led_matrix.segment_mapper import dot_muncher, regular, \
+    regular_bytes, dot_muncher_bytes, cache_info, cache_clear, remap_table, _DIGITS
 
 
 def test_dot_muncher_without_dots():
@@ -110,3 +114,89 @@ def test_degrees_utf8():
     buf = mutable_string(u"29.12\xb0C")
     results = dot_muncher(buf)
     assert list(results) == [0x6d, 0x7b | 0x80, 0x30, 0x6d, 0x63, 0x4e]
+
+
+def reference_regular(text, notfound="_"):
+    undefined = _DIGITS[notfound] if notfound is not None else None
+    for char in iter(text):
+        digit = _DIGITS.get(char, undefined)
+        if digit is not None:
+            yield digit
+
+
+def reference_dot_muncher(text, notfound="_"):
+    if not text:
+        return
+
+    undefined = _DIGITS[notfound] if notfound is not None else None
+    last = None
+    for char in iter(text):
+        curr = _DIGITS.get(char, undefined)
+
+        if curr == 0x80:
+            yield curr | (last or 0)
+        elif last != 0x80 and last is not None:
+            yield last
+
+        last = curr
+
+    if curr != 0x80 and curr is not None:
+        yield curr
+
+
+@pytest.mark.parametrize("notfound", ["_", " ", None])
+def test_bytes_match_generators(notfound):
+    rnd = random.Random(1234)
+    alphabet = "0123456789.,.-. aZ!?&\x7f°€\U0001f600"
+    for _ in range(500):
+        text = "".join(rnd.choice(alphabet) for _ in range(rnd.randrange(12)))
+        assert regular_bytes(text, notfound) == bytes(reference_regular(text, notfound))
+        assert dot_muncher_bytes(text, notfound) == bytes(reference_dot_muncher(text, notfound))
+        assert list(dot_muncher(mutable_string(text), notfound)) == list(reference_dot_muncher(text, notfound))
+
+
+def test_bytes_unknown_notfound():
+    with pytest.raises(KeyError):
+        regular_bytes("12", notfound="&")
+
+
+def test_cache_info():
+    cache_clear()
+    for text in ["12:00", "12:01", "12:00", "12:00"]:
+        dot_muncher_bytes(text)
+
+    info = cache_info()
+    assert info.hits == 2
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def neosegment_order(char):
+    a, b, c, d, e, f, g = [char >> bit & 0x01 for bit in range(6, -1, -1)]
+    return b << 6 | a << 5 | f << 4 | g << 3 | c << 2 | d << 1 | e << 0
+
+
+def test_remap_table_identity():
+    assert remap_table("pabcdefg") == bytes(range(256))
+
+
+def test_remap_table_neosegment():
+    table = remap_table("-bafgcde")
+    assert list(table) == [neosegment_order(byte) for byte in range(256)]
+    assert regular_bytes("HELLO 12").translate(table) == \
+        bytes(neosegment_order(byte) for byte in regular_bytes("HELLO 12"))
+
+
+def test_remap_table_reversed():
+    table = remap_table("gfedcbap")
+    assert table[0x80] == 0x01
+    assert table[0x40] == 0x02
+    assert table[0x01] == 0x80
+    assert table[0xFF] == 0xFF
+
+
+@pytest.mark.parametrize("order", ["abcdefg", "pabcdefgh", "paacdefg", "pabcdefx", "--------a"])
+def test_remap_table_invalid(order):
+    with pytest.raises(ValueError) as ex:
+        remap_table(order)
+    assert f"Invalid segment order: {order!r}" in str(ex.value)
@@ -3,10 +3,15 @@
 # Copyright (c) 2014-19 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import random
+
+import pytest
+from PIL import Image
+
 from luma.led_matrix.device import unicornhathd
 from luma.core.render import canvas
 
-from helpers import serial
+from helpers import serial, setup_function  # noqa: F401
 from baseline_data import get_json_data
 
 
@@ -14,14 +19,14 @@ def test_init():
     device = unicornhathd(serial)
     assert device.width == 16
     assert device.height == 16
-    serial.data.assert_called_once_with([0x72] + [0] * 256 * 3)
+    serial.data.assert_called_once_with(bytes([0x72] + [0] * 256 * 3))
 
 
 def test_hide():
     device = unicornhathd(serial)
     serial.reset_mock()
     device.hide()
-    serial.data.assert_called_once_with([0x72] + [0] * 256 * 3)
+    serial.data.assert_called_once_with(bytes([0x72] + [0] * 256 * 3))
 
 
 def test_show():
@@ -32,7 +37,7 @@ def test_show():
     device.hide()
     serial.reset_mock()
     device.show()
-    serial.data.assert_called_once_with([0x72] + [0xFF] * 256 * 3)
+    serial.data.assert_called_once_with(bytes([0x72] + [0xFF] * 256 * 3))
 
 
 def test_contrast():
@@ -41,7 +46,7 @@ def test_contrast():
         draw.rectangle(device.bounding_box, outline="white", fill="white")
     serial.reset_mock()
     device.contrast(0x6B)
-    serial.data.assert_called_once_with([0x72] + [0x6B] * 256 * 3)
+    serial.data.assert_called_once_with(bytes([0x72] + [0x6B] * 256 * 3))
 
 
 def test_display():
@@ -49,7 +54,7 @@ def test_display():
     serial.reset_mock()
     with canvas(device) as draw:
         draw.rectangle(device.bounding_box, outline="white")
-    serial.data.assert_called_once_with([0x72] + get_json_data('demo_unicornhathd'))
+    serial.data.assert_called_once_with(bytes([0x72] + get_json_data('demo_unicornhathd')))
 
 
 def test_alpha_blending():
@@ -57,4 +62,46 @@ def test_alpha_blending():
     serial.reset_mock()
     with canvas(device) as draw:
         draw.rectangle(device.bounding_box, outline=(255, 128, 64, 32))
-    serial.data.assert_called_once_with([0x72] + get_json_data('demo_unicornhathd_alphablend'))
+    serial.data.assert_called_once_with(bytes([0x72] + get_json_data('demo_unicornhathd_alphablend')))
+
+
+def reference_frame(device, image):
+    """
+    Frame as assembled by the original floating-point loop.
+    """
+    buf = [0x72]
+    for r, g, b, a in image.getdata():
+        brightness = a / 255.0 if a != 255 else device._brightness / 255.0
+        buf += [int(r * brightness), int(g * brightness), int(b * brightness)]
+    return bytes(buf)
+
+
+@pytest.mark.parametrize("opaque", [False, True])
+@pytest.mark.parametrize("contrast", [0x00, 0x37, 0x70, 0xFF])
+def test_display_matches_reference(opaque, contrast):
+    device = unicornhathd(serial)
+    device.contrast(contrast)
+    rnd = random.Random(contrast)
+
+    for _ in range(4):
+        image = Image.new("RGBA", (16, 16))
+        image.putdata([(rnd.randrange(256), rnd.randrange(256), rnd.randrange(256),
+                        255 if opaque else rnd.choice((rnd.randrange(256), 255)))
+                       for _ in range(256)])
+        device.display(image)
+        assert serial.data.call_args.args[0] == reference_frame(device, image)
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_rotate(rotate):
+    # rotate has no effect on the pixels sent: the image is displayed as is
+    device = unicornhathd(serial, rotate=rotate)
+    unrotated = unicornhathd(serial)
+
+    image = Image.new("RGBA", device.size)
+    image.putdata([(i, 0x80, 0xFF - i, 0xFF if i % 5 else 0x40) for i in range(256)])
+    unrotated.display(image)
+    expected = serial.data.call_args.args[0][:]
+    device.display(image)
+
+    assert serial.data.call_args.args[0] == expected
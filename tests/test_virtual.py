@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import pytest
+
+import luma.core.virtual
+from luma.core.device import dummy
+from luma.led_matrix.device import max7219
+from luma.led_matrix.segment_mapper import dot_muncher
+from luma.led_matrix.virtual import sevensegment
+
+from helpers import serial, setup_function, assert_identical_image  # noqa: F401
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(cascaded=1),
+    dict(cascaded=3),
+    dict(cascaded=2, block_orientation=180),
+    dict(cascaded=2, blocks_arranged_in_reverse_order=True),
+    dict(cascaded=2, block_orientation=90),
+    dict(width=8, height=16, rotate=1),
+])
+@pytest.mark.parametrize("text", ["", "1", "12.34", "-8.8.8.", "HELLO", "8888888888888888"])
+def test_matches_canvas(kwargs, text):
+    device = max7219(serial, **kwargs)
+    if len(text.replace(".", "")) > device.width:
+        return
+
+    serial.reset_mock()
+    luma.core.virtual.sevensegment(device).text = text
+    expected = [bytes(c.args[0]) for c in serial.data.mock_calls]
+
+    serial.reset_mock()
+    sevensegment(device).text = text
+    assert [bytes(c.args[0]) for c in serial.data.mock_calls] == expected
+
+
+def test_direct_register_writes(monkeypatch):
+    device = max7219(serial, cascaded=1)
+    monkeypatch.setattr(device, "display", None)
+    serial.reset_mock()
+
+    seg = sevensegment(device)
+    seg.text = "1.2"
+
+    assert bytes(serial.data.mock_calls[-8].args[0]) == bytes([1, 0x00])
+    assert bytes(serial.data.mock_calls[-2].args[0]) == bytes([7, 0x6D])
+    assert bytes(serial.data.mock_calls[-1].args[0]) == bytes([8, 0xB0])
+
+
+def test_overflow():
+    device = max7219(serial, cascaded=1)
+    seg = sevensegment(device)
+    with pytest.raises(OverflowError) as ex:
+        seg.text = "123456789"
+    assert "Device's capabilities insufficient for value '123456789'" in str(ex.value)
+
+
+def test_other_devices():
+    device = dummy(width=16, height=8, mode="1")
+    ref = dummy(width=16, height=8, mode="1")
+
+    luma.core.virtual.sevensegment(ref, segment_mapper=dot_muncher).text = "3.14"
+    sevensegment(device, segment_mapper=dot_muncher).text = "3.14"
+    assert_identical_image(ref.image, device.image)
@@ -3,12 +3,15 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import ctypes
+
 import pytest
+from PIL import Image
 
-from luma.led_matrix.device import neopixel
+from luma.led_matrix.device import neopixel, UNICORN_HAT
 from luma.core.render import canvas
 
-from unittest.mock import Mock, call
+from unittest.mock import MagicMock, Mock, call
 
 
 ws = Mock(unsafe=True)
@@ -23,6 +26,8 @@ def setup_function(function):
     ws.ws2811_render = Mock(return_value=0)
     ws.ws2811_channel_get = Mock(return_value=chan)
     ws.ws2811_new_ws2811_t = Mock(return_value=leds)
+    ws.ws2811_channel_t_leds_get = Mock()
+    ws.ws2811_led_set = Mock()
 
 
 def test_init_cascaded():
@@ -164,3 +169,158 @@ def test_mapping():
     ws.ws2811_led_set.assert_has_calls(expected)
 
     assert ws.ws2811_render.called
+
+
+def test_display_led_buffer():
+    leds_buffer = (ctypes.c_uint32 * 16)()
+    ws.ws2811_channel_t_leds_get = Mock(return_value=ctypes.addressof(leds_buffer))
+    device = neopixel(ws, width=4, height=4, mapping=reversed(range(16)))
+    try:
+        ws.reset_mock()
+
+        with canvas(device) as draw:
+            draw.line((0, 0, 3, 0), fill=(0x12, 0x34, 0x56))
+            draw.point((1, 3), fill="blue")
+
+        ws.ws2811_led_set.assert_not_called()
+        assert ws.ws2811_render.called
+        assert list(leds_buffer) == [0, 0, 0x0000FF, 0] + [0] * 8 + [0x123456] * 4
+    finally:
+        device.cleanup()
+
+
+def test_display_magicmock_interface():
+    dma = MagicMock()
+    dma.ws2811_init.return_value = 0
+    dma.ws2811_render.return_value = 0
+    device = neopixel(dma, width=4, height=4)
+    assert device._led_buffer is None
+    dma.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((1, 0), fill="red")
+
+    assert dma.ws2811_led_set.call_count == 16
+    dma.ws2811_led_set.assert_any_call(device._channel, 1, 0xFF0000)
+    assert dma.ws2811_render.called
+
+
+def test_cleanup_led_buffer():
+    leds_buffer = (ctypes.c_uint32 * 4)()
+    ws.ws2811_channel_t_leds_get = Mock(return_value=ctypes.addressof(leds_buffer))
+    device = neopixel(ws, cascaded=4)
+    device.cleanup()
+    assert device._led_buffer is None
+
+
+@pytest.mark.parametrize("mapping", [
+    None,
+    UNICORN_HAT,
+    [i ^ 1 for i in range(64)],
+    [i // 2 for i in range(64)],
+])
+def test_led_buffer_matches_led_set(mapping):
+    def led_set(channel, pos, color):
+        expected[pos] = color
+
+    expected = [0] * 64
+    ws.ws2811_led_set = Mock(side_effect=led_set)
+    per_pixel = neopixel(ws, width=8, height=8, mapping=mapping)
+
+    leds_buffer = (ctypes.c_uint32 * 64)()
+    ws.ws2811_channel_t_leds_get = Mock(return_value=ctypes.addressof(leds_buffer))
+    bulk = neopixel(ws, width=8, height=8, mapping=mapping)
+    try:
+        image = Image.new("RGB", (8, 8))
+        image.putdata([(i * 3, 255 - i, i * 2) for i in range(64)])
+        per_pixel.display(image)
+        bulk.display(image)
+        assert list(leds_buffer) == expected
+    finally:
+        bulk.cleanup()
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_rotated_mapping(rotate):
+    def led_set(channel, pos, color):
+        actual[pos] = color
+
+    actual = [None] * 32
+    ws.ws2811_led_set = Mock(side_effect=led_set)
+    mapping = [(i * 7) % 32 for i in range(32)]
+    device = neopixel(ws, width=8, height=4, rotate=rotate, mapping=mapping)
+
+    image = Image.new("RGB", device.size)
+    image.putdata([(i, 0x80, 0xFF - i) for i in range(32)])
+    device.display(image)
+
+    # rotate only swaps the width and height: the pixels of the image are
+    # mapped as they are
+    expected = [None] * 32
+    for idx, (r, g, b) in enumerate(image.getdata()):
+        expected[mapping[idx]] = (r << 16) | (g << 8) | b
+    assert actual == expected
+
+
+def test_delta_update_skips_identical_frames():
+    device = neopixel(ws, width=4, height=4, delta_update=True)
+    ws.reset_mock()
+
+    for _ in range(3):
+        device.clear()
+
+    ws.ws2811_led_set.assert_not_called()
+    ws.ws2811_render.assert_not_called()
+    assert device.frames_skipped == 3
+    assert device.pixels_skipped == 48
+
+
+def test_delta_update_changed_pixels():
+    device = neopixel(ws, width=4, height=4, mapping=reversed(range(16)), delta_update=True)
+    ws.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((1, 0), fill="red")
+        draw.point((2, 3), fill="blue")
+
+    assert ws.ws2811_led_set.mock_calls == [
+        call(chan, 14, 0xFF0000),
+        call(chan, 1, 0x0000FF)
+    ]
+    assert ws.ws2811_render.call_count == 1
+    assert device.frames_skipped == 0
+    assert device.pixels_skipped == 14
+
+
+def test_delta_update_retries_failed_render():
+    device = neopixel(ws, width=4, height=4, delta_update=True)
+    ws.reset_mock()
+    ws.ws2811_render = Mock(return_value=-1)
+    image = Image.new("RGB", device.size, "red")
+
+    with pytest.raises(RuntimeError):
+        device.display(image)
+
+    ws.ws2811_render = Mock(return_value=0)
+    device.display(image)
+    assert ws.ws2811_render.call_count == 1
+    assert device.frames_skipped == 0
+
+
+def test_delta_update_led_buffer():
+    leds_buffer = (ctypes.c_uint32 * 16)()
+    ws.ws2811_channel_t_leds_get = Mock(return_value=ctypes.addressof(leds_buffer))
+    device = neopixel(ws, width=4, height=4, delta_update=True)
+    try:
+        ws.reset_mock()
+
+        with canvas(device) as draw:
+            draw.point((1, 0), fill="red")
+        with canvas(device) as draw:
+            draw.point((1, 0), fill="red")
+
+        assert ws.ws2811_render.call_count == 1
+        assert list(leds_buffer) == [0, 0xFF0000] + [0] * 14
+        assert device.frames_skipped == 1
+    finally:
+        device.cleanup()